@@ -92,6 +92,7 @@ from .language.base import (  # no import order
     get_location,
     # Parse
     parse,
+    parse_incremental,
     parse_value,
     # Print
     print_ast,
@@ -112,7 +113,7 @@ from .execution import (  # no import order
 )
 
 # Validate GraphQL queries.
-from .validation import validate, specified_rules  # no import order
+from .validation import validate, validate_documents, specified_rules  # no import order
 
 # Create and format GraphQL errors.
 from .error import GraphQLError, format_error
@@ -130,6 +131,11 @@ from .utils.base import (
     # Extends an existing GraphQLSchema from a parsed GraphQL Schema
     # language AST.
     extend_schema,
+    # Snapshot a GraphQLSchema, and restore it faster than it can be built.
+    dump_schema_snapshot,
+    load_schema_snapshot,
+    load_or_build_schema,
+    schema_fingerprint,
     # Print a GraphQLSchema to GraphQL Schema language.
     print_schema,
     # Create a GraphQLType from a GraphQL language AST.
@@ -226,6 +232,7 @@ __all__ = (
     "TypeInfoVisitor",
     "get_location",
     "parse",
+    "parse_incremental",
     "parse_value",
     "print_ast",
     "visit",
@@ -236,6 +243,7 @@ __all__ = (
     "middlewares",
     "specified_rules",
     "validate",
+    "validate_documents",
     "GraphQLError",
     "format_error",
     "TypeInfo",
@@ -246,6 +254,10 @@ __all__ = (
     "concat_ast",
     "do_types_overlap",
     "extend_schema",
+    "dump_schema_snapshot",
+    "load_schema_snapshot",
+    "load_or_build_schema",
+    "schema_fingerprint",
     "get_operation_ast",
     "introspection_query",
     "is_equal_type",
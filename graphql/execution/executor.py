@@ -3,12 +3,14 @@ import functools
 import logging
 import sys
 import warnings
+from array import array
 from rx import Observable
 
 from six import string_types
 from promise import Promise, promise_for_dict, is_thenable
 
 from ..error import GraphQLError, GraphQLLocatedError
+from ..language.printer import print_ast
 from ..pyutils.default_ordered_dict import DefaultOrderedDict
 from ..pyutils.ordereddict import OrderedDict
 from ..utils.undefined import Undefined
@@ -37,13 +39,16 @@ from .middleware import MiddlewareManager
 
 # Necessary for static type checking
 if False:  # flake8: noqa
-    from typing import Any, Optional, Union, Dict, List, Callable
+    from typing import Any, Optional, Union, Dict, List, Callable, Hashable, Sequence
     from rx import Observable
     from ..type.schema import GraphQLSchema
     from ..language.ast import Document, OperationDefinition, Field
 
 logger = logging.getLogger(__name__)
 
+# The fields whose data only depends on the schema.
+INTROSPECTION_FIELD_NAMES = frozenset(["__schema", "__type", "__typename"])
+
 
 def subscribe(*args, **kwargs):
     # type: (*Any, **Any) -> Union[ExecutionResult, Observable]
@@ -176,7 +181,50 @@ def execute_operation(
             )
         return subscribe_fields(exe_context, type, root_value, fields)
 
-    return execute_fields(exe_context, type, root_value, fields, [], None)
+    cache_key = get_introspection_cache_key(exe_context, operation, fields)
+    if cache_key is None:
+        return execute_fields(exe_context, type, root_value, fields, [], None)
+
+    data = exe_context.schema.get_introspection_result(cache_key)
+    if data is None:
+        data = execute_fields(exe_context, type, root_value, fields, [], None)
+        # Only complete results computed synchronously are cached.
+        if isinstance(data, dict) and not exe_context.errors:
+            exe_context.schema.cache_introspection_result(cache_key, data)
+    return data
+
+
+def get_introspection_cache_key(
+    exe_context,  # type: ExecutionContext
+    operation,  # type: OperationDefinition
+    fields,  # type: DefaultOrderedDict
+):
+    # type: (...) -> Optional[Hashable]
+    """Returns the key under which the data of a query only selecting
+    introspection fields is cached by the schema, or None for other queries
+    and when middleware might change the results."""
+    if exe_context.middleware:
+        return None
+
+    for field_asts in fields.values():
+        for field_ast in field_asts:
+            if field_ast.name.value not in INTROSPECTION_FIELD_NAMES:
+                return None
+
+    # The printed nodes do not depend on the whitespace, comments and
+    # commas of the query text.
+    key = (
+        print_ast(operation),
+        tuple(
+            sorted(print_ast(fragment) for fragment in exe_context.fragments.values())
+        ),
+        tuple(sorted(exe_context.variable_values.items())),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 
 def execute_fields_serially(
@@ -585,6 +633,15 @@ def complete_list_value(
     ).format(info.parent_type, info.field_name)
 
     item_type = return_type.of_type
+    leaf_type = (
+        item_type.of_type if isinstance(item_type, GraphQLNonNull) else item_type
+    )
+    serialize_many = getattr(leaf_type, "serialize_many", None)
+    if serialize_many is not None:
+        return complete_leaf_list_value(
+            exe_context, item_type, field_asts, info, path, result, serialize_many
+        )
+
     completed_results = []
     contains_promise = False
 
@@ -602,6 +659,44 @@ def complete_list_value(
     return Promise.all(completed_results) if contains_promise else completed_results
 
 
+def complete_leaf_list_value(
+    exe_context,  # type: ExecutionContext
+    item_type,  # type: Any
+    field_asts,  # type: List[Field]
+    info,  # type: ResolveInfo
+    path,  # type: List[Union[int, str]]
+    result,  # type: Any
+    serialize_many,  # type: Callable[[Sequence[Any]], List[Any]]
+):
+    # type: (...) -> List[Any]
+    """
+    Complete a list of Scalars or Enums by serializing all the items at once. The items the leaf type does not
+    serialize this way (nulls, promises, errors, invalid values, ...) are completed one by one.
+    """
+    # Arrays and memoryviews are kept, for scalars to serialize in bulk.
+    if not isinstance(result, (collections.Sequence, array)):
+        result = list(result)
+    try:
+        completed_results = serialize_many(result)
+    except Exception:
+        # The items are then completed one by one, so that the errors are
+        # reported for the items raising them.
+        completed_results = [None] * len(result)
+    if None not in completed_results:
+        return completed_results
+
+    contains_promise = False
+    for index, completed_item in enumerate(completed_results):
+        if completed_item is None:
+            completed_item = completed_results[index] = complete_value_catching_error(
+                exe_context, item_type, field_asts, info, path + [index], result[index]
+            )
+            if not contains_promise and is_thenable(completed_item):
+                contains_promise = True
+
+    return Promise.all(completed_results) if contains_promise else completed_results
+
+
 def complete_leaf_value(
     return_type,  # type: Union[GraphQLEnumType, GraphQLScalarType]
     path,  # type: List[Union[int, str]]
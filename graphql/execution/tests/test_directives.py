@@ -1,5 +1,7 @@
 # type: ignore
 from graphql.execution import execute
+from graphql.execution.executors.sync import SyncExecutor
+from graphql.execution.utils import ExecutionContext, should_include_node
 from graphql.language.parser import parse
 from graphql.type import GraphQLField, GraphQLObjectType, GraphQLSchema, GraphQLString
 
@@ -275,3 +277,32 @@ def test_works_directives_no_include_or_skip():
     result = execute_test_query("{ a, b @include(if: false) @skip(if: false) }")
     assert not result.errors
     assert result.data == {"a": "a"}
+
+
+def test_decides_per_execution_with_variables():
+    # type: () -> None
+    document = parse(
+        "query Q($skip: Boolean!) { a @skip(if: $skip), b @include(if: $skip) }"
+    )
+    for skip, data in [(True, {"b": "b"}), (False, {"a": "a"}), (True, {"b": "b"})]:
+        result = execute(schema, document, Data, variable_values={"skip": skip})
+        assert not result.errors
+        assert result.data == data
+
+
+def test_decides_with_literals_and_temporary_directive_lists():
+    # type: () -> None
+    document = parse("query Q($v: Boolean!) { a @skip(if: true), b @include(if: $v) }")
+    result = execute(schema, document, Data, variable_values={"v": True})
+    assert not result.errors
+    assert result.data == {"b": "b"}
+
+    # The public helper decides on any list of directives given to it, even
+    # temporary ones.
+    context = ExecutionContext(
+        schema, document, Data, None, {"v": True}, None, SyncExecutor(), None, False
+    )
+    a, b = document.definitions[0].selection_set.selections
+    for _ in range(3):
+        assert not should_include_node(context, list(a.directives))
+        assert should_include_node(context, list(b.directives))
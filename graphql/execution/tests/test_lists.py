@@ -1,4 +1,5 @@
 # type: ignore
+from array import array
 from collections import namedtuple
 
 from graphql.error import format_error
@@ -6,10 +7,12 @@ from graphql.execution import execute
 from graphql.language.parser import parse
 from graphql.type import (
     GraphQLField,
+    GraphQLFloat,
     GraphQLInt,
     GraphQLList,
     GraphQLNonNull,
     GraphQLObjectType,
+    GraphQLScalarType,
     GraphQLSchema,
 )
 
@@ -387,3 +390,68 @@ class TestNotNullListOfNotNullT_Array_Promise_T:  # [T!]! Array<Promise<T>>
             ],
         },
     )
+
+
+class Test_ListOfT_Buffer_T:  # [T] array<T>
+    type = GraphQLList(GraphQLInt)
+
+    test_contains_values = check(
+        array("i", [1, 2]), {"data": {"nest": {"test": [1, 2]}}}
+    )
+    test_contains_invalid_values = check(
+        array("q", [1, 2 ** 31]),
+        {
+            "data": {"nest": {"test": [1, None]}},
+            "errors": [
+                {
+                    "message": "Int cannot represent non 32-bit signed integer value: 2147483648"
+                }
+            ],
+        },
+    )
+    test_contains_non_ints = check(
+        (value for value in [1, "2", 3.0, True]),
+        {"data": {"nest": {"test": [1, 2, 3, 1]}}},
+    )
+
+
+class Test_ListOfT_Float_T:  # [Float] Array<T>
+    type = GraphQLList(GraphQLFloat)
+
+    test_contains_values = check([1.5, 2], {"data": {"nest": {"test": [1.5, 2.0]}}})
+    test_contains_overflowing_values = check(
+        [1.5, 10 ** 400, 2],
+        {
+            "data": {"nest": {"test": [1.5, None, 2.0]}},
+            "errors": [{"message": "int too large to convert to float"}],
+        },
+    )
+
+
+def serialize_positive(value):
+    if value < 0:
+        raise ValueError("{} is negative".format(value))
+    return value
+
+
+def serialize_many_positive(values):
+    return [serialize_positive(value) for value in values]
+
+
+class Test_ListOfT_Failing_Bulk_T:  # [T] Array<T>
+    type = GraphQLList(
+        GraphQLScalarType(
+            "Positive",
+            serialize=serialize_positive,
+            serialize_many=serialize_many_positive,
+        )
+    )
+
+    test_contains_values = check([1, 2], {"data": {"nest": {"test": [1, 2]}}})
+    test_contains_invalid_values = check(
+        [1, -2, 3],
+        {
+            "data": {"nest": {"test": [1, None, 3]}},
+            "errors": [{"message": "-2 is negative"}],
+        },
+    )
@@ -7,17 +7,13 @@ from ..language import ast
 from ..pyutils.default_ordered_dict import DefaultOrderedDict
 from ..type.definition import GraphQLInterfaceType, GraphQLUnionType
 from ..type.directives import GraphQLIncludeDirective, GraphQLSkipDirective
-from ..type.introspection import (
-    SchemaMetaFieldDef,
-    TypeMetaFieldDef,
-    TypeNameMetaFieldDef,
-)
 from ..utils.type_from_ast import type_from_ast
 from .values import get_argument_values, get_variable_values
 
 # Necessary for static type checking
 if False:  # flake8: noqa
     from ..type.definition import GraphQLObjectType, GraphQLField
+    from ..type.directives import GraphQLDirective
     from ..type.schema import GraphQLSchema
     from ..language.ast import (
         Document,
@@ -27,6 +23,9 @@ if False:  # flake8: noqa
         FragmentDefinition,
         InlineFragment,
         Field,
+        FragmentSpread,
+        NamedType,
+        Node,
     )
     from .base import ResolveInfo
     from types import TracebackType
@@ -54,6 +53,8 @@ class ExecutionContext(object):
         "middleware",
         "allow_subscriptions",
         "_subfields_cache",
+        "_include_decisions",
+        "_fragment_condition_matches",
     )
 
     def __init__(
@@ -126,6 +127,14 @@ class ExecutionContext(object):
         self.middleware = middleware
         self.allow_subscriptions = allow_subscriptions
         self._subfields_cache = {}  # type: Dict[Tuple[GraphQLObjectType, Tuple[Field, ...]], DefaultOrderedDict]
+        # Whether the selections and fragments are included, which only
+        # depends on the variables of the execution.
+        self._include_decisions = {}  # type: Dict[Node, bool]
+        # Whether the fragments apply to the runtime types they were checked
+        # against, as a fragment is usually spread in many places.
+        self._fragment_condition_matches = (
+            {}
+        )  # type: Dict[Tuple[Union[FragmentDefinition, InlineFragment], GraphQLObjectType], bool]
 
     def get_field_resolver(self, field_resolver):
         # type: (Callable) -> Callable
@@ -237,16 +246,18 @@ def collect_fields(
         directives = selection.directives
 
         if isinstance(selection, ast.Field):
-            if not should_include_node(ctx, directives):
+            if directives and not _should_include(ctx, selection):
                 continue
 
             name = get_field_entry_key(selection)
             fields[name].append(selection)
 
         elif isinstance(selection, ast.InlineFragment):
-            if not should_include_node(
-                ctx, directives
-            ) or not does_fragment_condition_match(ctx, selection, runtime_type):
+            if (
+                directives
+                and not _should_include(ctx, selection)
+                or not does_fragment_condition_match(ctx, selection, runtime_type)
+            ):
                 continue
 
             collect_fields(
@@ -256,8 +267,10 @@ def collect_fields(
         elif isinstance(selection, ast.FragmentSpread):
             frag_name = selection.name.value
 
-            if frag_name in prev_fragment_names or not should_include_node(
-                ctx, directives
+            if (
+                frag_name in prev_fragment_names
+                or directives
+                and not _should_include(ctx, selection)
             ):
                 continue
 
@@ -266,7 +279,8 @@ def collect_fields(
             frag_directives = fragment.directives
             if (
                 not fragment
-                or not should_include_node(ctx, frag_directives)
+                or frag_directives
+                and not _should_include(ctx, fragment)
                 or not does_fragment_condition_match(ctx, fragment, runtime_type)
             ):
                 continue
@@ -282,38 +296,64 @@ def should_include_node(ctx, directives):
     # type: (ExecutionContext, Optional[List[Directive]]) -> bool
     """Determines if a field should be included based on the @include and
     @skip directives, where @skip has higher precidence than @include."""
-    # TODO: Refactor based on latest code
-    if directives:
-        skip_ast = None
-
-        for directive in directives:
-            if directive.name.value == GraphQLSkipDirective.name:
-                skip_ast = directive
-                break
-
-        if skip_ast:
-            args = get_argument_values(
-                GraphQLSkipDirective.args, skip_ast.arguments, ctx.variable_values
-            )
-            if args.get("if") is True:
-                return False
-
-        include_ast = None
-
-        for directive in directives:
-            if directive.name.value == GraphQLIncludeDirective.name:
-                include_ast = directive
-                break
+    if not directives:
+        return True
+    return get_include_decision(directives, ctx.variable_values)
+
+
+def _should_include(ctx, node):
+    # type: (ExecutionContext, Union[Field, FragmentSpread, InlineFragment, FragmentDefinition]) -> bool
+    """Like should_include_node for the directives of the node, deciding once
+    per node and execution. The nodes are kept by the context, so that they
+    are not confused with other nodes."""
+    include = ctx._include_decisions.get(node)
+    if include is None:
+        include = ctx._include_decisions[node] = get_include_decision(
+            node.directives, ctx.variable_values
+        )
+    return include
+
+
+def get_include_decision(directives, variable_values):
+    # type: (List[Directive], Dict[str, Any]) -> bool
+    skip_ast = None
+    include_ast = None
+    for directive in directives:
+        name = directive.name.value
+        if name == GraphQLSkipDirective.name:
+            skip_ast = skip_ast or directive
+        elif name == GraphQLIncludeDirective.name:
+            include_ast = include_ast or directive
+
+    if skip_ast:
+        skip = _get_if_argument(GraphQLSkipDirective, skip_ast, variable_values)
+        if skip is True:
+            return False
+
+    if include_ast:
+        include = _get_if_argument(
+            GraphQLIncludeDirective, include_ast, variable_values
+        )
+        if include is False:
+            return False
 
-        if include_ast:
-            args = get_argument_values(
-                GraphQLIncludeDirective.args, include_ast.arguments, ctx.variable_values
-            )
+    return True
 
-            if args.get("if") is False:
-                return False
 
-    return True
+def _get_if_argument(directive_def, directive, variable_values):
+    # type: (GraphQLDirective, Directive, Dict[str, Any]) -> Optional[bool]
+    """Returns the `if` argument of a @skip or @include directive, read from
+    the node when it is a literal, and otherwise coerced from the
+    variables."""
+    arguments = directive.arguments
+    if (
+        arguments
+        and len(arguments) == 1
+        and arguments[0].name.value == "if"
+        and isinstance(arguments[0].value, ast.BooleanValue)
+    ):
+        return arguments[0].value.value
+    return get_argument_values(directive_def.args, arguments, variable_values).get("if")
 
 
 def does_fragment_condition_match(
@@ -322,16 +362,32 @@ def does_fragment_condition_match(
     type_,  # type: GraphQLObjectType
 ):
     # type: (...) -> bool
+    """Determines if a fragment applies to the given runtime type. The outcome
+    is memoized per fragment and runtime type for the execution."""
     type_condition_ast = fragment.type_condition
     if not type_condition_ast:
         return True
 
-    conditional_type = type_from_ast(ctx.schema, type_condition_ast)
+    key = fragment, type_
+    matches = ctx._fragment_condition_matches.get(key)
+    if matches is None:
+        matches = get_fragment_condition_match(ctx.schema, type_condition_ast, type_)
+        ctx._fragment_condition_matches[key] = matches
+    return matches
+
+
+def get_fragment_condition_match(
+    schema,  # type: GraphQLSchema
+    type_condition_ast,  # type: NamedType
+    type_,  # type: GraphQLObjectType
+):
+    # type: (...) -> bool
+    conditional_type = type_from_ast(schema, type_condition_ast)
     if conditional_type.is_same_type(type_):
         return True
 
     if isinstance(conditional_type, (GraphQLInterfaceType, GraphQLUnionType)):
-        return ctx.schema.is_possible_type(conditional_type, type_)
+        return schema.is_possible_type(conditional_type, type_)
 
     return False
 
@@ -367,11 +423,6 @@ def get_field_def(
     queried as a field, even in situations where no other fields
     are allowed, like on a Union. __schema could get automatically
     added to the query type, but that would require mutating type
-    definitions, which would cause issues."""
-    if field_name == "__schema" and schema.get_query_type() == parent_type:
-        return SchemaMetaFieldDef
-    elif field_name == "__type" and schema.get_query_type() == parent_type:
-        return TypeMetaFieldDef
-    elif field_name == "__typename":
-        return TypeNameMetaFieldDef
-    return parent_type.fields.get(field_name)
+    definitions, which would cause issues. The lookup is memoized by the
+    schema."""
+    return schema.get_field_def(parent_type, field_name)
@@ -1,6 +1,6 @@
 from .lexer import Lexer
 from .location import get_location
-from .parser import parse, parse_value
+from .parser import parse, parse_incremental, parse_value
 from .printer import print_ast
 from .source import Source
 from .visitor import BREAK, ParallelVisitor, TypeInfoVisitor, visit
@@ -9,6 +9,7 @@ __all__ = [
     "Lexer",
     "get_location",
     "parse",
+    "parse_incremental",
     "parse_value",
     "print_ast",
     "Source",
@@ -7,7 +7,7 @@ from .source import Source
 
 # Necessary for static type checking
 if False:  # flake8: noqa
-    from typing import Dict, Union, Any, Optional, Callable, List
+    from typing import Dict, Union, Any, Optional, Callable, List, Tuple
     from ..error.syntax_error import GraphQLSyntaxError
     from .source import Source
     from .lexer import Token
@@ -48,12 +48,27 @@ if False:  # flake8: noqa
         DirectiveDefinition,
     )
 
-__all__ = ["parse"]
+__all__ = ["parse", "parse_incremental"]
+
+# The default max_depth, so that deeply nested documents are rejected well
+# before the recursive descent exceeds the default recursion limit. Every
+# level of nesting takes about 4 frames of the parser.
+MAX_DEPTH = 100
+
+# The nodes entered by the parser with a level of nesting.
+NESTING_NODES = (ast.SelectionSet, ast.ListValue, ast.ObjectValue, ast.ListType)
 
 
 def parse(source, **kwargs):
     # type: (Union[Source, str], **Any) -> Document
-    """Given a GraphQL source, parses it into a Document."""
+    """Given a GraphQL source, parses it into a Document.
+
+    Besides `no_location` and `no_source`, the `max_tokens`, `max_depth` and
+    `max_nodes` options bound the number of lexed tokens, the nesting of
+    selection sets, lists, input objects and list types, and the number of
+    AST nodes. Parsing stops with a GraphQLSyntaxError as soon as one of them
+    is exceeded. Only `max_depth` is set by default, to `MAX_DEPTH`; a limit
+    given as None is lifted."""
     options = {"no_location": False, "no_source": False}
     options.update(kwargs)
 
@@ -78,16 +93,228 @@ def parse_value(source, **kwargs):
     return parse_value_literal(parser, False)
 
 
+def parse_incremental(document, source, edit_start, edit_end, text, **kwargs):
+    # type: (Document, Union[Source, str], int, int, str, **Any) -> Document
+    """Parses the source resulting from replacing `source.body[edit_start:edit_end]`
+    with `text`, given the `document` previously parsed from `source`.
+
+    Only the top level definitions touched by the edit are lexed and parsed
+    again; the others are reused by identity, untouched, so `document` stays
+    valid. Reused definitions keep the locations of the source they were
+    parsed from, which holds the same text: the location of the returned
+    document is a DocumentLoc telling how far each definition moved since.
+    Whenever the edit can leak outside of the re-parsed region (an unclosed
+    brace, string or comment, for instance) this falls back to a full
+    parse."""
+    options = {"no_location": False, "no_source": False}
+    options.update(kwargs)
+
+    if isinstance(source, string_types):
+        source = Source(source)
+    body = source.body  # type: ignore
+    new_source = Source(
+        body[:edit_start] + text + body[edit_end:], source.name  # type: ignore
+    )
+
+    definitions = document.definitions
+    if (
+        options["no_location"]
+        or not document.loc
+        or not all(definition.loc for definition in definitions)
+    ):
+        return parse(new_source, **kwargs)
+
+    document_loc = document.loc
+    if isinstance(document_loc, DocumentLoc):
+        offsets = document_loc.offsets
+        sizes = document_loc.sizes
+    else:
+        offsets = [0] * len(definitions)
+        sizes = [None] * len(definitions)
+    starts = [d.loc.start + offset for d, offset in zip(definitions, offsets)]
+    ends = [d.loc.end + offset for d, offset in zip(definitions, offsets)]
+
+    # Definitions touching the edit, even just at their boundaries, are
+    # affected as the edited text could merge into one of their tokens.
+    before = 0
+    while before < len(definitions) and ends[before] < edit_start:
+        before += 1
+    after = len(definitions)
+    while after > before and starts[after - 1] > edit_end:
+        after -= 1
+    delta = len(text) - (edit_end - edit_start)
+    region_start = ends[before - 1] if before else 0
+    region_end = (
+        starts[after] + delta if after < len(definitions) else len(new_source.body)
+    )
+
+    # The limits apply to the whole resulting document: the reused
+    # definitions are counted alongside the re-parsed ones, and a full parse
+    # reports where a limit is exceeded outside of the re-parsed region.
+    parser = Parser(new_source, options)
+    with_tokens = parser.max_tokens is not None
+    before_sizes = [
+        get_definition_size(
+            definitions[i], sizes[i], new_source, starts[i], ends[i], with_tokens
+        )
+        for i in range(before)
+    ]
+    if with_tokens:
+        parser.token_count = sum(size[0] for size in before_sizes)
+    parser.node_count = sum(size[1] for size in before_sizes)
+    depth = max([size[2] for size in before_sizes] or [0])
+    if exceeds_limits(parser, parser.token_count, parser.node_count, depth):
+        return parse(new_source, **kwargs)
+
+    parser.prev_end = region_start
+    parser.token = parser.lexer.next_token(region_start)
+    count_token(parser)
+    parsed = []
+    parsed_sizes = []  # type: List[Tuple[Optional[int], int, int]]
+    while parser.token.start < region_end:
+        token_count = parser.token_count
+        node_count = parser.node_count
+        definition = parse_definition(parser)
+        if parser.prev_end > region_end:
+            return parse(new_source, **kwargs)
+        parsed.append(definition)
+        parsed_sizes.append(
+            (
+                parser.token_count - token_count,
+                parser.node_count - node_count,
+                measure_definition(definition)[1],
+            )
+        )
+
+    if parser.token.start != region_end:
+        return parse(new_source, **kwargs)
+
+    if not (before or parsed or after < len(definitions)):
+        raise unexpected(parser)
+
+    after_sizes = [
+        get_definition_size(
+            definitions[i],
+            sizes[i],
+            new_source,
+            starts[i] + delta,
+            ends[i] + delta,
+            with_tokens,
+        )
+        for i in range(after, len(definitions))
+    ]
+    # The token at region_end was counted by the parser already, and the
+    # document node is created last.
+    token_count = parser.token_count - 1
+    if with_tokens:
+        token_count += sum(size[0] for size in after_sizes)
+    node_count = parser.node_count + sum(size[1] for size in after_sizes) + 1
+    depth = max([size[2] for size in after_sizes] or [0])
+    if exceeds_limits(parser, token_count, node_count, depth):
+        return parse(new_source, **kwargs)
+
+    new_definitions = definitions[:before] + parsed + definitions[after:]
+    new_offsets = (
+        offsets[:before]
+        + [0] * len(parsed)
+        + [offset + delta for offset in offsets[after:]]
+    )
+    return ast.Document(
+        definitions=new_definitions,
+        loc=DocumentLoc(
+            new_definitions[0].loc.start + new_offsets[0],
+            len(new_source.body),
+            None if options["no_source"] else new_source,
+            new_offsets,
+            before_sizes + parsed_sizes + after_sizes,
+        ),
+    )
+
+
+def get_definition_size(definition, size, source, start, end, with_tokens):
+    # type: (Any, Optional[Tuple[Optional[int], int, int]], Source, int, int, bool) -> Tuple[Optional[int], int, int]
+    """Returns the given size of a definition, as its number of tokens,
+    AST nodes and levels of nesting, measuring it when it is not known. The
+    tokens are only counted when needed, from the definition text at start
+    in the given source."""
+    if size is None:
+        size = (None,) + measure_definition(definition)
+    if with_tokens and size[0] is None:
+        size = (count_tokens(source, start, end),) + size[1:]
+    return size
+
+
+def measure_definition(definition):
+    # type: (Any) -> Tuple[int, int]
+    """Returns the number of AST nodes of a definition and their deepest
+    level of nesting, as counted by the max_nodes and max_depth limits."""
+    node_count = depth = 0
+    stack = [(definition, 0)]
+    while stack:
+        value, level = stack.pop()
+        if isinstance(value, list):
+            stack.extend((item, level) for item in value)
+        elif isinstance(value, ast.Node):
+            node_count += 1
+            if isinstance(value, NESTING_NODES):
+                level += 1
+                if level > depth:
+                    depth = level
+            stack.extend((getattr(value, attr), level) for attr in value.__slots__[1:])
+    return node_count, depth
+
+
+def count_tokens(source, start, end):
+    # type: (Source, int, int) -> int
+    """Returns the number of tokens lexed from start up to end."""
+    lexer = Lexer(source)
+    count = 0
+    token = lexer.next_token(start)
+    while token.start < end:
+        count += 1
+        token = lexer.next_token(token.end)
+    return count
+
+
+def exceeds_limits(parser, token_count, node_count, depth):
+    # type: (Parser, int, int, int) -> bool
+    """Tells whether the given counts exceed one of the parser limits."""
+    return (
+        (parser.max_tokens is not None and token_count > parser.max_tokens)
+        or (parser.max_nodes is not None and node_count > parser.max_nodes)
+        or (parser.max_depth is not None and depth > parser.max_depth)
+    )
+
+
 class Parser(object):
-    __slots__ = "lexer", "source", "options", "prev_end", "token"
+    __slots__ = (
+        "lexer",
+        "source",
+        "options",
+        "prev_end",
+        "token",
+        "max_tokens",
+        "max_depth",
+        "max_nodes",
+        "token_count",
+        "depth",
+        "node_count",
+    )
 
     def __init__(self, source, options):
-        # type: (Source, Dict[str, bool]) -> None
+        # type: (Source, Dict[str, Any]) -> None
         self.lexer = Lexer(source)
         self.source = source
         self.options = options
         self.prev_end = 0
+        self.max_tokens = options.get("max_tokens")  # type: Optional[int]
+        self.max_depth = options.get("max_depth", MAX_DEPTH)  # type: Optional[int]
+        self.max_nodes = options.get("max_nodes")  # type: Optional[int]
+        self.token_count = 0
+        self.depth = 0
+        self.node_count = 0
         self.token = self.lexer.next_token()
+        count_token(self)
 
 
 class Loc(object):
@@ -113,10 +340,31 @@ class Loc(object):
         )
 
 
+class DocumentLoc(Loc):
+    """The location of a document returned by parse_incremental.
+
+    Its definitions keep the locations of the source they were parsed from,
+    `offsets` tells how far each of them moved since. `sizes` holds their
+    number of tokens (None until counted), AST nodes and levels of nesting,
+    checked against the parser limits."""
+
+    __slots__ = "offsets", "sizes"
+
+    def __init__(self, start, end, source, offsets, sizes):
+        # type: (int, int, Optional[Source], List[int], List[Tuple[Optional[int], int, int]]) -> None
+        super(DocumentLoc, self).__init__(start, end, source)
+        self.offsets = offsets
+        self.sizes = sizes
+
+
 def loc(parser, start):
     # type: (Parser, int) -> Optional[Loc]
     """Returns a location object, used to identify the place in
     the source that created a given parsed object."""
+    parser.node_count += 1
+    if parser.max_nodes is not None and parser.node_count > parser.max_nodes:
+        raise limit_exceeded(parser, start, "AST nodes", parser.max_nodes)
+
     if parser.options["no_location"]:
         return None
 
@@ -132,6 +380,48 @@ def advance(parser):
     prev_end = parser.token.end
     parser.prev_end = prev_end
     parser.token = parser.lexer.next_token(prev_end)
+    count_token(parser)
+
+
+def count_token(parser):
+    # type: (Parser) -> None
+    """Counts the current token against the max_tokens limit. The end of
+    file is not a token of the document and is not counted."""
+    parser.token_count += 1
+    max_tokens = parser.max_tokens
+    if (
+        max_tokens is not None
+        and parser.token_count > max_tokens
+        and parser.token.kind != TokenKind.EOF
+    ):
+        raise limit_exceeded(parser, parser.token.start, "tokens", max_tokens)
+
+
+def enter_nesting(parser):
+    # type: (Parser) -> None
+    """Enters a nested selection set, list, input object or list type,
+    checking the max_depth limit."""
+    parser.depth += 1
+    if parser.max_depth is not None and parser.depth > parser.max_depth:
+        raise limit_exceeded(
+            parser, parser.token.start, "levels of nesting", parser.max_depth
+        )
+
+
+def leave_nesting(parser):
+    # type: (Parser) -> None
+    parser.depth -= 1
+
+
+def limit_exceeded(parser, position, description, limit):
+    # type: (Parser, int, str, int) -> GraphQLSyntaxError
+    """Helper function for creating an error when one of the parser
+    limits is exceeded."""
+    return GraphQLSyntaxError(
+        parser.source,
+        position,
+        u"Document exceeds the maximum of {} {}.".format(limit, description),
+    )
 
 
 def peek(parser, kind):
@@ -356,10 +646,10 @@ def parse_variable(parser):
 def parse_selection_set(parser):
     # type: (Parser) -> SelectionSet
     start = parser.token.start
-    return ast.SelectionSet(
-        selections=many(parser, TokenKind.BRACE_L, parse_selection, TokenKind.BRACE_R),
-        loc=loc(parser, start),
-    )
+    enter_nesting(parser)
+    selections = many(parser, TokenKind.BRACE_L, parse_selection, TokenKind.BRACE_R)
+    leave_nesting(parser)
+    return ast.SelectionSet(selections=selections, loc=loc(parser, start))
 
 
 def parse_selection(parser):
@@ -530,21 +820,23 @@ def parse_list(parser, is_const):
     start = parser.token.start
     item = parse_const_value if is_const else parse_variable_value
 
-    return ast.ListValue(
-        values=any(parser, TokenKind.BRACKET_L, item, TokenKind.BRACKET_R),
-        loc=loc(parser, start),
-    )
+    enter_nesting(parser)
+    values = any(parser, TokenKind.BRACKET_L, item, TokenKind.BRACKET_R)
+    leave_nesting(parser)
+    return ast.ListValue(values=values, loc=loc(parser, start))
 
 
 def parse_object(parser, is_const):
     # type: (Parser, bool) -> ObjectValue
     start = parser.token.start
+    enter_nesting(parser)
     expect(parser, TokenKind.BRACE_L)
     fields = []
 
     while not skip(parser, TokenKind.BRACE_R):
         fields.append(parse_object_field(parser, is_const))
 
+    leave_nesting(parser)
     return ast.ObjectValue(fields=fields, loc=loc(parser, start))
 
 
@@ -587,9 +879,12 @@ def parse_type(parser):
     """Handles the 'Type': TypeName, ListType, and NonNullType
     parsing rules."""
     start = parser.token.start
-    if skip(parser, TokenKind.BRACKET_L):
+    if peek(parser, TokenKind.BRACKET_L):
+        enter_nesting(parser)
+        advance(parser)
         ast_type = parse_type(parser)
         expect(parser, TokenKind.BRACKET_R)
+        leave_nesting(parser)
         ast_type = ast.ListType(type=ast_type, loc=loc(parser, start))  # type: ignore
 
     else:
@@ -1,6 +1,6 @@
 import json
 
-from .visitor import Visitor, visit
+from .visitor_meta import AST_KIND_TO_TYPE
 
 # Necessary for static type checking
 if False:  # flake8: noqa
@@ -47,248 +47,553 @@ if False:  # flake8: noqa
 __all__ = ["print_ast"]
 
 
-def print_ast(ast):
-    # type: (Node) -> str
-    return visit(ast, PrintingVisitor())
-
-
-class PrintingVisitor(Visitor):
-    __slots__ = ()
-
-    def leave_Name(self, node, *args):
-        # type: (Any, *Any) -> str
-        return node.value  # type: ignore
+def print_ast(ast, minified=False):
+    # type: (Node, bool) -> str
+    """Converts an AST into a string.
+
+    By default the output uses one set of reasonable formatting rules.
+    With `minified` every insignificant whitespace is dropped, which is
+    useful for cache keys and wire transfer."""
+    if minified:
+        return MINIFIED_PRINTER.print_node(ast)
+    return PRINTER.print_node(ast)
+
+
+class Printer(object):
+    """Prints an AST by recursing directly into the children of each node,
+    dispatching on the node type to the matching `print_<Kind>` method."""
+
+    __slots__ = ("_printers",)
+
+    def __init__(self):
+        # type: () -> None
+        self._printers = {
+            AST_KIND_TO_TYPE[attr[6:]]: getattr(self, attr)
+            for attr in dir(self)
+            if attr.startswith("print_") and attr[6:] in AST_KIND_TO_TYPE
+        }
+
+    def print_node(self, node):
+        # type: (Any) -> Optional[str]
+        if node is None:
+            return None
+        printer = self._printers.get(type(node))
+        assert printer, "Invalid AST Node: " + repr(node)
+        return printer(node)
+
+    def print_nodes(self, nodes):
+        # type: (Optional[List[Any]]) -> Optional[List[str]]
+        if nodes is None:
+            return None
+        print_node = self.print_node
+        return [print_node(node) for node in nodes]
+
+    def print_directives(self, node, separator=" "):
+        # type: (Any, str) -> str
+        return join(self.print_nodes(node.directives), separator)
+
+    def print_Name(self, node):
+        # type: (Name) -> str
+        return node.value
 
-    def leave_Variable(self, node, *args):
-        # type: (Any, *Any) -> str
-        return "$" + node.name  # type: ignore
+    def print_Variable(self, node):
+        # type: (Variable) -> str
+        return "$" + self.print_node(node.name)  # type: ignore
 
-    def leave_Document(self, node, *args):
-        # type: (Any, *Any) -> str
-        return join(node.definitions, "\n\n") + "\n"  # type: ignore
+    def print_Document(self, node):
+        # type: (Document) -> str
+        return join(self.print_nodes(node.definitions), "\n\n") + "\n"
 
-    def leave_OperationDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
-        name = node.name
-        selection_set = node.selection_set
+    def print_OperationDefinition(self, node):
+        # type: (OperationDefinition) -> str
+        name = self.print_node(node.name)
+        selection_set = self.print_node(node.selection_set)
         op = node.operation
-        var_defs = wrap("(", join(node.variable_definitions, ", "), ")")
-        directives = join(node.directives, " ")
+        var_defs = wrap(
+            "(", join(self.print_nodes(node.variable_definitions), ", "), ")"
+        )
+        directives = self.print_directives(node)
 
         if not name and not directives and not var_defs and op == "query":
-            return selection_set
+            return selection_set  # type: ignore
 
         return join([op, join([name, var_defs]), directives, selection_set], " ")
 
-    def leave_VariableDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
-        return node.variable + ": " + node.type + wrap(" = ", node.default_value)
+    def print_VariableDefinition(self, node):
+        # type: (VariableDefinition) -> str
+        return (
+            self.print_node(node.variable)  # type: ignore
+            + ": "
+            + self.print_node(node.type)
+            + wrap(" = ", self.print_node(node.default_value))
+        )
 
-    def leave_SelectionSet(self, node, *args):
-        # type: (Any, *Any) -> str
-        return block(node.selections)
+    def print_SelectionSet(self, node):
+        # type: (SelectionSet) -> str
+        return block(self.print_nodes(node.selections))  # type: ignore
 
-    def leave_Field(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_Field(self, node):
+        # type: (Field) -> str
         return join(
             [
-                wrap("", node.alias, ": ")
-                + node.name
-                + wrap("(", join(node.arguments, ", "), ")"),
-                join(node.directives, " "),
-                node.selection_set,
+                wrap("", self.print_node(node.alias), ": ")
+                + self.print_node(node.name)  # type: ignore
+                + wrap("(", join(self.print_nodes(node.arguments), ", "), ")"),
+                self.print_directives(node),
+                self.print_node(node.selection_set),
             ],
             " ",
         )
 
-    def leave_Argument(self, node, *args):
-        # type: (Any, *Any) -> str
-        return "{0.name}: {0.value}".format(node)
+    def print_Argument(self, node):
+        # type: (Argument) -> str
+        return "{}: {}".format(self.print_node(node.name), self.print_node(node.value))
 
     # Fragments
 
-    def leave_FragmentSpread(self, node, *args):
-        # type: (Any, *Any) -> str
-        return "..." + node.name + wrap(" ", join(node.directives, " "))
+    def print_FragmentSpread(self, node):
+        # type: (FragmentSpread) -> str
+        return (
+            "..."
+            + self.print_node(node.name)  # type: ignore
+            + wrap(" ", self.print_directives(node))
+        )
 
-    def leave_InlineFragment(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_InlineFragment(self, node):
+        # type: (InlineFragment) -> str
         return join(
             [
                 "...",
-                wrap("on ", node.type_condition),
-                join(node.directives, ""),
-                node.selection_set,
+                wrap("on ", self.print_node(node.type_condition)),
+                self.print_directives(node, ""),
+                self.print_node(node.selection_set),
             ],
             " ",
         )
 
-    def leave_FragmentDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_FragmentDefinition(self, node):
+        # type: (FragmentDefinition) -> str
         return (
-            "fragment {} on {} ".format(node.name, node.type_condition)
-            + wrap("", join(node.directives, " "), " ")
-            + node.selection_set
+            "fragment {} on {} ".format(
+                self.print_node(node.name), self.print_node(node.type_condition)
+            )
+            + wrap("", self.print_directives(node), " ")
+            + self.print_node(node.selection_set)  # type: ignore
         )
 
     # Value
 
-    def leave_IntValue(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_IntValue(self, node):
+        # type: (IntValue) -> str
         return node.value
 
-    def leave_FloatValue(self, node, *args):
-        return node.value
+    print_FloatValue = print_IntValue
+    print_EnumValue = print_IntValue
 
-    def leave_StringValue(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_StringValue(self, node):
+        # type: (StringValue) -> str
         return json.dumps(node.value)
 
-    def leave_BooleanValue(self, node, *args):
-        # type: (Any, *Any) -> str
-        return json.dumps(node.value)
+    print_BooleanValue = print_StringValue
 
-    def leave_EnumValue(self, node, *args):
-        # type: (Any, *Any) -> str
-        return node.value
+    def print_ListValue(self, node):
+        # type: (ListValue) -> str
+        return "[" + join(self.print_nodes(node.values), ", ") + "]"
 
-    def leave_ListValue(self, node, *args):
-        # type: (Any, *Any) -> str
-        return "[" + join(node.values, ", ") + "]"
+    def print_ObjectValue(self, node):
+        # type: (ObjectValue) -> str
+        return "{" + join(self.print_nodes(node.fields), ", ") + "}"
 
-    def leave_ObjectValue(self, node, *args):
-        # type: (Any, *Any) -> str
-        return "{" + join(node.fields, ", ") + "}"
-
-    def leave_ObjectField(self, node, *args):
-        # type: (Any, *Any) -> str
-        return node.name + ": " + node.value
+    def print_ObjectField(self, node):
+        # type: (ObjectField) -> str
+        return (
+            self.print_node(node.name) + ": " + self.print_node(node.value)
+        )  # type: ignore
 
     # Directive
 
-    def leave_Directive(self, node, *args):
-        # type: (Any, *Any) -> str
-        return "@" + node.name + wrap("(", join(node.arguments, ", "), ")")
+    def print_Directive(self, node):
+        # type: (Directive) -> str
+        return (
+            "@"
+            + self.print_node(node.name)  # type: ignore
+            + wrap("(", join(self.print_nodes(node.arguments), ", "), ")")
+        )
 
     # Type
 
-    def leave_NamedType(self, node, *args):
-        # type: (Any, *Any) -> str
-        return node.name
+    def print_NamedType(self, node):
+        # type: (NamedType) -> str
+        return self.print_node(node.name)  # type: ignore
 
-    def leave_ListType(self, node, *args):
-        # type: (Any, *Any) -> str
-        return "[" + node.type + "]"
+    def print_ListType(self, node):
+        # type: (ListType) -> str
+        return "[" + self.print_node(node.type) + "]"  # type: ignore
 
-    def leave_NonNullType(self, node, *args):
-        # type: (Any, *Any) -> str
-        return node.type + "!"
+    def print_NonNullType(self, node):
+        # type: (NonNullType) -> str
+        return self.print_node(node.type) + "!"  # type: ignore
 
     # Type Definitions:
 
-    def leave_SchemaDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_SchemaDefinition(self, node):
+        # type: (SchemaDefinition) -> str
         return join(
-            ["schema", join(node.directives, " "), block(node.operation_types)], " "
+            [
+                "schema",
+                self.print_directives(node),
+                block(self.print_nodes(node.operation_types)),  # type: ignore
+            ],
+            " ",
         )
 
-    def leave_OperationTypeDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
-        return "{}: {}".format(node.operation, node.type)
+    def print_OperationTypeDefinition(self, node):
+        # type: (OperationTypeDefinition) -> str
+        return "{}: {}".format(node.operation, self.print_node(node.type))
 
-    def leave_ScalarTypeDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
-        return "scalar " + node.name + wrap(" ", join(node.directives, " "))
+    def print_ScalarTypeDefinition(self, node):
+        # type: (ScalarTypeDefinition) -> str
+        return (
+            "scalar "
+            + self.print_node(node.name)  # type: ignore
+            + wrap(" ", self.print_directives(node))
+        )
 
-    def leave_ObjectTypeDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_ObjectTypeDefinition(self, node):
+        # type: (ObjectTypeDefinition) -> str
         return join(
             [
                 "type",
-                node.name,
-                wrap("implements ", join(node.interfaces, ", ")),
-                join(node.directives, " "),
-                block(node.fields),
+                self.print_node(node.name),  # type: ignore
+                wrap("implements ", join(self.print_nodes(node.interfaces), ", ")),
+                self.print_directives(node),
+                block(self.print_nodes(node.fields)),  # type: ignore
             ],
             " ",
         )
 
-    def leave_FieldDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_FieldDefinition(self, node):
+        # type: (FieldDefinition) -> str
         return (
-            node.name
-            + wrap("(", join(node.arguments, ", "), ")")
+            self.print_node(node.name)  # type: ignore
+            + wrap("(", join(self.print_nodes(node.arguments), ", "), ")")
             + ": "
-            + node.type
-            + wrap(" ", join(node.directives, " "))
+            + self.print_node(node.type)
+            + wrap(" ", self.print_directives(node))
         )
 
-    def leave_InputValueDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_InputValueDefinition(self, node):
+        # type: (InputValueDefinition) -> str
         return (
-            node.name
+            self.print_node(node.name)  # type: ignore
             + ": "
-            + node.type
-            + wrap(" = ", node.default_value)
-            + wrap(" ", join(node.directives, " "))
+            + self.print_node(node.type)
+            + wrap(" = ", self.print_node(node.default_value))
+            + wrap(" ", self.print_directives(node))
         )
 
-    def leave_InterfaceTypeDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_InterfaceTypeDefinition(self, node):
+        # type: (InterfaceTypeDefinition) -> str
         return (
             "interface "
-            + node.name
-            + wrap(" ", join(node.directives, " "))
+            + self.print_node(node.name)  # type: ignore
+            + wrap(" ", self.print_directives(node))
             + " "
-            + block(node.fields)
+            + block(self.print_nodes(node.fields))  # type: ignore
         )
 
-    def leave_UnionTypeDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_UnionTypeDefinition(self, node):
+        # type: (UnionTypeDefinition) -> str
         return (
             "union "
-            + node.name
-            + wrap(" ", join(node.directives, " "))
+            + self.print_node(node.name)  # type: ignore
+            + wrap(" ", self.print_directives(node))
             + " = "
-            + join(node.types, " | ")
+            + join(self.print_nodes(node.types), " | ")
         )
 
-    def leave_EnumTypeDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_EnumTypeDefinition(self, node):
+        # type: (EnumTypeDefinition) -> str
         return (
             "enum "
-            + node.name
-            + wrap(" ", join(node.directives, " "))
+            + self.print_node(node.name)  # type: ignore
+            + wrap(" ", self.print_directives(node))
             + " "
-            + block(node.values)
+            + block(self.print_nodes(node.values))  # type: ignore
         )
 
-    def leave_EnumValueDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
-        return node.name + wrap(" ", join(node.directives, " "))
+    def print_EnumValueDefinition(self, node):
+        # type: (EnumValueDefinition) -> str
+        return self.print_node(node.name) + wrap(  # type: ignore
+            " ", self.print_directives(node)
+        )
 
-    def leave_InputObjectTypeDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_InputObjectTypeDefinition(self, node):
+        # type: (InputObjectTypeDefinition) -> str
         return (
             "input "
-            + node.name
-            + wrap(" ", join(node.directives, " "))
+            + self.print_node(node.name)  # type: ignore
+            + wrap(" ", self.print_directives(node))
             + " "
-            + block(node.fields)
+            + block(self.print_nodes(node.fields))  # type: ignore
         )
 
-    def leave_TypeExtensionDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
-        return "extend " + node.definition
+    def print_TypeExtensionDefinition(self, node):
+        # type: (TypeExtensionDefinition) -> str
+        return "extend " + self.print_node(node.definition)  # type: ignore
 
-    def leave_DirectiveDefinition(self, node, *args):
-        # type: (Any, *Any) -> str
+    def print_DirectiveDefinition(self, node):
+        # type: (DirectiveDefinition) -> str
         return "directive @{}{} on {}".format(
-            node.name,
-            wrap("(", join(node.arguments, ", "), ")"),
-            " | ".join(node.locations),
+            self.print_node(node.name),
+            wrap("(", join(self.print_nodes(node.arguments), ", "), ")"),
+            " | ".join(self.print_nodes(node.locations)),  # type: ignore
+        )
+
+
+class MinifiedPrinter(Printer):
+    """Prints an AST without any insignificant whitespace: tokens are only
+    separated where two names or numbers would otherwise run together."""
+
+    __slots__ = ()
+
+    def print_directives(self, node, separator=""):
+        # type: (Any, str) -> str
+        return concat(self.print_nodes(node.directives))
+
+    def print_arguments(self, nodes):
+        # type: (Optional[List[Any]]) -> str
+        return wrap("(", concat(self.print_nodes(nodes)), ")")
+
+    def print_block(self, nodes):
+        # type: (Optional[List[Any]]) -> str
+        return "{" + concat(self.print_nodes(nodes)) + "}"
+
+    def print_Document(self, node):
+        # type: (Document) -> str
+        return concat(self.print_nodes(node.definitions))
+
+    def print_OperationDefinition(self, node):
+        # type: (OperationDefinition) -> str
+        name = self.print_node(node.name)
+        selection_set = self.print_node(node.selection_set)
+        op = node.operation
+        var_defs = self.print_arguments(node.variable_definitions)
+        directives = self.print_directives(node)
+
+        if not name and not directives and not var_defs and op == "query":
+            return selection_set  # type: ignore
+
+        return concat([op, name, var_defs, directives, selection_set])
+
+    def print_VariableDefinition(self, node):
+        # type: (VariableDefinition) -> str
+        return (
+            self.print_node(node.variable)  # type: ignore
+            + ":"
+            + self.print_node(node.type)
+            + wrap("=", self.print_node(node.default_value))
         )
 
+    def print_SelectionSet(self, node):
+        # type: (SelectionSet) -> str
+        return self.print_block(node.selections)
+
+    def print_Field(self, node):
+        # type: (Field) -> str
+        return concat(
+            [
+                wrap("", self.print_node(node.alias), ":"),
+                self.print_node(node.name),
+                self.print_arguments(node.arguments),
+                self.print_directives(node),
+                self.print_node(node.selection_set),
+            ]
+        )
+
+    def print_Argument(self, node):
+        # type: (Argument) -> str
+        return concat([self.print_node(node.name), ":", self.print_node(node.value)])
+
+    print_ObjectField = print_Argument
+
+    # Fragments
+
+    def print_FragmentSpread(self, node):
+        # type: (FragmentSpread) -> str
+        return concat(["...", self.print_node(node.name), self.print_directives(node)])
+
+    def print_InlineFragment(self, node):
+        # type: (InlineFragment) -> str
+        return concat(
+            [
+                "...",
+                wrap("on ", self.print_node(node.type_condition)),
+                self.print_directives(node),
+                self.print_node(node.selection_set),
+            ]
+        )
+
+    def print_FragmentDefinition(self, node):
+        # type: (FragmentDefinition) -> str
+        return concat(
+            [
+                "fragment",
+                self.print_node(node.name),
+                "on",
+                self.print_node(node.type_condition),
+                self.print_directives(node),
+                self.print_node(node.selection_set),
+            ]
+        )
+
+    # Value
+
+    def print_ListValue(self, node):
+        # type: (ListValue) -> str
+        return "[" + concat(self.print_nodes(node.values)) + "]"
+
+    def print_ObjectValue(self, node):
+        # type: (ObjectValue) -> str
+        return self.print_block(node.fields)
+
+    # Directive
+
+    def print_Directive(self, node):
+        # type: (Directive) -> str
+        return (
+            "@"
+            + self.print_node(node.name)  # type: ignore
+            + self.print_arguments(node.arguments)
+        )
+
+    # Type Definitions:
+
+    def print_SchemaDefinition(self, node):
+        # type: (SchemaDefinition) -> str
+        return concat(
+            [
+                "schema",
+                self.print_directives(node),
+                self.print_block(node.operation_types),
+            ]
+        )
+
+    def print_OperationTypeDefinition(self, node):
+        # type: (OperationTypeDefinition) -> str
+        return concat([node.operation, ":", self.print_node(node.type)])
+
+    def print_ScalarTypeDefinition(self, node):
+        # type: (ScalarTypeDefinition) -> str
+        return concat(
+            ["scalar", self.print_node(node.name), self.print_directives(node)]
+        )
+
+    def print_ObjectTypeDefinition(self, node):
+        # type: (ObjectTypeDefinition) -> str
+        return concat(
+            [
+                "type",
+                self.print_node(node.name),
+                wrap("implements ", concat(self.print_nodes(node.interfaces))),
+                self.print_directives(node),
+                self.print_block(node.fields),
+            ]
+        )
+
+    def print_FieldDefinition(self, node):
+        # type: (FieldDefinition) -> str
+        return concat(
+            [
+                self.print_node(node.name),
+                self.print_arguments(node.arguments),
+                ":",
+                self.print_node(node.type),
+                self.print_directives(node),
+            ]
+        )
+
+    def print_InputValueDefinition(self, node):
+        # type: (InputValueDefinition) -> str
+        return concat(
+            [
+                self.print_node(node.name),
+                ":",
+                self.print_node(node.type),
+                wrap("=", self.print_node(node.default_value)),
+                self.print_directives(node),
+            ]
+        )
+
+    def print_InterfaceTypeDefinition(self, node):
+        # type: (InterfaceTypeDefinition) -> str
+        return concat(
+            [
+                "interface",
+                self.print_node(node.name),
+                self.print_directives(node),
+                self.print_block(node.fields),
+            ]
+        )
+
+    def print_UnionTypeDefinition(self, node):
+        # type: (UnionTypeDefinition) -> str
+        return concat(
+            [
+                "union",
+                self.print_node(node.name),
+                self.print_directives(node),
+                "=",
+                join(self.print_nodes(node.types), "|"),
+            ]
+        )
+
+    def print_EnumTypeDefinition(self, node):
+        # type: (EnumTypeDefinition) -> str
+        return concat(
+            [
+                "enum",
+                self.print_node(node.name),
+                self.print_directives(node),
+                self.print_block(node.values),
+            ]
+        )
+
+    def print_EnumValueDefinition(self, node):
+        # type: (EnumValueDefinition) -> str
+        return concat([self.print_node(node.name), self.print_directives(node)])
+
+    def print_InputObjectTypeDefinition(self, node):
+        # type: (InputObjectTypeDefinition) -> str
+        return concat(
+            [
+                "input",
+                self.print_node(node.name),
+                self.print_directives(node),
+                self.print_block(node.fields),
+            ]
+        )
+
+    def print_TypeExtensionDefinition(self, node):
+        # type: (TypeExtensionDefinition) -> str
+        return concat(["extend", self.print_node(node.definition)])
+
+    def print_DirectiveDefinition(self, node):
+        # type: (DirectiveDefinition) -> str
+        return concat(
+            [
+                "directive",
+                "@" + self.print_node(node.name),  # type: ignore
+                self.print_arguments(node.arguments),
+                "on",
+                join(self.print_nodes(node.locations), "|"),
+            ]
+        )
+
+
+PRINTER = Printer()
+MINIFIED_PRINTER = MinifiedPrinter()
+
 
 def join(maybe_list, separator=""):
     # type: (Optional[List[str]], str) -> str
@@ -317,3 +622,23 @@ def indent(maybe_str):
     if maybe_str:
         return maybe_str.replace("\n", "\n  ")
     return ""
+
+
+def is_name_char(char):
+    # type: (str) -> bool
+    return char.isalnum() or char == "_"
+
+
+def concat(maybe_list):
+    # type: (Optional[List[Optional[str]]]) -> str
+    """Concatenates tokens, separating them with a space only where two
+    name or number characters would otherwise run together."""
+    parts = []  # type: List[str]
+    if maybe_list:
+        for part in maybe_list:
+            if not part:
+                continue
+            if parts and is_name_char(parts[-1][-1]) and is_name_char(part[0]):
+                parts.append(" ")
+            parts.append(part)
+    return "".join(parts)
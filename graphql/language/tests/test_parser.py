@@ -3,11 +3,22 @@ from pytest import raises
 from graphql.error import GraphQLSyntaxError
 from graphql.language import ast
 from graphql.language.location import SourceLocation
-from graphql.language.parser import Loc, parse
+from graphql.language.parser import (
+    MAX_DEPTH,
+    DocumentLoc,
+    Loc,
+    parse,
+    parse_incremental,
+)
+from graphql.language.printer import print_ast
 from graphql.language.source import Source
 
 from .fixtures import KITCHEN_SINK
 
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from typing import Any, List, Optional, Tuple
+
 
 def test_repr_loc():
     # type: () -> None
@@ -305,3 +316,217 @@ def test_parse_creates_ast():
             )
         ],
     )
+
+
+def locations(node):
+    # type: (Any) -> List[Tuple[str, int, int, Optional[Source]]]
+    if isinstance(node, list):
+        return [loc for item in node for loc in locations(item)]
+    if not isinstance(node, ast.Node):
+        return []
+    result = [(type(node).__name__, node.loc.start, node.loc.end, node.loc.source)]
+    for attr in node.__slots__[1:]:
+        result.extend(locations(getattr(node, attr)))
+    return result
+
+
+def current_locations(document):
+    # type: (ast.Document) -> List[Tuple[str, int, int]]
+    """Returns the locations of the nodes of a document in its own source,
+    checking that the reused ones point to the same text."""
+    loc = document.loc
+    offsets = (
+        loc.offsets if isinstance(loc, DocumentLoc) else [0] * len(document.definitions)
+    )
+    result = [("Document", loc.start, loc.end)]
+    for definition, offset in zip(document.definitions, offsets):
+        for name, start, end, source in locations(definition):
+            assert source.body[start:end] == (
+                loc.source.body[start + offset : end + offset]
+            )
+            result.append((name, start + offset, end + offset))
+    return result
+
+
+def assert_incremental_parse(body, edit_start, edit_end, text, document=None):
+    # type: (str, int, int, str, Optional[ast.Document]) -> ast.Document
+    new_body = body[:edit_start] + text + body[edit_end:]
+    document = parse_incremental(
+        document or parse(body), body, edit_start, edit_end, text
+    )
+    expected = parse(new_body)
+    assert document == expected
+    assert current_locations(document) == current_locations(expected)
+    return document
+
+
+def test_parse_incremental_reuses_untouched_definitions():
+    # type: () -> None
+    body = "query A { a }\n\nquery B { b }\n\nquery C { c }\n"
+    document = parse(body)
+    old_locations = locations(document)
+    first, second, third = document.definitions
+    start = body.index("b }")
+
+    new_document = parse_incremental(document, body, start, start + 1, "bee")
+
+    assert new_document.definitions[0] is first
+    assert new_document.definitions[2] is third
+    assert print_ast(new_document.definitions[1]) == "query B {\n  bee\n}"
+    # The reused definitions keep pointing into the previous source, where
+    # their text is the same, and the document tells how far they moved.
+    assert locations(document) == old_locations
+    assert third.loc.start == body.index("query C")
+    assert third.loc.source.body == body
+    assert new_document.loc.offsets == [0, 0, 2]
+    assert new_document.loc.source.body[third.loc.start + 2 :].startswith("query C")
+
+
+def test_parse_incremental_chains_edits():
+    # type: () -> None
+    body = "query A { a }\nfragment F on T { f }\n{ c(x: [1]) }\nquery D { d }"
+    document = parse(body)
+    fragment = document.definitions[1]
+    # Each edit replaces the given number of characters after a text.
+    for after_text, length, text in [
+        ("{ ", 1, "aa a"),
+        ("", 0, "# head\n"),
+        ("{ d }", 0, "\n\nquery E { e }"),
+        ("[", 1, "2,\n3"),
+    ]:
+        edit_start = body.index(after_text) + len(after_text)
+        edit_end = edit_start + length
+        document = assert_incremental_parse(body, edit_start, edit_end, text, document)
+        assert document.definitions[1] is fragment
+        body = body[:edit_start] + text + body[edit_end:]
+
+
+def test_parse_incremental_matches_full_parse():
+    # type: () -> None
+    body = "# head\nquery A { a }\nfragment F on T { f }\n{ c(x: 1) }"
+    assert_incremental_parse(body, 0, 0, "  ")
+    assert_incremental_parse(body, body.index("f }"), body.index("f }") + 1, "g h")
+    assert_incremental_parse(body, body.index("fragment"), body.index("{ c"), "")
+    assert_incremental_parse(body, len(body), len(body), "\nquery D { d }")
+    assert_incremental_parse(
+        body, body.index("query A"), body.index("query A"), "{ z }"
+    )
+
+
+def test_parse_incremental_falls_back_when_edit_leaks():
+    # type: () -> None
+    body = "query A { a } query B { b } { c }"
+    # The comment runs to the end of the line, over the following definition.
+    document = assert_incremental_parse(
+        body, body.index("query B"), body.index("query B"), "#"
+    )
+    assert len(document.definitions) == 1
+
+    # The inserted operation takes over the selection set that follows.
+    end = body.index("b }") + 3
+    document = assert_incremental_parse(body, end, end, " query D")
+    assert len(document.definitions) == 3
+    assert document.definitions[2].name.value == "D"
+
+    with raises(GraphQLSyntaxError):
+        parse_incremental(
+            parse(body), body, body.index("b }"), body.index("b }") + 3, "b"
+        )
+
+
+def test_parse_incremental_reports_syntax_errors_in_edited_region():
+    # type: () -> None
+    body = "query A { a }\nquery B { b }"
+    with raises(GraphQLSyntaxError) as excinfo:
+        parse_incremental(parse(body), body, body.index("b }"), body.index("b }"), "(")
+
+    assert excinfo.value.locations == [SourceLocation(2, 11)]
+
+
+def test_parse_limits_token_count():
+    # type: () -> None
+    assert parse("{ a b }", max_tokens=4)
+    with raises(GraphQLSyntaxError) as excinfo:
+        parse("{ a b c }", max_tokens=4)
+
+    assert excinfo.value.message == (
+        "Syntax Error GraphQL (1:9) Document exceeds the maximum of 4 tokens.\n"
+        "\n"
+        "1: { a b c }\n"
+        "           ^\n"
+    )
+
+
+def test_parse_limits_nesting_depth():
+    # type: () -> None
+    assert parse("{ a { b } }", max_depth=2)
+    with raises(GraphQLSyntaxError) as excinfo:
+        parse("{ a { b { c } } }", max_depth=2)
+    assert excinfo.value.locations == [SourceLocation(1, 9)]
+
+    with raises(GraphQLSyntaxError) as excinfo:
+        parse("{ a(x: [[1]]) }", max_depth=2)
+    assert excinfo.value.locations == [SourceLocation(1, 9)]
+
+    with raises(GraphQLSyntaxError) as excinfo:
+        parse("{ a(x: {y: {z: 1}}) }", max_depth=2)
+    assert excinfo.value.locations == [SourceLocation(1, 12)]
+
+    with raises(GraphQLSyntaxError) as excinfo:
+        parse("query Q($v: [[Int]]) { a }", max_depth=1)
+    assert excinfo.value.locations == [SourceLocation(1, 14)]
+
+
+def test_parse_rejects_deep_nesting_before_recursion_limit():
+    # type: () -> None
+    body = "{ a " * 10000 + "}" * 10000
+    with raises(GraphQLSyntaxError) as excinfo:
+        parse(body, max_depth=100)
+
+    assert "Document exceeds the maximum of 100 levels of nesting." in str(
+        excinfo.value
+    )
+
+
+def test_parse_limits_nesting_depth_by_default():
+    # type: () -> None
+    body = "{ a " * 10000 + "}" * 10000
+    with raises(GraphQLSyntaxError) as excinfo:
+        parse(body)
+    assert "Document exceeds the maximum of {} levels of nesting.".format(
+        MAX_DEPTH
+    ) in str(excinfo.value)
+
+    body = "{ a " * 150 + "}" * 150
+    assert parse(body, max_depth=None)
+
+
+def test_parse_incremental_limits_whole_document():
+    # type: () -> None
+    body = "query A { a { b { c } } }\n{ d }\nquery B { e f g }"
+    document = parse(body)
+    start = body.index("d }")
+    new_body = body[:start] + "x" + body[start + 1 :]
+
+    # Only the second operation is parsed again, within all the limits.
+    for limits in ({"max_tokens": 20}, {"max_nodes": 24}, {"max_depth": 2}):
+        with raises(GraphQLSyntaxError) as excinfo:
+            parse(new_body, **limits)
+        with raises(GraphQLSyntaxError) as incremental_excinfo:
+            parse_incremental(document, body, start, start + 1, "x", **limits)
+        assert incremental_excinfo.value.message == excinfo.value.message
+
+    limits = {"max_tokens": 21, "max_nodes": 25, "max_depth": 3}
+    assert parse_incremental(document, body, start, start + 1, "x", **limits)
+
+
+def test_parse_limits_node_count():
+    # type: () -> None
+    # Document, OperationDefinition, SelectionSet, Field and Name.
+    assert parse("{ a }", max_nodes=5)
+    with raises(GraphQLSyntaxError) as excinfo:
+        parse("{ a }", max_nodes=4)
+    assert "Document exceeds the maximum of 4 AST nodes." in str(excinfo.value)
+
+    with raises(GraphQLSyntaxError):
+        parse("{ a }", max_nodes=4, no_location=True)
@@ -143,3 +143,36 @@ fragment frag on Friend {
 }
 """
     )
+
+
+def test_prints_minified_query():
+    # type: () -> None
+    ast = parse(
+        """
+        query Q($foo: [Int!] = [1, -2], $bar: String) @dir(a: 1.5) {
+          a: field(arg: {key: "value", other: ENUM}) @include(if: $foo) {
+            id
+            ...frag @skip(if: false)
+            ... on User { name }
+          }
+        }
+        fragment frag on Friend { foo }
+        """
+    )
+    assert print_ast(ast, minified=True) == (
+        "query Q($foo:[Int!]=[1-2]$bar:String)@dir(a:1.5)"
+        '{a:field(arg:{key:"value"other:ENUM})@include(if:$foo)'
+        "{id...frag@skip(if:false)...on User{name}}}"
+        "fragment frag on Friend{foo}"
+    )
+
+
+def test_prints_minified_anonymous_query():
+    # type: () -> None
+    assert print_ast(parse("{ a b }"), minified=True) == "{a b}"
+
+
+def test_minified_kitchen_sink_reparses_to_same_ast():
+    # type: () -> None
+    ast = parse(KITCHEN_SINK)
+    assert parse(print_ast(ast, minified=True)) == ast
@@ -106,3 +106,11 @@ directive @include(if: Boolean!) on FIELD | FRAGMENT_SPREAD | INLINE_FRAGMENT
 """
 
     assert printed == expected
+
+
+def test_minified_schema_kitchen_sink_reparses_to_same_ast():
+    # type: () -> None
+    ast = parse(SCHEMA_KITCHEN_SINK)
+    minified = print_ast(ast, minified=True)
+    assert "\n" not in minified
+    assert parse(minified) == ast
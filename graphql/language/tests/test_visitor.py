@@ -14,6 +14,7 @@ from graphql.language.visitor import (
     TypeInfoVisitor,
     Visitor,
     visit,
+    walk,
 )
 from graphql.type import get_named_type, is_composite_type
 from graphql.utils.type_info import TypeInfo
@@ -738,6 +739,51 @@ def test_visits_in_pararell_allows_skipping_different_subtrees():
     ]
 
 
+def test_visits_in_pararell_calls_named_handlers_only_for_their_node_types():
+    # type: () -> None
+    visited = []
+    ast = parse("{ a { x }, b { y } }")
+
+    class SkippingVisitor(Visitor):
+        def enter_Field(self, node, *args):
+            # type: (Field, *Any) -> Optional[Any]
+            visited.append(["skipping", "enter", node.name.value])
+            if node.name.value == "a":
+                return False
+
+        def leave_Field(self, node, *args):
+            # type: (Field, *Any) -> None
+            visited.append(["skipping", "leave", node.name.value])
+
+    class NameVisitor(Visitor):
+        def enter_Name(self, node, *args):
+            # type: (Name, *Any) -> None
+            visited.append(["name", "enter", node.value])
+
+    class TestVisitor(Visitor):
+        def enter(self, node, *args):
+            # type: (Any, *Any) -> None
+            if isinstance(node, SelectionSet):
+                visited.append(["any", "enter", type(node).__name__])
+
+    visit(ast, ParallelVisitor([SkippingVisitor(), NameVisitor(), TestVisitor()]))
+
+    assert visited == [
+        ["any", "enter", "SelectionSet"],
+        ["skipping", "enter", "a"],
+        ["name", "enter", "a"],
+        ["any", "enter", "SelectionSet"],
+        ["name", "enter", "x"],
+        ["skipping", "enter", "b"],
+        ["name", "enter", "b"],
+        ["any", "enter", "SelectionSet"],
+        ["skipping", "enter", "y"],
+        ["name", "enter", "y"],
+        ["skipping", "leave", "y"],
+        ["skipping", "leave", "b"],
+    ]
+
+
 def test_visits_in_pararell_allows_early_exit_while_visiting():
     # type: () -> None
     visited = []
@@ -1195,3 +1241,83 @@ def test_visits_with_typeinfo_maintains_type_info_during_edit():
         ["leave", "OperationDefinition", None, None, "QueryRoot", None],
         ["leave", "Document", None, None, None, None],
     ]
+
+
+def test_walk_calls_visitor_like_visit():
+    # type: () -> None
+    ast = parse(KITCHEN_SINK)
+
+    class TestVisitor(Visitor):
+        def __init__(self):
+            # type: () -> None
+            self.calls = []  # type: List[Any]
+
+        def enter(self, node, key, parent, path, ancestors):
+            # type: (Any, Union[None, int, str], Any, List, List) -> Optional[Any]
+            self.calls.append(
+                ("enter", node, key, id(parent), list(path), list(map(id, ancestors)))
+            )
+            if isinstance(node, Field) and node.name.value == "alias":
+                return False
+
+        def leave(self, node, key, parent, path, ancestors):
+            # type: (Any, Union[None, int, str], Any, List, List) -> None
+            self.calls.append(
+                ("leave", node, key, id(parent), list(path), list(map(id, ancestors)))
+            )
+
+    visited = TestVisitor()
+    visit(ast, visited)
+    walked = TestVisitor()
+    walk(ast, walked)
+    assert walked.calls == visited.calls
+
+    visited = TestVisitor()
+    visit(ast.definitions, visited)
+    walked = TestVisitor()
+    walk(ast.definitions, walked)
+    assert walked.calls == visited.calls
+
+
+def test_walk_allows_early_exit_from_named_handlers():
+    # type: () -> None
+    visited = []
+    ast = parse("{ a, b { x }, c }")
+
+    class TestVisitor(Visitor):
+        def enter_Field(self, node, *args):
+            # type: (Field, *Any) -> Optional[Any]
+            visited.append(["enter", node.name.value])
+            if node.name.value == "a":
+                return False
+            if node.name.value == "x":
+                return BREAK
+
+        def leave_Field(self, node, *args):
+            # type: (Field, *Any) -> None
+            visited.append(["leave", node.name.value])
+
+    walk(ast, TestVisitor())
+
+    assert visited == [["enter", "a"], ["enter", "b"], ["enter", "x"]]
+
+
+def test_walk_with_typeinfo_maintains_type_info():
+    # type: () -> None
+    visited = []
+    type_info = TypeInfo(test_schema)
+    ast = parse("{ human(id: 4) { name, pets { name } } }")
+
+    class TestVisitor(Visitor):
+        def enter_Field(self, node, *args):
+            # type: (Field, *Any) -> None
+            visited.append((node.name.value, str(type_info.get_type())))
+
+    walk(ast, TypeInfoVisitor(type_info, ParallelVisitor([TestVisitor()])))
+
+    assert visited == [
+        ("human", "Human"),
+        ("name", "String"),
+        ("pets", "[Pet]"),
+        ("name", "String"),
+    ]
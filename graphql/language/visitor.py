@@ -1,4 +1,5 @@
 from copy import copy
+from operator import attrgetter
 
 import six
 
@@ -11,7 +12,6 @@ if False:  # flake8: noqa
     from ..utils.type_info import TypeInfo
     from ..validation.validation import UsageVisitor
     from .ast import Node, Document, OperationDefinition
-    from .printer import PrintingVisitor
 
 
 class _Falsey(object):
@@ -173,6 +173,113 @@ def visit(root, visitor, key_map=None):
     return new_root
 
 
+# The child keys of every node type along with a getter for each of them,
+# used by walk to avoid looking the attributes up by name.
+CHILD_ACCESSORS = {
+    node_type: tuple((key, attrgetter(key)) for key in keys)
+    for node_type, keys in QUERY_DOCUMENT_KEYS.items()
+}
+
+
+class _BreakWalk(Exception):
+    pass
+
+
+def walk(root, visitor, key_map=None):
+    # type: (Union[Node, List[Node]], Visitor, Optional[Dict[Node, Tuple]]) -> None
+    """Walks the AST in the same order as visit, calling the visitor with the
+    same arguments, but without support for editing: the results returned by
+    the visitor are ignored, except for False (skip the subtree) and BREAK.
+
+    Visitors which do not override enter or leave get their enter_* and
+    leave_* handlers called directly."""
+    if key_map is None:
+        child_accessors = CHILD_ACCESSORS
+    else:
+        child_accessors = {
+            node_type: tuple(
+                (key, lambda node, key=key: getattr(node, key, None)) for key in keys
+            )
+            for node_type, keys in key_map.items()
+        }
+
+    get_children = child_accessors.get
+    get_enter = _get_handler_getter(visitor, "enter")
+    get_leave = _get_handler_getter(visitor, "leave")
+    path = []  # type: List[Union[int, str]]
+    ancestors = []  # type: List[Any]
+    path_append = path.append
+    path_pop = path.pop
+    ancestors_append = ancestors.append
+    ancestors_pop = ancestors.pop
+
+    def walk_node(node, key, parent):
+        # type: (Any, Union[None, int, str], Any) -> None
+        # The key of the node is expected at the end of the path, and is
+        # removed from it before leaving the node, as visit does.
+        handler = get_enter(type(node))
+        if handler:
+            result = handler(visitor, node, key, parent, path, ancestors)
+            if result is BREAK:
+                raise _BreakWalk()
+            if result is False:
+                if parent is not None:
+                    path_pop()
+                return
+
+        children = get_children(type(node))
+        if children:
+            if parent is not None:
+                ancestors_append(parent)
+            for child_key, get_child in children:
+                child = get_child(node)
+                if child is None:
+                    continue
+                path_append(child_key)
+                if isinstance(child, list):
+                    ancestors_append(node)
+                    for index, item in enumerate(child):
+                        if item is not None:
+                            path_append(index)
+                            walk_node(item, index, child)
+                    ancestors_pop()
+                    path_pop()
+                else:
+                    walk_node(child, child_key, node)
+            if parent is not None:
+                ancestors_pop()
+
+        if parent is not None:
+            path_pop()
+        handler = get_leave(type(node))
+        if handler:
+            result = handler(visitor, node, key, parent, path, ancestors)
+            if result is BREAK:
+                raise _BreakWalk()
+
+    try:
+        if isinstance(root, list):
+            for index, item in enumerate(root):
+                if item is not None:
+                    path_append(index)
+                    walk_node(item, index, root)
+        else:
+            walk_node(root, None, None)
+    except _BreakWalk:
+        pass
+
+
+def _get_handler_getter(visitor, name):
+    # type: (Any, str) -> Any
+    """Returns a function giving the handler to call for a node type, which
+    is either a handler from the visitor class or its own enter/leave."""
+    visitor_class = type(visitor)
+    method = six.get_unbound_function(getattr(visitor_class, name))
+    if method is six.get_unbound_function(getattr(Visitor, name)):
+        return getattr(visitor_class, "_{}_handlers".format(name)).get
+    return lambda node_type: method
+
+
 @six.add_metaclass(VisitorMeta)
 class Visitor(object):
     __slots__ = ()
@@ -207,7 +314,20 @@ class Visitor(object):
 
 
 class ParallelVisitor(Visitor):
-    __slots__ = "skipping", "visitors"
+    """Runs several visitors at once. For every node type, only the visitors
+    having a handler for it are called, and subtrees skipped by all of the
+    visitors are not traversed."""
+
+    __slots__ = (
+        "skipping",
+        "visitors",
+        "_resuming",
+        "_skipping_count",
+        "_enter_getters",
+        "_leave_getters",
+        "_enter_dispatch",
+        "_leave_dispatch",
+    )
 
     def __init__(self, visitors):
         # type: (List[Any]) -> None
@@ -215,8 +335,36 @@ class ParallelVisitor(Visitor):
         self.skipping = [None] * len(
             visitors
         )  # type: List[Union[Node, _Break, _Falsey, None]]
+        # Id of a skipped node -> indices of the visitors resuming after it.
+        self._resuming = {}  # type: Dict[int, List[int]]
+        # Number of visitors skipping a subtree or done with the traversal.
+        self._skipping_count = 0
+        self._enter_getters = [_get_handler_getter(v, "enter") for v in visitors]
+        self._leave_getters = [_get_handler_getter(v, "leave") for v in visitors]
+        # Node type -> list of (index, visitor, handler) to call for it.
+        self._enter_dispatch = {}  # type: Dict[type, List[Tuple[int, Any, Any]]]
+        self._leave_dispatch = {}  # type: Dict[type, List[Tuple[int, Any, Any]]]
         return None
 
+    def skip(self, index, node):
+        # type: (int, Any) -> None
+        """Makes the visitor at the given index skip the subtree of the node
+        being entered, as if it returned False for it."""
+        if not self.skipping[index]:
+            self.skipping[index] = node
+            self._resuming.setdefault(id(node), []).append(index)
+            self._skipping_count += 1
+
+    def _get_dispatch(self, dispatch, getters, node_type):
+        # type: (Dict, List[Any], type) -> List[Tuple[int, Any, Any]]
+        handlers = []
+        for i, (visitor, get_handler) in enumerate(zip(self.visitors, getters)):
+            handler = get_handler(node_type)
+            if handler:
+                handlers.append((i, visitor, handler))
+        dispatch[node_type] = handlers
+        return handlers
+
     def enter(
         self,
         node,  # type: Any
@@ -226,17 +374,44 @@ class ParallelVisitor(Visitor):
         ancestors,  # type: List[Any]
     ):
         # type: (...) -> Any
-        for i, visitor in enumerate(self.visitors):
-            if not self.skipping[i]:
-                result = visitor.enter(node, key, parent, path, ancestors)
+        node_type = type(node)
+        handlers = self._enter_dispatch.get(node_type)
+        if handlers is None:
+            handlers = self._get_dispatch(
+                self._enter_dispatch, self._enter_getters, node_type
+            )
+
+        skipping = self.skipping
+        for i, visitor, handler in handlers:
+            if not skipping[i]:
+                result = handler(visitor, node, key, parent, path, ancestors)
                 if result is False:
-                    self.skipping[i] = node
+                    skipping[i] = node
+                    self._resuming.setdefault(id(node), []).append(i)
+                    self._skipping_count += 1
                 elif result is BREAK:
-                    self.skipping[i] = BREAK
+                    skipping[i] = BREAK
+                    self._skipping_count += 1
                 elif result is not None:
                     return result
+
+        if self._skipping_count == len(skipping):
+            # No visitor is interested in the subtree: skip it altogether,
+            # leave is then not called for the node.
+            self._resume(node)
+            return False
         return None
 
+    def _resume(self, node):
+        # type: (Any) -> None
+        """Resumes the visitors which skipped the given node."""
+        if self._resuming:
+            resuming = self._resuming.pop(id(node), None)
+            if resuming:
+                for i in resuming:
+                    self.skipping[i] = REMOVE
+                self._skipping_count -= len(resuming)
+
     def leave(
         self,
         node,  # type: Any
@@ -246,15 +421,26 @@ class ParallelVisitor(Visitor):
         ancestors,  # type: List[Any]
     ):
         # type: (...) -> Any
-        for i, visitor in enumerate(self.visitors):
-            if not self.skipping[i]:
-                result = visitor.leave(node, key, parent, path, ancestors)
-                if result is BREAK:
-                    self.skipping[i] = BREAK
-                elif result is not None and result is not False:
-                    return result
-            elif self.skipping[i] == node:
-                self.skipping[i] = REMOVE
+        node_type = type(node)
+        handlers = self._leave_dispatch.get(node_type)
+        if handlers is None:
+            handlers = self._get_dispatch(
+                self._leave_dispatch, self._leave_getters, node_type
+            )
+
+        skipping = self.skipping
+        try:
+            for i, visitor, handler in handlers:
+                if not skipping[i]:
+                    result = handler(visitor, node, key, parent, path, ancestors)
+                    if result is BREAK:
+                        skipping[i] = BREAK
+                        self._skipping_count += 1
+                    elif result is not None and result is not False:
+                        return result
+        finally:
+            # The visitors which skipped this node resume once it is left.
+            self._resume(node)
         return None
 
 
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from typing import Any, Hashable
+
+
+class LRUCache(object):
+    """A mapping keeping at most `max_size` entries, dropping the least
+    recently used entries first."""
+
+    __slots__ = ("max_size", "_data")
+
+    def __init__(self, max_size):
+        # type: (int) -> None
+        assert max_size > 0, "The size of the cache must be positive."
+        self.max_size = max_size
+        self._data = OrderedDict()  # type: OrderedDict
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._data)
+
+    def __contains__(self, key):
+        # type: (Hashable) -> bool
+        return key in self._data
+
+    def get(self, key, default=None):
+        # type: (Hashable, Any) -> Any
+        """Returns the value of the key, marking it as the most recently used,
+        or the default if the key is not cached."""
+        data = self._data
+        try:
+            value = data.pop(key)
+        except KeyError:
+            return default
+        data[key] = value
+        return value
+
+    def set(self, key, value):
+        # type: (Hashable, Any) -> None
+        data = self._data
+        data.pop(key, None)
+        data[key] = value
+        while len(data) > self.max_size:
+            try:
+                data.popitem(last=False)
+            except KeyError:
+                # Emptied by another thread in the meantime.
+                break
+
+    def clear(self):
+        # type: () -> None
+        self._data.clear()
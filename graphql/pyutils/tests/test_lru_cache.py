@@ -0,0 +1,24 @@
+from graphql.pyutils.lru_cache import LRUCache
+
+
+def test_lru_cache_drops_the_least_recently_used_entries():
+    cache = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("b", 0) == 0
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    cache.set("a", 4)
+    cache.set("d", 5)
+    assert cache.get("a") == 4
+    assert "c" not in cache
+
+    cache.clear()
+    assert len(cache) == 0
@@ -10,7 +10,7 @@ from ..utils.undefined import Undefined
 
 # Necessary for static type checking
 if False:  # flake8: noqa
-    from typing import List, Dict, Any, Callable, Optional, Union, Type
+    from typing import List, Dict, Any, Callable, Optional, Union, Type, Iterable
 
 
 def is_type(type):
@@ -124,9 +124,21 @@ class GraphQLScalarType(GraphQLNamedType):
             return None
 
         OddType = GraphQLScalarType(name='Odd', serialize=coerce_odd)
+
+    A `serialize_many` function may also be given to serialize lists of
+    values at once. It returns the list of the serialized values, with None
+    for the values it leaves to `serialize` (including nulls, errors and
+    promises, which it should never serialize).
     """
 
-    __slots__ = "name", "description", "serialize", "parse_value", "parse_literal"
+    __slots__ = (
+        "name",
+        "description",
+        "serialize",
+        "parse_value",
+        "parse_literal",
+        "serialize_many",
+    )
 
     def __init__(
         self,
@@ -135,6 +147,7 @@ class GraphQLScalarType(GraphQLNamedType):
         serialize=None,  # type: Optional[Callable]
         parse_value=None,  # type: Optional[Callable]
         parse_literal=None,  # type: Optional[Callable]
+        serialize_many=None,  # type: Optional[Callable]
     ):
         # type: (...) -> None
         assert name, "Type must be named."
@@ -155,9 +168,15 @@ class GraphQLScalarType(GraphQLNamedType):
                 self
             )
 
+        if serialize_many is not None:
+            assert callable(
+                serialize_many
+            ), '{} must provide "serialize_many" as a function.'.format(self)
+
         self.serialize = serialize
         self.parse_value = parse_value or none_func
         self.parse_literal = parse_literal or none_func
+        self.serialize_many = serialize_many
 
     def __str__(self):
         # type: () -> str
@@ -517,22 +536,40 @@ class GraphQLEnumType(GraphQLNamedType):
 
     def serialize(self, value):
         # type: (Union[str, PyEnum]) -> Optional[str]
-        if isinstance(value, PyEnum):
-            # We handle PyEnum values
-            value = value.value
-        if isinstance(value, collections.Hashable):
-            enum_value = self._value_lookup.get(value)
-            if enum_value:
-                return enum_value.name
-
-        return None
+        try:
+            name = self._serialized_names.get(value)
+        except TypeError:
+            # Unhashable values cannot be enum values.
+            return None
+        if name is None and isinstance(value, PyEnum):
+            # We handle PyEnum values, remembering the name of the members.
+            name = self._serialized_names.get(value.value)
+            if name is not None:
+                self._serialized_names[value] = name
+
+        return name
+
+    def serialize_many(self, values):
+        # type: (Iterable[Any]) -> List[Optional[str]]
+        """Serializes many values at once, giving None for the values that
+        cannot be serialized this way, which must be serialized one by one."""
+        get_name = self._serialized_names.get
+        serialize = self.serialize
+        try:
+            # Names are never empty, misses (like Python Enum members not seen
+            # yet) are serialized on their own.
+            return [get_name(value) or serialize(value) for value in values]
+        except TypeError:
+            return [serialize(value) for value in values]
 
     def parse_value(self, value):
-        if isinstance(value, collections.Hashable):
+        try:
             enum_value = self._name_lookup.get(value)
+        except TypeError:
+            return None
 
-            if enum_value:
-                return enum_value.value
+        if enum_value:
+            return enum_value.value
 
         return None
 
@@ -543,15 +580,22 @@ class GraphQLEnumType(GraphQLNamedType):
             if enum_value:
                 return enum_value.value
 
-    @cached_property
-    def _value_lookup(self):
-        # type: () -> Dict[str, GraphQLEnumValue]
-        return {value.value: value for value in self.values}
-
     @cached_property
     def _name_lookup(self):
         return {value.name: value for value in self.values}
 
+    @cached_property
+    def _serialized_names(self):
+        # type: () -> Dict[Any, str]
+        # Python Enum members are added as they are serialized.
+        names = {}  # type: Dict[Any, str]
+        for value in self.values:
+            try:
+                names[value.value] = value.name
+            except TypeError:
+                pass
+        return names
+
 
 def define_enum_values(type, value_map):
     assert (
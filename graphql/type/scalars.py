@@ -1,3 +1,6 @@
+import sys
+from array import array
+
 from six import string_types, text_type
 
 from ..language.ast import BooleanValue, FloatValue, IntValue, StringValue
@@ -5,7 +8,7 @@ from .definition import GraphQLScalarType
 
 # Necessary for static type checking
 if False:  # flake8: noqa
-    from typing import Any, Optional, Union
+    from typing import Any, Iterable, List, Optional, Sequence, Union
 
 # As per the GraphQL Spec, Integers are only treated as valid when a valid
 # 32-bit signed integer, providing the broadest support across platforms.
@@ -15,6 +18,33 @@ if False:  # flake8: noqa
 MAX_INT = 2147483647
 MIN_INT = -2147483648
 
+# The exact types of the values serialized in bulk by the built-in scalars,
+# other values (including subclasses) are serialized one by one.
+_STRING_TYPES = frozenset((str, text_type))
+
+# The type codes of arrays (and formats of memoryviews) of numbers.
+_INT_TYPECODES = frozenset("bBhHiIlLqQ")
+_FLOAT_TYPECODES = frozenset("fd")
+
+# The largest integer converted to a float in bulk, larger ones overflow (or
+# come close to it) and are serialized one by one.
+_MAX_FLOAT_INT = int(sys.float_info.max)
+
+
+def _buffer_items(values, typecodes):
+    # type: (Any, frozenset) -> Optional[List[Any]]
+    """Returns the items of an array or one-dimensional memoryview of the
+    given type codes, or None for other values."""
+    if isinstance(values, array):
+        typecode = values.typecode
+    elif isinstance(values, memoryview) and values.ndim == 1:
+        typecode = values.format
+    else:
+        return None
+    if typecode not in typecodes:
+        return None
+    return values.tolist()
+
 
 def coerce_int(value):
     # type: (Any) -> int
@@ -42,6 +72,20 @@ def parse_int_literal(ast):
     return None
 
 
+def serialize_many_ints(values):
+    # type: (Sequence[Any]) -> List[Optional[int]]
+    items = _buffer_items(values, _INT_TYPECODES)
+    if items is not None and (
+        not items or MIN_INT <= min(items) and max(items) <= MAX_INT
+    ):
+        return items
+
+    return [
+        value if type(value) is int and MIN_INT <= value <= MAX_INT else None
+        for value in values
+    ]
+
+
 GraphQLInt = GraphQLScalarType(
     name="Int",
     description="The `Int` scalar type represents non-fractional signed whole numeric "
@@ -51,6 +95,7 @@ GraphQLInt = GraphQLScalarType(
     serialize=coerce_int,
     parse_value=coerce_int,
     parse_literal=parse_int_literal,
+    serialize_many=serialize_many_ints,
 )
 
 
@@ -68,6 +113,26 @@ def parse_float_literal(ast):
     return None
 
 
+def serialize_many_floats(values):
+    # type: (Sequence[Any]) -> List[Optional[float]]
+    items = _buffer_items(values, _FLOAT_TYPECODES)
+    if items is not None:
+        return items
+
+    items = _buffer_items(values, _INT_TYPECODES)
+    if items is not None:
+        return [float(item) for item in items]
+
+    return [
+        value
+        if type(value) is float
+        else float(value)
+        if type(value) is int and -_MAX_FLOAT_INT <= value <= _MAX_FLOAT_INT
+        else None
+        for value in values
+    ]
+
+
 GraphQLFloat = GraphQLScalarType(
     name="Float",
     description="The `Float` scalar type represents signed double-precision fractional "
@@ -76,6 +141,7 @@ GraphQLFloat = GraphQLScalarType(
     serialize=coerce_float,
     parse_value=coerce_float,
     parse_literal=parse_float_literal,
+    serialize_many=serialize_many_floats,
 )
 
 
@@ -98,6 +164,18 @@ def coerce_str(value):
     return text_type(value)
 
 
+def serialize_many_strings(values):
+    # type: (Iterable[Any]) -> List[Optional[str]]
+    return [
+        value
+        if type(value) in _STRING_TYPES
+        else text_type(value)
+        if type(value) is int
+        else None
+        for value in values
+    ]
+
+
 def parse_string_literal(ast):
     # type: (Union[StringValue]) -> Optional[str]
     if isinstance(ast, StringValue):
@@ -114,9 +192,18 @@ GraphQLString = GraphQLScalarType(
     serialize=coerce_string,
     parse_value=coerce_string,
     parse_literal=parse_string_literal,
+    serialize_many=serialize_many_strings,
 )
 
 
+def serialize_many_booleans(values):
+    # type: (Sequence[Any]) -> List[Optional[bool]]
+    if isinstance(values, memoryview) and values.format == "?" and values.ndim == 1:
+        return values.tolist()
+
+    return [value if type(value) is bool else None for value in values]
+
+
 def parse_boolean_literal(ast):
     # type: (BooleanValue) -> Optional[bool]
     if isinstance(ast, BooleanValue):
@@ -130,6 +217,7 @@ GraphQLBoolean = GraphQLScalarType(
     serialize=bool,
     parse_value=bool,
     parse_literal=parse_boolean_literal,
+    serialize_many=serialize_many_booleans,
 )
 
 
@@ -150,4 +238,5 @@ GraphQLID = GraphQLScalarType(
     serialize=coerce_str,
     parse_value=coerce_str,
     parse_literal=parse_id_literal,
+    serialize_many=serialize_many_strings,
 )
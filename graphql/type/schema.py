@@ -1,19 +1,41 @@
-from collections import Iterable
+from collections import Iterable, deque
+from threading import RLock
 
-from .definition import GraphQLObjectType
+from six.moves import cPickle as pickle
+
+from .definition import (
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLUnionType,
+)
 from .directives import GraphQLDirective, specified_directives
-from .introspection import IntrospectionSchema
+from .introspection import (
+    IntrospectionSchema,
+    SchemaMetaFieldDef,
+    TypeMetaFieldDef,
+    TypeNameMetaFieldDef,
+)
 from .typemap import GraphQLTypeMap
+from ..pyutils.lru_cache import LRUCache
+from ..utils.suggestion_list import SuggestionIndex
+from ..language.ast import NamedType
+from ..utils.type_from_ast import build_type_from_ast, get_type_ast_key
 
 # Necessary for static type checking
 if False:  # flake8: noqa
-    from .definition import (
-        GraphQLNamedType,
-        GraphQLInterfaceType,
-        GraphQLUnionType,
-        GraphQLType,
-    )
-    from typing import Dict, Union, Any, List, Optional
+    from .definition import GraphQLNamedType, GraphQLType, GraphQLField
+    from ..language.ast import ListType, NonNullType
+    from typing import Dict, Union, Any, List, Optional, Hashable, Mapping
+
+# The maximum number of distinct introspection queries cached per schema, the
+# least recently used ones are dropped first.
+INTROSPECTION_CACHE_SIZE = 100
+
+# The maximum number of wrapping types (e.g. `[Int!]`) of type nodes memoized
+# per schema, the least recently used ones are dropped first.
+TYPE_FROM_AST_CACHE_SIZE = 100
 
 
 class GraphQLSchema(object):
@@ -39,6 +61,26 @@ class GraphQLSchema(object):
           ...
           directives=specified_directives.extend([MyCustomerDirective]),
       )
+
+    Schemas known to be valid, such as generated ones in production, can be
+    created with `assume_valid=True` to skip checking the fields, arguments
+    and interface implementations of their types.
+
+    With `lazy=True`, the fields of the types are only defined when first
+    used. The schema then starts with the root types, the given `types`, and
+    the interfaces and union members these declare. A type looked up by name
+    without being found is searched for breadth first, following the fields
+    of the types found so far only until it is found, so that the fields of
+    the types not explored stay undefined. The fields of every type are
+    followed, and the types checked, the first time all the types are listed
+    or the possible types of an interface are asked for, as implementations
+    may be anywhere. Giving the types looked up by name (e.g. the input types
+    of variables) in `types` makes finding them free. Lazy schemas can be
+    used from many threads.
+
+    `valid_types` maps names to types known to be valid together, like the
+    types a schema shares with the one it extends. They are put in the type
+    map as they are, without following their fields or checking them.
     """
 
     __slots__ = (
@@ -46,9 +88,20 @@ class GraphQLSchema(object):
         "_mutation",
         "_subscription",
         "_type_map",
+        "_pending_types",
+        "_found_types",
+        "_unexplored_types",
+        "_lock",
+        "_assume_valid",
         "_directives",
+        "_directive_map",
+        "_indexed_directives",
         "_implementations",
         "_possible_type_map",
+        "_suggestion_indexes",
+        "_field_defs",
+        "_introspection_results",
+        "_types_from_ast",
     )
 
     def __init__(
@@ -58,6 +111,9 @@ class GraphQLSchema(object):
         subscription=None,  # type: Optional[GraphQLObjectType]
         directives=None,  # type: Optional[List[GraphQLDirective]]
         types=None,  # type: Optional[List[GraphQLNamedType]]
+        assume_valid=False,  # type: bool
+        lazy=False,  # type: bool
+        valid_types=None,  # type: Optional[Mapping[str, GraphQLNamedType]]
     ):
         # type: (...) -> None
         assert isinstance(
@@ -92,13 +148,40 @@ class GraphQLSchema(object):
             directives
         )
         self._directives = directives
+        self._directive_map = {}  # type: Dict[str, GraphQLDirective]
+        self._indexed_directives = None  # type: Optional[List[GraphQLDirective]]
 
         initial_types = list(
             filter(None, [query, mutation, subscription, IntrospectionSchema])
         )  # type: List[GraphQLNamedType]
         if types:
             initial_types += types
-        self._type_map = GraphQLTypeMap(initial_types)  # type: GraphQLTypeMap
+        self._assume_valid = assume_valid
+        self._pending_types = None  # type: Optional[List[GraphQLNamedType]]
+        self._found_types = None  # type: Optional[Dict[str, Any]]
+        self._unexplored_types = None  # type: Any
+        self._lock = None  # type: Optional[RLock]
+        if lazy:
+            assert not valid_types, "Lazy schemas cannot be given valid types."
+            # The whole map is built when first needed, see _complete_type_map.
+            self._pending_types = initial_types
+            self._type_map = GraphQLTypeMap(
+                initial_types, assume_valid=True, follow_fields=False
+            )  # type: GraphQLTypeMap
+            # The types found by name so far, and those whose fields are still
+            # to be followed in that search, see _find_type.
+            self._found_types = dict(self._type_map)
+            self._unexplored_types = deque(self._type_map.values())
+            self._lock = RLock()
+        else:
+            self._type_map = GraphQLTypeMap(
+                initial_types, assume_valid, valid_types=valid_types
+            )
+        self._suggestion_indexes = {}  # type: Dict[Optional[str], SuggestionIndex]
+        # Parent type -> field name -> field definition.
+        self._field_defs = {}  # type: Dict[GraphQLNamedType, Dict[str, GraphQLField]]
+        self._introspection_results = LRUCache(INTROSPECTION_CACHE_SIZE)
+        self._types_from_ast = LRUCache(TYPE_FROM_AST_CACHE_SIZE)
 
     def get_query_type(self):
         # type: () -> GraphQLObjectType
@@ -114,27 +197,169 @@ class GraphQLSchema(object):
 
     def get_type_map(self):
         # type: () -> Dict[str, GraphQLType]
+        if self._pending_types is not None:
+            self._complete_type_map()
         return self._type_map
 
     def get_type(self, name):
         # type: (str) -> Optional[GraphQLNamedType]
-        return self._type_map.get(name)
+        # The complete map is published before the pending types are cleared,
+        # so it is the one read once they are seen cleared.
+        pending_types = self._pending_types
+        type = self._type_map.get(name)
+        if type is None and pending_types is not None:
+            type = self._find_type(name)
+        return type
         # raise Exception("Type {name} not found in schema.".format(name=name))
 
+    def _find_type(self, name):
+        # type: (str) -> Optional[GraphQLNamedType]
+        """Searches a lazy schema for a type, following the fields of the types
+        found so far breadth first, until the type is found."""
+        with self._lock:  # type: ignore
+            if self._pending_types is None:
+                return self._type_map.get(name)
+
+            found_types = self._found_types
+            unexplored_types = self._unexplored_types
+            while name not in found_types and unexplored_types:
+                for type in GraphQLTypeMap.get_referenced_types(
+                    unexplored_types.popleft()
+                ):
+                    while isinstance(type, (GraphQLList, GraphQLNonNull)):
+                        type = type.of_type
+                    if type and type.name not in found_types:
+                        found_types[type.name] = type
+                        unexplored_types.append(type)
+            return found_types.get(name)
+
+    def _complete_type_map(self):
+        # type: () -> None
+        """Builds the whole type map of a lazy schema, following the fields of
+        every type."""
+        with self._lock:  # type: ignore
+            types = self._pending_types
+            if types is None:
+                # Built by another thread in the meantime.
+                return
+
+            self._type_map = GraphQLTypeMap(types, self._assume_valid)
+            self._pending_types = None
+            self._found_types = self._unexplored_types = None
+
+    def get_field_def(self, parent_type, field_name):
+        # type: (GraphQLNamedType, str) -> Optional[GraphQLField]
+        """Returns the definition of the named field of the given type, which
+        may be one of the introspection meta fields, or None if the type has
+        no such field. Found definitions are memoized."""
+        field_defs = self._field_defs.get(parent_type)
+        if field_defs is None:
+            field_defs = self._field_defs[parent_type] = {}
+        else:
+            field_def = field_defs.get(field_name)
+            if field_def is not None:
+                return field_def
+
+        if field_name == "__schema" and self._query == parent_type:
+            field_def = SchemaMetaFieldDef
+        elif field_name == "__type" and self._query == parent_type:
+            field_def = TypeMetaFieldDef
+        elif field_name == "__typename" and isinstance(
+            parent_type, (GraphQLObjectType, GraphQLInterfaceType, GraphQLUnionType)
+        ):
+            field_def = TypeNameMetaFieldDef
+        elif isinstance(parent_type, (GraphQLObjectType, GraphQLInterfaceType)):
+            field_def = parent_type.fields.get(field_name)
+        else:
+            return None
+
+        # Unknown fields are not remembered, they only come from invalid
+        # documents, whose names are not bounded.
+        if field_def is not None:
+            field_defs[field_name] = field_def
+        return field_def
+
+    def get_introspection_result(self, key):
+        # type: (Hashable) -> Optional[Dict[str, Any]]
+        """Returns a copy of the data of the introspection query identified by
+        the key, if it was cached."""
+        data = self._introspection_results.get(key)
+        return None if data is None else pickle.loads(data)
+
+    def cache_introspection_result(self, key, data):
+        # type: (Hashable, Dict[str, Any]) -> None
+        """Caches a copy of the data of an introspection query, so that the
+        data given and returned by the cache can be modified. The data is
+        kept pickled, as unpickling it is faster than copying it."""
+        self._introspection_results.set(
+            key, pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        )
+
+    def invalidate_caches(self):
+        # type: () -> None
+        """Drops the field definitions, suggestion indexes, introspection
+        results and types of type nodes derived from the schema, to be called
+        after changing its types."""
+        self._field_defs.clear()
+        self._suggestion_indexes.clear()
+        self._introspection_results.clear()
+        self._types_from_ast.clear()
+
+    def get_type_from_ast(self, type_node):
+        # type: (Union[ListType, NamedType, NonNullType]) -> Optional[GraphQLType]
+        """Returns the type a type node (e.g. of a variable definition or
+        fragment condition) refers to. List and non-null types are memoized
+        by their printed form, so the nodes referring to the same type get
+        the same instance."""
+        if isinstance(type_node, NamedType):
+            return self.get_type(type_node.name.value)
+
+        key = get_type_ast_key(type_node)
+        type = self._types_from_ast.get(key)
+        if type is None:
+            type = build_type_from_ast(self, type_node)
+            if type is not None:
+                self._types_from_ast.set(key, type)
+        return type
+
+    def get_suggestion_index(self, type_name=None):
+        # type: (Optional[str]) -> SuggestionIndex
+        """Returns an index suggesting the names of the types of the schema or,
+        given a type name, the names of the fields of that type. Indexes are
+        built on first use."""
+        index = self._suggestion_indexes.get(type_name)
+        if index is None:
+            if type_name is None:
+                names = list(self.get_type_map().keys())
+            else:
+                names = list(self.get_type(type_name).fields.keys())  # type: ignore
+            index = self._suggestion_indexes[type_name] = SuggestionIndex(names)
+        return index
+
     def get_directives(self):
         # type: () -> List[GraphQLDirective]
         return self._directives
 
     def get_directive(self, name):
         # type: (str) -> Optional[GraphQLDirective]
-        for directive in self.get_directives():
-            if directive.name == name:
-                return directive
-
-        return None
+        # The directives are indexed by name again whenever the list of them
+        # has changed, comparing it to a copy is cheaper than scanning it.
+        directives = self._directives
+        if directives != self._indexed_directives:
+            directive_map = {}  # type: Dict[str, GraphQLDirective]
+            for directive in directives:
+                directive_map.setdefault(directive.name, directive)
+            self._directive_map = directive_map
+            self._indexed_directives = directives[:]
+        return self._directive_map.get(name)
 
     def get_possible_types(self, abstract_type):
         # type: (Union[GraphQLInterfaceType, GraphQLUnionType]) -> List[GraphQLObjectType]
+        # The implementations of an interface may be found anywhere.
+        if self._pending_types is not None and isinstance(
+            abstract_type, GraphQLInterfaceType
+        ):
+            self._complete_type_map()
         return self._type_map.get_possible_types(abstract_type)
 
     def is_possible_type(
@@ -143,4 +368,8 @@ class GraphQLSchema(object):
         possible_type,  # type: GraphQLObjectType
     ):
         # type: (...) -> bool
+        if self._pending_types is not None and isinstance(
+            abstract_type, GraphQLInterfaceType
+        ):
+            self._complete_type_map()
         return self._type_map.is_possible_type(abstract_type, possible_type)
@@ -7,6 +7,8 @@ from graphql.type import (
     GraphQLEnumValue,
     GraphQLField,
     GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
     GraphQLObjectType,
     GraphQLSchema,
     GraphQLString,
@@ -291,3 +293,27 @@ def test_does_not_sort_values_when_using_ordered_dict():
     )
 
     assert [v.name for v in enum.values] == ["c", "b", "a", "d"]
+
+
+def test_serializes_lists_of_enum_values():
+    ListQueryType = GraphQLObjectType(
+        name="Query",
+        fields={
+            "colors": GraphQLField(
+                type=GraphQLList(ColorType), resolver=lambda *_: [2, None, 0, 7, 1]
+            ),
+            "nonNullColors": GraphQLField(
+                type=GraphQLList(GraphQLNonNull(ColorType)),
+                resolver=lambda *_: (color for color in [0, None]),
+            ),
+        },
+    )
+    result = graphql(GraphQLSchema(query=ListQueryType), "{ colors nonNullColors }")
+    assert result.data == {
+        "colors": ["BLUE", None, "RED", None, "GREEN"],
+        "nonNullColors": None,
+    }
+    assert [error.message for error in result.errors] == [
+        'Expected a value of type "Color" but received: 7',
+        "Cannot return null for non-nullable field Query.nonNullColors.",
+    ]
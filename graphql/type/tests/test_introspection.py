@@ -17,6 +17,7 @@ from graphql.type import (
     GraphQLSchema,
     GraphQLString,
 )
+from graphql.type.schema import INTROSPECTION_CACHE_SIZE
 from graphql.utils.introspection_query import introspection_query
 from graphql.validation.rules import ProvidedNonNullArguments
 
@@ -1162,3 +1163,64 @@ def test_exposes_descriptions_on_enums():
             ],
         }
     }
+
+
+def test_caches_the_results_of_introspection_queries():
+    schema = GraphQLSchema(
+        GraphQLObjectType(
+            "QueryRoot", {"f": GraphQLField(GraphQLString, resolver=lambda *_: "f")}
+        )
+    )
+    introspection = graphql(schema, introspection_query)
+    assert not introspection.errors
+    cached = graphql(schema, introspection_query)
+    assert cached.data == introspection.data
+    assert cached.data is not introspection.data
+
+    # The data of the results can be modified without affecting the cache.
+    type_count = len(introspection.data["__schema"]["types"])
+    introspection.data["__schema"]["types"].clear()
+    cached.data["__schema"]["types"].clear()
+    result = graphql(schema, introspection_query)
+    assert len(result.data["__schema"]["types"]) == type_count
+
+    query = "query Q($name: String!) { __type(name: $name) { name } }"
+    result = graphql(schema, query, variables={"name": "QueryRoot"})
+    assert result.data == {"__type": {"name": "QueryRoot"}}
+    assert graphql(schema, query, variables={"name": "QueryRoot"}).data == result.data
+    other = graphql(schema, query, variables={"name": "String"})
+    assert other.data == {"__type": {"name": "String"}}
+
+    # Queries selecting other fields are not cached.
+    result = graphql(schema, "{ __typename f }")
+    assert result.data == {"__typename": "QueryRoot", "f": "f"}
+    assert graphql(schema, "{ __typename f }").data is not result.data
+
+    schema.invalidate_caches()
+    assert len(schema._introspection_results) == 0
+    result = graphql(schema, introspection_query)
+    assert len(result.data["__schema"]["types"]) == type_count
+
+
+def test_caches_introspection_queries_by_their_printed_form():
+    schema = GraphQLSchema(
+        GraphQLObjectType(
+            "QueryRoot", {"f": GraphQLField(GraphQLString, resolver=lambda *_: "f")}
+        )
+    )
+    graphql(schema, introspection_query)
+    for spaces in range(2 * INTROSPECTION_CACHE_SIZE):
+        query = "{" + " " * spaces + "__typename }"
+        assert graphql(schema, query).data == {"__typename": "QueryRoot"}
+    # The variants of the query are cached once.
+    assert len(schema._introspection_results) == 2
+
+    for index in range(2 * INTROSPECTION_CACHE_SIZE):
+        query = "{ __typename alias%d: __typename }" % index
+        graphql(schema, query)
+        # The least recently used queries are dropped first.
+        graphql(schema, introspection_query)
+    assert len(schema._introspection_results) == INTROSPECTION_CACHE_SIZE
+    cached_operations = [key[0] for key in schema._introspection_results._data]
+    assert any("__schema" in operation for operation in cached_operations)
+    assert not any("alias0:" in operation for operation in cached_operations)
@@ -1,12 +1,27 @@
+from threading import Event, Thread
+
 from pytest import raises
 
+from ...language import ast
 from ...type import (
     GraphQLField,
+    GraphQLInt,
     GraphQLInterfaceType,
     GraphQLObjectType,
     GraphQLSchema,
     GraphQLString,
 )
+from ...type.directives import (
+    GraphQLDeprecatedDirective,
+    GraphQLDirective,
+    GraphQLSkipDirective,
+    specified_directives,
+)
+from ...type.introspection import (
+    SchemaMetaFieldDef,
+    TypeMetaFieldDef,
+    TypeNameMetaFieldDef,
+)
 
 interface_type = GraphQLInterfaceType(
     name="Interface",
@@ -42,3 +57,172 @@ def test_throws_human_readable_error_if_schematypes_not_defined():
         "Could not find possible implementing types for Interface in schema. Check that "
         "schema.types is defined and is an array ofall possible types in the schema."
     )
+
+
+def test_gets_field_definitions_including_meta_fields():
+    query_type = schema.get_query_type()
+    string_type = schema.get_type("String")
+    assert (
+        schema.get_field_def(query_type, "get_object")
+        is query_type.fields["get_object"]
+    )
+    assert schema.get_field_def(query_type, "__schema") is SchemaMetaFieldDef
+    assert schema.get_field_def(query_type, "__type") is TypeMetaFieldDef
+    assert schema.get_field_def(interface_type, "__schema") is None
+    assert schema.get_field_def(interface_type, "__typename") is TypeNameMetaFieldDef
+    assert schema.get_field_def(interface_type, "unknown") is None
+    assert schema.get_field_def(string_type, "__typename") is None
+
+    # Lookups are memoized once found.
+    assert schema.get_field_def(interface_type, "field_name") is (
+        schema.get_field_def(interface_type, "field_name")
+    )
+    assert "unknown" not in schema._field_defs[interface_type]
+
+
+def test_builds_schemas_deeper_than_the_recursion_limit():
+    type = GraphQLObjectType("Type0", {"field": GraphQLField(GraphQLString)})
+    for i in range(1, 2000):
+        type = GraphQLObjectType("Type{}".format(i), {"next": GraphQLField(type)})
+    deep_schema = GraphQLSchema(
+        GraphQLObjectType("Query", {"deep": GraphQLField(type)})
+    )
+    type_map = deep_schema.get_type_map()
+    assert list(type_map)[:3] == ["Query", "Type1999", "Type1998"]
+    assert "Type0" in type_map
+
+
+def test_can_skip_checking_types_assumed_to_be_valid():
+    object_type = GraphQLObjectType(
+        name="Object",
+        interfaces=[interface_type],
+        fields={"other": GraphQLField(GraphQLString)},
+        is_type_of=lambda *_: True,
+    )
+    query = GraphQLObjectType(
+        name="Query", fields={"object": GraphQLField(object_type)}
+    )
+    with raises(AssertionError):
+        GraphQLSchema(query)
+
+    valid_schema = GraphQLSchema(query, assume_valid=True)
+    assert valid_schema.is_possible_type(interface_type, object_type)
+
+
+def test_lazy_schemas_define_fields_when_first_used():
+    defined = []
+
+    def fields(name, fields):
+        def thunk():
+            defined.append(name)
+            return fields
+
+        return thunk
+
+    leaf_type = GraphQLObjectType(
+        "Leaf", fields("Leaf", {"name": GraphQLField(GraphQLString)})
+    )
+    lazy_object = GraphQLObjectType(
+        name="LazyObject",
+        interfaces=[interface_type],
+        fields=fields(
+            "LazyObject",
+            {
+                "field_name": GraphQLField(GraphQLString),
+                "leaf": GraphQLField(leaf_type),
+            },
+        ),
+        is_type_of=lambda *_: True,
+    )
+    query = GraphQLObjectType(
+        "Query", fields("Query", {"object": GraphQLField(lazy_object)})
+    )
+    lazy_schema = GraphQLSchema(query, types=[lazy_object], lazy=True)
+    assert defined == []
+    assert lazy_schema.get_type("LazyObject") is lazy_object
+    assert lazy_schema.get_field_def(query, "object").type is lazy_object
+    assert defined == ["Query"]
+
+    # Types only referenced by fields are found by defining the fields of
+    # the types referring to them.
+    assert lazy_schema.get_type("Leaf") is leaf_type
+    assert "Leaf" not in defined
+    assert "LazyObject" in defined
+    assert lazy_schema.get_type("Unknown") is None
+    assert sorted(defined) == ["LazyObject", "Leaf", "Query"]
+    assert list(lazy_schema.get_type_map()) == list(
+        GraphQLSchema(query, types=[lazy_object]).get_type_map()
+    )
+    assert lazy_schema.is_possible_type(interface_type, lazy_object)
+
+
+def test_lazy_schemas_can_be_used_from_many_threads():
+    types = [
+        GraphQLObjectType(
+            "Type{}".format(index), lambda: {"f": GraphQLField(GraphQLInt)}
+        )
+        for index in range(200)
+    ]
+    query = GraphQLObjectType(
+        "Query", lambda: {type.name: GraphQLField(type) for type in types}
+    )
+    lazy_schema = GraphQLSchema(query, lazy=True)
+    names = ["Int", "Type199", "Unknown"]
+    results = []
+    start = Event()
+
+    def use_schema():
+        start.wait()
+        results.append([lazy_schema.get_type(name) for name in names])
+        results.append(len(lazy_schema.get_type_map()))
+
+    threads = [Thread(target=use_schema) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+
+    expected_types = [GraphQLInt, types[-1], None]
+    type_count = len(GraphQLSchema(query).get_type_map())
+    assert results.count(expected_types) == len(threads)
+    assert results.count(type_count) == len(threads)
+
+
+def test_gets_directives_by_name():
+    first_skip = GraphQLDirective("skip", locations=["FIELD"])
+    directives = [first_skip] + specified_directives
+    directive_schema = GraphQLSchema(
+        query=schema.get_query_type(), directives=directives
+    )
+    assert directive_schema.get_directive("skip") is first_skip
+    assert directive_schema.get_directive("deprecated") is GraphQLDeprecatedDirective
+    assert directive_schema.get_directive("unknown") is None
+    assert schema.get_directive("skip") is GraphQLSkipDirective
+
+    # Changes to the list of directives are seen.
+    custom = GraphQLDirective("custom", locations=["FIELD"])
+    directive_schema.get_directives().append(custom)
+    assert directive_schema.get_directive("custom") is custom
+    directive_schema.get_directives()[0] = GraphQLSkipDirective
+    assert directive_schema.get_directive("skip") is GraphQLSkipDirective
+
+
+def string_list_type():
+    return ast.ListType(ast.NonNullType(ast.NamedType(ast.Name("String"))))
+
+
+def test_memoizes_types_of_type_nodes():
+    variable_type = string_list_type()
+    type = schema.get_type_from_ast(variable_type)
+    assert str(type) == "[String!]"
+    assert schema.get_type_from_ast(variable_type) is type
+    assert schema.get_type_from_ast(string_list_type()) is type
+    assert list(schema._types_from_ast._data) == ["[String!]"]
+
+    unknown_type = ast.ListType(ast.NamedType(ast.Name("Unknown")))
+    assert schema.get_type_from_ast(unknown_type) is None
+    assert "[Unknown]" not in schema._types_from_ast
+
+    schema.invalidate_caches()
+    assert schema.get_type_from_ast(variable_type) is not type
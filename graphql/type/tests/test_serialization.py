@@ -1,6 +1,17 @@
+from array import array
+
 import pytest
+from promise import Promise
 
-from ..scalars import GraphQLBoolean, GraphQLFloat, GraphQLInt, GraphQLString
+from ..scalars import (
+    GraphQLBoolean,
+    GraphQLFloat,
+    GraphQLID,
+    GraphQLInt,
+    GraphQLString,
+    _INT_TYPECODES,
+    _buffer_items,
+)
 from ..definition import GraphQLEnumType, GraphQLEnumValue
 from ...pyutils.compat import Enum
 
@@ -81,3 +92,82 @@ def test_serializes_enum():
     assert enum_type.serialize(Color.RED.value) == "RED"
     assert enum_type.serialize(Color.EXTRA) is None
     assert enum_type.serialize(Color.EXTRA.value) is None
+
+
+def test_serializes_many_enum_values():
+    class Color(Enum):
+        RED = 0
+        GREEN = 1
+
+    enum_type = GraphQLEnumType(
+        "Color", values={"RED": GraphQLEnumValue(0), "GREEN": GraphQLEnumValue(1)}
+    )
+    values = [Color.GREEN, 0, 1, Color.RED, Color.GREEN, "RED", None]
+    assert enum_type.serialize_many(values) == [
+        enum_type.serialize(value) for value in values
+    ]
+    assert enum_type.serialize_many(values) == [
+        "GREEN",
+        "RED",
+        "GREEN",
+        "RED",
+        "GREEN",
+        None,
+        None,
+    ]
+    assert enum_type.serialize_many([[0], 1]) == [None, "GREEN"]
+    assert enum_type.parse_value([0]) is None
+
+
+def test_serializes_many_scalar_values():
+    promise = Promise.resolve(1)
+    values = [1, 2 ** 31, -1.5, "1", True, None, promise]
+    assert GraphQLInt.serialize_many(values) == [1, None, None, None, None, None, None]
+    assert GraphQLFloat.serialize_many(values) == [
+        1.0,
+        float(2 ** 31),
+        -1.5,
+        None,
+        None,
+        None,
+        None,
+    ]
+    assert GraphQLString.serialize_many(values) == [
+        "1",
+        str(2 ** 31),
+        None,
+        "1",
+        None,
+        None,
+        None,
+    ]
+    assert GraphQLID.serialize_many(["a", 1, True]) == ["a", "1", None]
+    assert GraphQLBoolean.serialize_many(values) == [
+        None,
+        None,
+        None,
+        None,
+        True,
+        None,
+        None,
+    ]
+
+
+def test_serializes_arrays_of_numbers():
+    assert GraphQLInt.serialize_many(array("i", [1, -2])) == [1, -2]
+    assert GraphQLInt.serialize_many(array("q", [2 ** 31, 1])) == [None, 1]
+    assert GraphQLInt.serialize_many(array("d", [1.0])) == [None]
+    assert GraphQLFloat.serialize_many(array("d", [0.5])) == [0.5]
+    assert GraphQLFloat.serialize_many(memoryview(array("b", [3]))) == [3.0]
+
+
+@pytest.mark.skipif(
+    not hasattr(memoryview, "cast"), reason="memoryviews cannot be cast"
+)
+def test_serializes_only_flat_memoryviews_in_bulk():
+    matrix = memoryview(array("i", [1, 2, 3, 4])).cast("B").cast("i", [2, 2])
+    assert _buffer_items(matrix, _INT_TYPECODES) is None
+
+
+def test_serializes_many_floats_without_overflowing():
+    assert GraphQLFloat.serialize_many([1.5, 10 ** 400, 2]) == [1.5, None, 2.0]
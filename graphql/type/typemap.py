@@ -1,5 +1,4 @@
 from collections import OrderedDict, Sequence, defaultdict
-from functools import reduce
 
 from ..utils.type_comparators import is_equal_type, is_type_sub_type_of
 from .definition import (
@@ -22,11 +21,22 @@ if False:  # flake8: noqa
 
 
 class GraphQLTypeMap(OrderedDict):
-    def __init__(self, types):
-        # type: (List[GraphQLNamedType]) -> None
+    def __init__(
+        self,
+        types,  # type: List[GraphQLNamedType]
+        assume_valid=False,  # type: bool
+        follow_fields=True,  # type: bool
+        valid_types=None,  # type: Optional[Mapping[str, GraphQLNamedType]]
+    ):
+        # type: (...) -> None
         super(GraphQLTypeMap, self).__init__()
-        self.update(reduce(self.reducer, types, OrderedDict()))  # type: ignore
-        self._possible_type_map = defaultdict(set)  # type: DefaultDict[str, Set[str]]
+        # The valid types are taken as they are, so the types they refer to
+        # must be among them.
+        self.update(
+            self.reduce_types(
+                OrderedDict(valid_types or ()), types, assume_valid, follow_fields
+            )
+        )
 
         # Keep track of all implementations by interface name.
         self._implementations = defaultdict(
@@ -37,11 +47,24 @@ class GraphQLTypeMap(OrderedDict):
                 for interface in gql_type.interfaces:
                     self._implementations[interface.name].append(gql_type)
 
-        # Enforce correct interface implementations.
+        # Names of the possible types by abstract type name, computed upfront
+        # so that the map is never mutated once built.
+        self._possible_type_map = {}  # type: Dict[str, Set[str]]
         for type in self.values():
-            if isinstance(type, GraphQLObjectType):
-                for interface in type.interfaces:
-                    self.assert_object_implements_interface(self, type, interface)
+            if isinstance(type, (GraphQLInterfaceType, GraphQLUnionType)):
+                self._possible_type_map[type.name] = set(
+                    possible_type.name
+                    for possible_type in self.get_possible_types(type)
+                )
+
+        # Enforce correct interface implementations.
+        if not assume_valid:
+            for type in self.values():
+                if isinstance(type, GraphQLObjectType) and not (
+                    valid_types and type.name in valid_types
+                ):
+                    for interface in type.interfaces:
+                        self.assert_object_implements_interface(self, type, interface)
 
     def get_possible_types(self, abstract_type):
         # type: (Union[GraphQLInterfaceType, GraphQLUnionType]) -> List[GraphQLObjectType]
@@ -58,87 +81,123 @@ class GraphQLTypeMap(OrderedDict):
         possible_type,  # type: GraphQLObjectType
     ):
         # type: (...) -> bool
-        possible_types = self.get_possible_types(abstract_type)
-        assert possible_types, (
+        possible_type_names = self._possible_type_map.get(abstract_type.name)
+        if possible_type_names is None:
+            possible_type_names = set(
+                p.name for p in self.get_possible_types(abstract_type)
+            )
+        assert possible_type_names, (
             "Could not find possible implementing types for {} in "
             + "schema. Check that schema.types is defined and is an array of"
             + "all possible types in the schema."
         ).format(abstract_type)
 
-        if abstract_type.name not in self._possible_type_map:
-            self._possible_type_map[abstract_type.name].update(
-                [p.name for p in possible_types]
-            )
-
-        return possible_type.name in self._possible_type_map[abstract_type.name]
+        return possible_type.name in possible_type_names
 
     @classmethod
     def reducer(cls, map, type):
         # type: (Dict, Union[GraphQLNamedType, GraphQLList, GraphQLNonNull]) -> Dict
-        if not type:
-            return map
+        return cls.reduce_types(map, [type])
 
-        if isinstance(type, (GraphQLList, GraphQLNonNull)):
-            return cls.reducer(map, type.of_type)
+    @classmethod
+    def reduce_types(cls, map, types, assume_valid=False, follow_fields=True):
+        # type: (Dict, List[Any], bool, bool) -> Dict
+        """Adds the given types and the types they reference to the map, in
+        depth first order, and returns it. Unless `assume_valid` is set, the
+        fields and arguments of the added types are checked. Without
+        `follow_fields`, only the interfaces and union members are followed,
+        and the fields of the types are left undefined.
 
-        if type.name in map:
-            assert map[type.name] == type, (
-                'Schema must contain unique named types but contains multiple types named "{}".'
-            ).format(type.name)
+        The traversal uses a stack rather than recursion, so that the size of
+        the schema is not limited by the recursion limit."""
+        stack = list(reversed(types))  # type: List[Any]
+        while stack:
+            type = stack.pop()
+            while isinstance(type, (GraphQLList, GraphQLNonNull)):
+                type = type.of_type
+            if not type:
+                continue
 
-            return map
+            if type.name in map:
+                assert map[type.name] == type, (
+                    'Schema must contain unique named types but contains multiple types named "{}".'
+                ).format(type.name)
+                continue
 
-        map[type.name] = type  # type: ignore
+            map[type.name] = type  # type: ignore
 
-        reduced_map = map
+            if (
+                follow_fields
+                and not assume_valid
+                and isinstance(
+                    type,
+                    (GraphQLObjectType, GraphQLInterfaceType, GraphQLInputObjectType),
+                )
+            ):
+                type_is_input = isinstance(type, GraphQLInputObjectType)
+                for field_name, field in type.fields.items():
+                    cls.assert_valid_field(type, field_name, field, type_is_input)
 
-        if isinstance(type, (GraphQLUnionType)):
-            for t in type.types:
-                reduced_map = cls.reducer(reduced_map, t)
+            stack.extend(reversed(cls.get_referenced_types(type, follow_fields)))
+
+        return map
+
+    @staticmethod
+    def get_referenced_types(type, follow_fields=True):
+        # type: (Any, bool) -> List[Any]
+        """Returns the types a named type refers to, possibly wrapped: the
+        members of a union, the interfaces of an object type and, with
+        `follow_fields`, the types of the fields and their arguments."""
+        referenced = []  # type: List[Any]
+        if isinstance(type, GraphQLUnionType):
+            referenced.extend(type.types)
 
         if isinstance(type, GraphQLObjectType):
-            for t in type.interfaces:
-                reduced_map = cls.reducer(reduced_map, t)
+            referenced.extend(type.interfaces)
 
-        if isinstance(
+        if follow_fields and isinstance(
             type, (GraphQLObjectType, GraphQLInterfaceType, GraphQLInputObjectType)
         ):
-            field_map = type.fields
             type_is_input = isinstance(type, GraphQLInputObjectType)
-            for field_name, field in field_map.items():
-                if type_is_input:
-                    assert isinstance(
-                        field, GraphQLInputObjectField
-                    ), "{}.{} must be an instance of GraphQLInputObjectField.".format(
-                        type, field_name
-                    )
-                    assert is_input_type(
-                        field.type
-                    ), "{}.{} field type must be Input Type but got: {}.".format(
-                        type, field_name, field.type
-                    )
-                else:
-                    assert is_output_type(
-                        field.type
-                    ), "{}.{} field type must be Output Type but got: {}.".format(
-                        type, field_name, field.type
-                    )
-                    for arg_name, arg in field.args.items():
-                        assert isinstance(
-                            arg, (GraphQLArgument, GraphQLArgument)
-                        ), "{}.{}({}:) argument must be an instance of GraphQLArgument.".format(
-                            type, field_name, arg_name
-                        )
-                        assert is_input_type(
-                            arg.type
-                        ), "{}.{}({}:) argument type must be Input Type but got: {}.".format(
-                            type, field_name, arg_name, arg.type
-                        )
-                        reduced_map = cls.reducer(reduced_map, arg.type)
-
-                reduced_map = cls.reducer(reduced_map, getattr(field, "type", None))
-
-        return reduced_map
+            for field in type.fields.values():
+                if not type_is_input:
+                    referenced.extend(arg.type for arg in field.args.values())
+                referenced.append(getattr(field, "type", None))
+
+        return referenced
+
+    @staticmethod
+    def assert_valid_field(type, field_name, field, type_is_input):
+        # type: (Any, str, Any, bool) -> None
+        if type_is_input:
+            assert isinstance(
+                field, GraphQLInputObjectField
+            ), "{}.{} must be an instance of GraphQLInputObjectField.".format(
+                type, field_name
+            )
+            assert is_input_type(
+                field.type
+            ), "{}.{} field type must be Input Type but got: {}.".format(
+                type, field_name, field.type
+            )
+            return
+
+        assert is_output_type(
+            field.type
+        ), "{}.{} field type must be Output Type but got: {}.".format(
+            type, field_name, field.type
+        )
+        for arg_name, arg in field.args.items():
+            assert isinstance(
+                arg, (GraphQLArgument, GraphQLArgument)
+            ), "{}.{}({}:) argument must be an instance of GraphQLArgument.".format(
+                type, field_name, arg_name
+            )
+            assert is_input_type(
+                arg.type
+            ), "{}.{}({}:) argument type must be Input Type but got: {}.".format(
+                type, field_name, arg_name, arg.type
+            )
 
     @classmethod
     def assert_object_implements_interface(
@@ -0,0 +1,316 @@
+import re
+from collections import Counter
+
+from six import text_type
+
+from ..language.ast import Node
+from ..language.parser import Loc
+from ..language.source import Source
+from ..language.visitor_meta import QUERY_DOCUMENT_KEYS
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from typing import Any, Dict, List, Optional, Tuple
+
+__all__ = ["dump_ast", "load_ast"]
+
+MAGIC = b"GQLB"
+FORMAT_VERSION = 1
+
+# Node kinds are numbered by class name so that ids are stable across
+# processes and Python versions regardless of dict ordering.
+NODE_TYPES = sorted(QUERY_DOCUMENT_KEYS, key=lambda node_type: node_type.__name__)
+KIND_IDS = {node_type: kind for kind, node_type in enumerate(NODE_TYPES)}
+NODE_ATTRS = [
+    tuple(attr for attr in node_type.__slots__ if attr != "loc")
+    for node_type in NODE_TYPES
+]
+
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_STRING = 3
+TAG_LIST = 4
+# A node is tagged with TAG_NODE + its kind id.
+TAG_NODE = 5
+
+FLAG_LOCATIONS = 1
+
+MULTI_BYTE_VARINT_RE = re.compile(b"[\x80-\xff]+[\x00-\x7f]")
+
+
+def dump_ast(document, include_loc=False):
+    # type: (Node, bool) -> bytes
+    """Serializes an AST into a compact binary representation.
+
+    Every tag, length and index is written as an unsigned varint. Strings are
+    stored once in a table ordered by frequency, so the common ones are
+    referenced with a single byte.
+
+    Locations are left out unless `include_loc` is set, as they cost more
+    than the rest of the dump: they are delta encoded against the previously
+    written node, but the body of their sources has to be stored too. A dump
+    is then about twice the size of the source text, against under half of
+    it without locations.
+    """
+    counts = Counter()  # type: Counter
+    sources = []  # type: List[Source]
+    _collect(document, counts, sources, include_loc)
+    for source in sources:
+        counts[text_type(source.name)] += 1
+        counts[text_type(source.body)] += 1
+
+    # Ties are broken by the string itself so the output is deterministic.
+    strings = sorted(counts, key=lambda string: (-counts[string], string))
+    writer = _Writer(
+        {string: index for index, string in enumerate(strings)},
+        {id(source): index for index, source in enumerate(sources)},
+        include_loc,
+    )
+    writer.write_value(document)
+
+    out = bytearray(MAGIC)
+    _write_varint(out, FORMAT_VERSION)
+    _write_varint(out, FLAG_LOCATIONS if include_loc else 0)
+
+    _write_varint(out, len(strings))
+    for string in strings:
+        encoded = string.encode("utf-8")
+        _write_varint(out, len(encoded))
+        out += encoded
+
+    _write_varint(out, len(sources))
+    for source in sources:
+        _write_varint(out, writer.string_ids[text_type(source.name)])
+        _write_varint(out, writer.string_ids[text_type(source.body)])
+
+    out += writer.body
+    return bytes(out)
+
+
+def load_ast(data):
+    # type: (bytes) -> Any
+    """Loads an AST previously serialized with `dump_ast`."""
+    buf = bytearray(data)
+    if buf[:4] != MAGIC:
+        raise ValueError("Invalid AST dump: bad magic header.")
+
+    try:
+        return _load(buf)
+    except UnicodeDecodeError:
+        raise ValueError("Invalid AST dump: invalid UTF-8 string.")
+    except ValueError:
+        raise
+    except (IndexError, StopIteration):
+        raise ValueError("Invalid AST dump: truncated data.")
+    except Exception:
+        # Corrupted data can fail in many other ways, too deep a nesting of
+        # lists for instance, which are all reported alike.
+        raise ValueError("Invalid AST dump: malformed data.")
+
+
+def _load(buf):
+    # type: (bytearray) -> Any
+    version, offset = _read_varint(buf, 4)
+    if version != FORMAT_VERSION:
+        raise ValueError(
+            "Invalid AST dump: unsupported format version {}.".format(version)
+        )
+    flags, offset = _read_varint(buf, offset)
+
+    string_count, offset = _read_varint(buf, offset)
+    strings = []  # type: List[text_type]
+    for _ in range(string_count):
+        length, offset = _read_varint(buf, offset)
+        strings.append(bytes(buf[offset : offset + length]).decode("utf-8"))
+        offset += length
+
+    ints = _read_varints(buf, offset)
+    source_count = ints[0]
+    # Source reference 0 stands for a location without a source.
+    sources = [None]  # type: List[Optional[Source]]
+    for i in range(source_count):
+        sources.append(Source(strings[ints[2 + 2 * i]], strings[ints[1 + 2 * i]]))
+
+    values = iter(ints[1 + 2 * source_count :])
+    document = _build(values, strings, sources, flags & FLAG_LOCATIONS)
+    if next(values, None) is not None:
+        raise ValueError("Invalid AST dump: unexpected trailing data.")
+    return document
+
+
+def _collect(value, counts, sources, include_loc):
+    # type: (Any, Counter, List[Source], bool) -> None
+    if isinstance(value, Node):
+        kind = KIND_IDS.get(type(value))
+        if kind is None:
+            raise TypeError("Invalid AST Node: " + repr(value))
+        source = value.loc and value.loc.source
+        if include_loc and isinstance(source, Source):
+            if not any(source is seen for seen in sources):
+                sources.append(source)
+        for attr in NODE_ATTRS[kind]:
+            _collect(getattr(value, attr, None), counts, sources, include_loc)
+
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _collect(item, counts, sources, include_loc)
+
+    elif value is not None and not isinstance(value, bool):
+        counts[text_type(value)] += 1
+
+
+class _Writer(object):
+    __slots__ = ("string_ids", "source_ids", "include_loc", "body", "prev_start")
+
+    def __init__(self, string_ids, source_ids, include_loc):
+        # type: (Dict[text_type, int], Dict[int, int], bool) -> None
+        self.string_ids = string_ids
+        self.source_ids = source_ids
+        self.include_loc = include_loc
+        self.body = bytearray()
+        self.prev_start = 0
+
+    def write_value(self, value):
+        # type: (Any) -> None
+        body = self.body
+        if isinstance(value, Node):
+            kind = KIND_IDS[type(value)]
+            _write_varint(body, TAG_NODE + kind)
+            if self.include_loc:
+                self.write_loc(value.loc)
+            for attr in NODE_ATTRS[kind]:
+                self.write_value(getattr(value, attr, None))
+
+        elif value is None:
+            body.append(TAG_NONE)
+
+        elif value is True:
+            body.append(TAG_TRUE)
+
+        elif value is False:
+            body.append(TAG_FALSE)
+
+        elif isinstance(value, (list, tuple)):
+            body.append(TAG_LIST)
+            _write_varint(body, len(value))
+            for item in value:
+                self.write_value(item)
+
+        else:
+            body.append(TAG_STRING)
+            _write_varint(body, self.string_ids[text_type(value)])
+
+    def write_loc(self, loc):
+        # type: (Optional[Loc]) -> None
+        # A location is written as its source reference plus one (0 marks a
+        # missing location), the zigzag encoded delta from the previous start
+        # and its length.
+        body = self.body
+        if loc is None:
+            body.append(0)
+            return
+        source_id = self.source_ids.get(id(loc.source))
+        _write_varint(body, 1 if source_id is None else source_id + 2)
+        _write_varint(body, _zigzag(loc.start - self.prev_start))
+        _write_varint(body, loc.end - loc.start)
+        self.prev_start = loc.start
+
+
+def _build(values, strings, sources, with_loc):
+    # type: (Any, List[text_type], List[Optional[Source]], int) -> Any
+    next_value = values.__next__ if hasattr(values, "__next__") else values.next
+    node_types = NODE_TYPES
+    node_attrs = NODE_ATTRS
+    new = object.__new__
+    # Mutable cell holding the previous location start.
+    prev_start = [0]
+
+    def read_tagged(tag):
+        # type: (int) -> Any
+        if tag >= TAG_NODE:
+            kind = tag - TAG_NODE
+            if kind >= len(node_types):
+                raise ValueError("Invalid AST dump: unknown node kind {}.".format(kind))
+            node = new(node_types[kind])
+            loc_ref = next_value() if with_loc else 0
+            if loc_ref:
+                delta = next_value()
+                start = prev_start[0] + (
+                    -((delta + 1) >> 1) if delta & 1 else delta >> 1
+                )
+                prev_start[0] = start
+                node.loc = Loc(start, start + next_value(), sources[loc_ref - 1])
+            else:
+                node.loc = None
+
+            for attr in node_attrs[kind]:
+                # Inline the common leaf cases to avoid a call per attribute.
+                tag = next_value()
+                if tag == TAG_STRING:
+                    setattr(node, attr, strings[next_value()])
+                elif tag == TAG_NONE:
+                    setattr(node, attr, None)
+                else:
+                    setattr(node, attr, read_tagged(tag))
+            return node
+
+        if tag == TAG_LIST:
+            return [read_tagged(next_value()) for _ in range(next_value())]
+
+        if tag == TAG_STRING:
+            return strings[next_value()]
+
+        if tag == TAG_NONE:
+            return None
+
+        return tag == TAG_TRUE
+
+    return read_tagged(next_value())
+
+
+def _zigzag(value):
+    # type: (int) -> int
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def _write_varint(out, value):
+    # type: (bytearray, int) -> None
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf, offset):
+    # type: (bytearray, int) -> Tuple[int, int]
+    result = shift = 0
+    while True:
+        byte = buf[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+
+def _read_varints(buf, offset):
+    # type: (bytearray, int) -> List[int]
+    """Decodes every varint from offset to the end of the buffer.
+
+    Single byte values are copied over in bulk, only the multi-byte varints
+    found by the regex are decoded one at a time."""
+    values = []  # type: List[int]
+    extend = values.extend
+    append = values.append
+    for match in MULTI_BYTE_VARINT_RE.finditer(buf, offset):
+        start, end = match.span()
+        extend(buf[offset:start])
+        result = shift = 0
+        for byte in buf[start:end]:
+            result |= (byte & 0x7F) << shift
+            shift += 7
+        append(result)
+        offset = end
+    extend(buf[offset:])
+    return values
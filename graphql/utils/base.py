@@ -18,6 +18,14 @@ from .build_ast_schema import build_ast_schema
 # Extends an existing GraphQLSchema from a parsed GraphQL Schema language AST.
 from .extend_schema import extend_schema
 
+# Snapshot a GraphQLSchema, and restore it faster than it can be built.
+from .schema_snapshot import (
+    dump_schema_snapshot,
+    load_or_build_schema,
+    load_schema_snapshot,
+    schema_fingerprint,
+)
+
 # Print a GraphQLSchema to GraphQL Schema language.
 from .schema_printer import print_schema, print_introspection_schema
 
@@ -59,6 +67,10 @@ __all__ = [
     "build_client_schema",
     "build_ast_schema",
     "extend_schema",
+    "dump_schema_snapshot",
+    "load_or_build_schema",
+    "load_schema_snapshot",
+    "schema_fingerprint",
     "print_introspection_schema",
     "print_schema",
     "type_from_ast",
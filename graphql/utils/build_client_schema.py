@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from ..language.parser import parse_value
 from ..pyutils.ordereddict import OrderedDict
 from ..type import (
@@ -36,6 +38,12 @@ from ..type.introspection import (
 )
 from .value_from_ast import value_from_ast
 
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from ..language.ast import Value
+    from ..type.definition import GraphQLNamedType
+    from typing import Any, DefaultDict, Dict, Iterator, List, Optional
+
 
 def _false(*_):
     return False
@@ -49,10 +57,29 @@ def no_execution(root, info, **args):
     raise Exception("Client Schema cannot be used for execution.")
 
 
-def build_client_schema(introspection):
+def build_client_schema(
+    introspection,  # type: Dict[str, Any]
+    assume_valid=False,  # type: bool
+    previous_schema=None,  # type: Optional[GraphQLSchema]
+    previous_introspection=None,  # type: Optional[Dict[str, Any]]
+):
+    # type: (...) -> GraphQLSchema
+    """Builds a client schema from the result of an introspection query.
+
+    Every type is built in a single pass over the introspected types, the
+    types they refer to being looked up by name once all are built.
+    Introspection results of servers describe valid schemas, which
+    `assume_valid=True` skips checking again.
+
+    Given the `previous_schema` built by this function, and the
+    `previous_introspection` it was built from, the types whose
+    introspection did not change, and which only refer to such types, are
+    reused from the previous schema rather than built again."""
     schema_introspection = introspection["__schema"]
 
-    type_introspection_map = {t["name"]: t for t in schema_introspection["types"]}
+    type_introspection_map = OrderedDict(
+        (t["name"], t) for t in schema_introspection["types"]
+    )
 
     type_def_cache = {
         "String": GraphQLString,
@@ -91,17 +118,13 @@ def build_client_schema(introspection):
         return get_named_type(type_ref["name"])
 
     def get_named_type(type_name):
-        if type_name in type_def_cache:
-            return type_def_cache[type_name]
-
-        type_introspection = type_introspection_map.get(type_name)
-        if not type_introspection:
+        type_def = type_def_cache.get(type_name)
+        if type_def is None:
             raise Exception(
                 "Invalid or incomplete schema, unknown type: {}. Ensure that a full introspection query "
                 "is used in order to build a client schema.".format(type_name)
             )
 
-        type_def = type_def_cache[type_name] = build_type(type_introspection)
         return type_def
 
     def get_input_type(type_ref):
@@ -156,7 +179,7 @@ def build_client_schema(introspection):
         return GraphQLObjectType(
             name=object_introspection["name"],
             description=object_introspection.get("description"),
-            interfaces=[
+            interfaces=lambda: [
                 get_interface_type(i)
                 for i in object_introspection.get("interfaces", [])
             ],
@@ -175,7 +198,7 @@ def build_client_schema(introspection):
         return GraphQLUnionType(
             name=union_introspection["name"],
             description=union_introspection.get("description"),
-            types=[
+            types=lambda: [
                 get_object_type(t) for t in union_introspection.get("possibleTypes", [])
             ],
             resolve_type=no_execution,
@@ -241,7 +264,13 @@ def build_client_schema(introspection):
         if default_value is None:
             return None
 
-        return value_from_ast(parse_value(default_value), get_input_type(f["type"]))
+        # Default values are often alike, and much slower to parse than to
+        # convert.
+        value_ast = default_value_asts.get(default_value)
+        if value_ast is None:
+            value_ast = default_value_asts[default_value] = parse_value(default_value)
+
+        return value_from_ast(value_ast, get_input_type(f["type"]))
 
     def build_input_value_def_map(input_value_introspection, argument_type):
         return OrderedDict(
@@ -282,12 +311,27 @@ def build_client_schema(introspection):
             locations=locations,
         )
 
-    # Iterate through all types, getting the type definition for each, ensuring
-    # that any type not directly referenced by a field will get created.
-    types = [
-        get_named_type(type_introspection_name)
-        for type_introspection_name in type_introspection_map.keys()
-    ]
+    default_value_asts = {}  # type: Dict[str, Value]
+    if previous_schema is not None:
+        assert (
+            previous_introspection is not None
+        ), "Must provide the introspection the previous schema was built from."
+        type_def_cache.update(
+            get_unchanged_types(
+                previous_schema,
+                previous_introspection["__schema"]["types"],
+                type_introspection_map,
+            )
+        )
+
+    # Build all the types, ensuring that any type not directly referenced by
+    # a field will get created.
+    types = []
+    for type_name, type_introspection in type_introspection_map.items():
+        type_def = type_def_cache.get(type_name)
+        if type_def is None:
+            type_def = type_def_cache[type_name] = build_type(type_introspection)
+        types.append(type_def)
 
     query_type = get_object_type(schema_introspection["queryType"])
     mutation_type = (
@@ -313,4 +357,64 @@ def build_client_schema(introspection):
         subscription=subscription_type,
         directives=directives,
         types=types,
+        assume_valid=assume_valid,
+    )
+
+
+def get_unchanged_types(
+    previous_schema,  # type: GraphQLSchema
+    previous_type_introspections,  # type: List[Dict[str, Any]]
+    type_introspection_map,  # type: Dict[str, Dict[str, Any]]
+):
+    # type: (...) -> Dict[str, GraphQLNamedType]
+    """Returns the types of the previous schema that can be kept as they are:
+    those whose introspection is unchanged, and which do not refer, even
+    indirectly, to a changed type."""
+    previous_type_introspection_map = {
+        t["name"]: t for t in previous_type_introspections
+    }
+
+    changed = []
+    # Type name -> names of the types referring to it.
+    referrers = defaultdict(list)  # type: DefaultDict[str, List[str]]
+    for type_name, type_introspection in type_introspection_map.items():
+        if (
+            previous_type_introspection_map.get(type_name) != type_introspection
+            or previous_schema.get_type(type_name) is None
+        ):
+            changed.append(type_name)
+        for referenced_name in get_referenced_type_names(type_introspection):
+            referrers[referenced_name].append(type_name)
+
+    stale = set(changed)
+    while changed:
+        for referrer in referrers[changed.pop()]:
+            if referrer not in stale:
+                stale.add(referrer)
+                changed.append(referrer)
+
+    return {
+        type_name: previous_schema.get_type(type_name)
+        for type_name in type_introspection_map
+        if type_name not in stale
+    }
+
+
+def get_referenced_type_names(type_introspection):
+    # type: (Dict[str, Any]) -> Iterator[str]
+    type_refs = []  # type: List[Dict[str, Any]]
+    for field in type_introspection.get("fields") or ():
+        type_refs.append(field["type"])
+        type_refs.extend(arg["type"] for arg in field.get("args") or ())
+    type_refs.extend(
+        input_field["type"]
+        for input_field in type_introspection.get("inputFields") or ()
     )
+    type_refs.extend(type_introspection.get("interfaces") or ())
+    type_refs.extend(type_introspection.get("possibleTypes") or ())
+
+    for type_ref in type_refs:
+        while type_ref.get("kind") in (TypeKind.LIST, TypeKind.NON_NULL):
+            type_ref = type_ref.get("ofType") or {}
+        if type_ref.get("name"):
+            yield type_ref["name"]
@@ -16,6 +16,7 @@ from ..type.definition import (
     GraphQLObjectType,
     GraphQLScalarType,
     GraphQLUnionType,
+    get_named_type,
 )
 from ..type.introspection import (
     __Directive,
@@ -37,8 +38,13 @@ from ..type.scalars import (
 from ..type.schema import GraphQLSchema
 from .value_from_ast import value_from_ast
 
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from ..type.definition import GraphQLType
+    from typing import DefaultDict, Dict, List, Set
 
-def extend_schema(schema, documentAST=None):
+
+def extend_schema(schema, documentAST=None, incremental=False):
     """Produces a new schema given an existing schema and a document which may
     contain GraphQL type extensions and definitions. The original schema will
     remain unaltered.
@@ -48,7 +54,13 @@ def extend_schema(schema, documentAST=None):
     too late if subgraphs remain unchanged.
 
     This algorithm copies the provided schema, applying extensions while
-    producing the copy. The original schema remains unaltered."""
+    producing the copy. The original schema remains unaltered.
+
+    In `incremental` mode, only the extended types, and the types referring
+    to them, even indirectly, are copied: the other types of the schema are
+    reused as they are, and are not checked again. The copied types keep
+    their resolvers, so that the extended schema can still be executed; the
+    added fields use the default resolver."""
 
     assert isinstance(schema, GraphQLSchema), "Must provide valid GraphQLSchema"
     assert documentAST and isinstance(
@@ -105,6 +117,11 @@ def extend_schema(schema, documentAST=None):
 
             type_extensions_map[extended_type_name].append(_def)
 
+    # The existing types that must be copied in incremental mode.
+    affected_type_names = (
+        get_affected_type_names(schema, type_extensions_map) if incremental else None
+    )
+
     # Below are functions used for producing this schema that have closed over
     # this scope and have access to the schema, cache, and newly defined types.
 
@@ -134,6 +151,8 @@ def extend_schema(schema, documentAST=None):
 
         existing_type = schema.get_type(typeName)
         if existing_type:
+            if incremental and typeName not in affected_type_names:
+                return existing_type
             type_def = extend_type(existing_type)
             type_def_cache[typeName] = type_def
             return type_def
@@ -161,6 +180,7 @@ def extend_schema(schema, documentAST=None):
             description=type.description,
             interfaces=lambda: extend_implemented_interfaces(type),
             fields=lambda: extend_field_map(type),
+            is_type_of=type.is_type_of if incremental else None,
         )
 
     def extend_interface_type(type):
@@ -168,7 +188,9 @@ def extend_schema(schema, documentAST=None):
             name=type.name,
             description=type.description,
             fields=lambda: extend_field_map(type),
-            resolve_type=cannot_execute_client_schema,
+            resolve_type=type.resolve_type
+            if incremental
+            else cannot_execute_client_schema,
         )
 
     def extend_union_type(type):
@@ -176,7 +198,9 @@ def extend_schema(schema, documentAST=None):
             name=type.name,
             description=type.description,
             types=list(map(get_type_from_def, type.types)),
-            resolve_type=cannot_execute_client_schema,
+            resolve_type=type.resolve_type
+            if incremental
+            else cannot_execute_client_schema,
         )
 
     def extend_implemented_interfaces(type):
@@ -208,7 +232,9 @@ def extend_schema(schema, documentAST=None):
                 description=field.description,
                 deprecation_reason=field.deprecation_reason,
                 args=field.args,
-                resolver=cannot_execute_client_schema,
+                resolver=field.resolver
+                if incremental
+                else cannot_execute_client_schema,
             )
 
         # If there are any extensions to the fields, apply those here.
@@ -227,7 +253,7 @@ def extend_schema(schema, documentAST=None):
                 new_field_map[field_name] = GraphQLField(
                     build_field_type(field.type),
                     args=build_input_values(field.arguments),
-                    resolver=cannot_execute_client_schema,
+                    resolver=None if incremental else cannot_execute_client_schema,
                 )
 
         return new_field_map
@@ -382,8 +408,43 @@ def extend_schema(schema, documentAST=None):
         # Copy directives.
         directives=schema.get_directives(),
         types=types,
+        valid_types={
+            name: type
+            for name, type in schema.get_type_map().items()
+            if name not in affected_type_names
+        }
+        if incremental
+        else None,
     )
 
 
+def get_affected_type_names(schema, type_extensions_map):
+    # type: (GraphQLSchema, Dict[str, List[ast.TypeExtensionDefinition]]) -> Set[str]
+    """Returns the names of the extended types, and of the object, interface
+    and union types that refer to them, even indirectly. Only those types
+    need to be copied to extend the schema."""
+    # Type name -> names of the types referring to it.
+    referrers = defaultdict(list)  # type: DefaultDict[str, List[str]]
+    for type_name, type in schema.get_type_map().items():
+        referenced_types = []  # type: List[GraphQLType]
+        if isinstance(type, (GraphQLObjectType, GraphQLInterfaceType)):
+            referenced_types.extend(field.type for field in type.fields.values())
+        if isinstance(type, GraphQLObjectType):
+            referenced_types.extend(type.interfaces)
+        if isinstance(type, GraphQLUnionType):
+            referenced_types.extend(type.types)
+        for referenced_type in referenced_types:
+            referrers[get_named_type(referenced_type).name].append(type_name)
+
+    affected = list(type_extensions_map)
+    affected_type_names = set(affected)
+    while affected:
+        for referrer in referrers[affected.pop()]:
+            if referrer not in affected_type_names:
+                affected_type_names.add(referrer)
+                affected.append(referrer)
+    return affected_type_names
+
+
 def cannot_execute_client_schema(*args, **kwargs):
     raise Exception("Client Schema cannot be used for execution.")
@@ -0,0 +1,498 @@
+import hashlib
+import importlib
+import io
+import logging
+import os
+
+from six.moves import cPickle as pickle
+
+from ..pyutils.ordereddict import OrderedDict
+from ..type import (
+    GraphQLArgument,
+    GraphQLBoolean,
+    GraphQLEnumType,
+    GraphQLEnumValue,
+    GraphQLField,
+    GraphQLFloat,
+    GraphQLID,
+    GraphQLInputObjectField,
+    GraphQLInputObjectType,
+    GraphQLInt,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLScalarType,
+    GraphQLSchema,
+    GraphQLString,
+    GraphQLUnionType,
+)
+from ..type.directives import GraphQLDirective, specified_directives
+from ..type.introspection import (
+    __Directive,
+    __DirectiveLocation,
+    __EnumValue,
+    __Field,
+    __InputValue,
+    __Schema,
+    __Type,
+    __TypeKind,
+)
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from ..language.source import Source
+    from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the layout of the snapshots changes.
+SNAPSHOT_FORMAT = 2
+
+# The types every schema shares, which are referenced by name in snapshots.
+_standard_types = {
+    t.name: t
+    for t in (
+        GraphQLString,
+        GraphQLInt,
+        GraphQLFloat,
+        GraphQLBoolean,
+        GraphQLID,
+        __Schema,
+        __Directive,
+        __DirectiveLocation,
+        __Type,
+        __Field,
+        __InputValue,
+        __EnumValue,
+        __TypeKind,
+    )
+}
+_standard_directives = {d.name: d for d in specified_directives}
+
+# Markers of the wrapping types in the type references of snapshots.
+_LIST = 0
+_NON_NULL = 1
+
+
+def schema_fingerprint(*sources):
+    # type: (*Union[str, bytes, Source]) -> str
+    """Returns a fingerprint of the sources (SDL texts or Source objects) a
+    schema is built from, to tell apart the snapshots of different versions
+    of the schema, or of this library."""
+    from .. import __version__
+
+    digest = hashlib.sha1()
+    digest.update("{}:{}".format(__version__, SNAPSHOT_FORMAT).encode("utf-8"))
+    for source in sources:
+        source = getattr(source, "body", source)
+        if not isinstance(source, bytes):
+            source = source.encode("utf-8")
+        digest.update(b"\0")
+        digest.update(source)
+    return digest.hexdigest()
+
+
+def dump_schema_snapshot(schema, fingerprint):
+    # type: (GraphQLSchema, str) -> bytes
+    """Serializes a schema and everything it defines (types, fields,
+    arguments, directives, default and enum values) into a snapshot that
+    `load_schema_snapshot` restores much faster than the schema can be built
+    from SDL.
+
+    Resolvers and the other functions of the types (is_type_of,
+    resolve_type, the parse and serialize functions of scalars, ...) are
+    referenced by import path, so they must be importable: lambdas and
+    nested functions cannot be snapshotted, and a `ValueError` is raised for
+    them. A `TypeError` is raised for the types that are not of this library.
+    Default and enum values are pickled."""
+    encoded = (
+        tuple(
+            _encode_type(type)
+            for name, type in schema.get_type_map().items()
+            if _standard_types.get(name) is not type
+        ),
+        tuple(_encode_directive(directive) for directive in schema.get_directives()),
+        tuple(
+            root.name if root else None
+            for root in (
+                schema.get_query_type(),
+                schema.get_mutation_type(),
+                schema.get_subscription_type(),
+            )
+        ),
+    )
+    data = io.BytesIO()
+    pickle.dump((SNAPSHOT_FORMAT, fingerprint), data, pickle.HIGHEST_PROTOCOL)
+    pickle.dump(encoded, data, pickle.HIGHEST_PROTOCOL)
+    return data.getvalue()
+
+
+def load_schema_snapshot(data, fingerprint):
+    # type: (bytes, str) -> Optional[GraphQLSchema]
+    """Restores a schema from a snapshot made by `dump_schema_snapshot`.
+
+    None is returned if the snapshot was made with a different fingerprint,
+    by another version of this library, or refers to functions that cannot
+    be imported anymore: the schema must then be built again. Snapshots are
+    pickles, so only load the ones you made."""
+    data = io.BytesIO(data)
+    try:
+        header = pickle.load(data)
+    except Exception:
+        return None
+    if header != (SNAPSHOT_FORMAT, fingerprint):
+        return None
+
+    try:
+        encoded_types, encoded_directives, root_names = pickle.load(data)
+    except (ImportError, AttributeError):
+        return None
+
+    types = {}  # type: Dict[str, Any]
+    types.update(_standard_types)
+
+    def get_type(type_ref):
+        # type: (Any) -> Any
+        if isinstance(type_ref, tuple):
+            wrapper, of_type = type_ref
+            if wrapper == _LIST:
+                return GraphQLList(get_type(of_type))
+            return GraphQLNonNull(get_type(of_type))
+        return types[type_ref]
+
+    try:
+        for encoded_type in encoded_types:
+            type = _decode_type(encoded_type, get_type)
+            types[type.name] = type
+        directives = [
+            _decode_directive(directive, get_type) for directive in encoded_directives
+        ]
+    except (ImportError, AttributeError):
+        return None
+
+    query, mutation, subscription = (
+        types[name] if name else None for name in root_names
+    )
+    return GraphQLSchema(
+        query=query,
+        mutation=mutation,
+        subscription=subscription,
+        directives=directives,
+        types=[types[encoded_type[1]] for encoded_type in encoded_types],
+        # The schema was checked when the snapshot was made.
+        assume_valid=True,
+    )
+
+
+def load_or_build_schema(path, fingerprint, build):
+    # type: (str, str, Callable[[], GraphQLSchema]) -> GraphQLSchema
+    """Returns the schema snapshotted at `path` when it is up to date with
+    the fingerprint, and otherwise builds it by calling `build`, and writes
+    its snapshot for the next time. A schema that cannot be snapshotted, or
+    a snapshot that cannot be written, is logged and the built schema is
+    returned all the same."""
+    try:
+        with open(path, "rb") as snapshot:
+            schema = load_schema_snapshot(snapshot.read(), fingerprint)
+    except (IOError, OSError):
+        schema = None
+    if schema is not None:
+        return schema
+
+    schema = build()
+    try:
+        data = dump_schema_snapshot(schema, fingerprint)
+    except Exception:
+        logger.warning("Cannot snapshot the schema.", exc_info=True)
+        return schema
+
+    # Written aside then renamed, so that processes starting meanwhile never
+    # read a partial snapshot.
+    partial_path = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        with open(partial_path, "wb") as snapshot:
+            snapshot.write(data)
+        _replace(partial_path, path)
+    except (IOError, OSError):
+        logger.warning("Cannot write the schema snapshot %s.", path, exc_info=True)
+        try:
+            os.remove(partial_path)
+        except (IOError, OSError):
+            pass
+    return schema
+
+
+# os.rename does not overwrite an existing snapshot on Windows, os.replace
+# does but is only available on Python 3.
+_replace = getattr(os, "replace", os.rename)
+
+
+def _encode_type(type):
+    # type: (Any) -> Tuple
+    if type.__class__ not in _type_classes:
+        raise TypeError(
+            (
+                "Cannot snapshot {}: only the types of this library are supported, "
+                "not subclasses of them."
+            ).format(type)
+        )
+    if isinstance(type, GraphQLScalarType):
+        return (
+            "scalar",
+            type.name,
+            type.description,
+            _import_path(type.serialize),
+            _import_path(type.parse_value),
+            _import_path(type.parse_literal),
+            _import_path(type.serialize_many),
+        )
+    if isinstance(type, GraphQLObjectType):
+        return (
+            "object",
+            type.name,
+            type.description,
+            tuple(_encode_field(name, field) for name, field in type.fields.items()),
+            tuple(interface.name for interface in type.interfaces),
+            _import_path(type.is_type_of),
+        )
+    if isinstance(type, GraphQLInterfaceType):
+        return (
+            "interface",
+            type.name,
+            type.description,
+            tuple(_encode_field(name, field) for name, field in type.fields.items()),
+            _import_path(type.resolve_type),
+        )
+    if isinstance(type, GraphQLUnionType):
+        return (
+            "union",
+            type.name,
+            type.description,
+            tuple(possible_type.name for possible_type in type.types),
+            _import_path(type.resolve_type),
+        )
+    if isinstance(type, GraphQLEnumType):
+        return (
+            "enum",
+            type.name,
+            type.description,
+            tuple(
+                (value.name, value.value, value.deprecation_reason, value.description)
+                for value in type.values
+            ),
+        )
+    return (
+        "input_object",
+        type.name,
+        type.description,
+        tuple(_encode_input_value(name, field) for name, field in type.fields.items()),
+        _import_path(type.container_type),
+    )
+
+
+def _decode_type(encoded, get_type):
+    # type: (Tuple, Callable[[Any], Any]) -> Any
+    kind, name, description = encoded[:3]
+    if kind == "scalar":
+        serialize, parse_value, parse_literal, serialize_many = map(
+            _import, encoded[3:]
+        )
+        return GraphQLScalarType(
+            name,
+            description=description,
+            serialize=serialize,
+            parse_value=parse_value,
+            parse_literal=parse_literal,
+            serialize_many=serialize_many,
+        )
+    if kind == "object":
+        fields, interfaces, is_type_of = encoded[3:]
+        return GraphQLObjectType(
+            name,
+            fields=_fields_thunk(_decode_field, fields, get_type),
+            interfaces=lambda: [get_type(interface) for interface in interfaces],
+            is_type_of=_import(is_type_of),
+            description=description,
+        )
+    if kind == "interface":
+        fields, resolve_type = encoded[3:]
+        return GraphQLInterfaceType(
+            name,
+            fields=_fields_thunk(_decode_field, fields, get_type),
+            resolve_type=_import(resolve_type),
+            description=description,
+        )
+    if kind == "union":
+        possible_types, resolve_type = encoded[3:]
+        return GraphQLUnionType(
+            name,
+            types=lambda: [get_type(type) for type in possible_types],
+            resolve_type=_import(resolve_type),
+            description=description,
+        )
+    if kind == "enum":
+        return GraphQLEnumType(
+            name,
+            values=OrderedDict(
+                (
+                    value[0],
+                    GraphQLEnumValue(
+                        value[1], deprecation_reason=value[2], description=value[3]
+                    ),
+                )
+                for value in encoded[3]
+            ),
+            description=description,
+        )
+    fields, container_type = encoded[3:]
+    return GraphQLInputObjectType(
+        name,
+        fields=_fields_thunk(
+            _decode_input_value, fields, get_type, GraphQLInputObjectField
+        ),
+        description=description,
+        container_type=_import(container_type),
+    )
+
+
+def _encode_field(name, field):
+    # type: (str, GraphQLField) -> Tuple
+    return (
+        name,
+        _encode_type_ref(field.type),
+        tuple(
+            _encode_input_value(arg_name, arg) for arg_name, arg in field.args.items()
+        ),
+        _import_path(field.resolver),
+        field.deprecation_reason,
+        field.description,
+    )
+
+
+def _decode_field(encoded, get_type):
+    # type: (Tuple, Callable[[Any], Any]) -> Tuple[str, GraphQLField]
+    name, type_ref, args, resolver, deprecation_reason, description = encoded
+    return (
+        name,
+        GraphQLField(
+            get_type(type_ref),
+            args=OrderedDict(_decode_input_value(arg, get_type) for arg in args),
+            resolver=_import(resolver),
+            deprecation_reason=deprecation_reason,
+            description=description,
+        ),
+    )
+
+
+def _encode_input_value(name, value):
+    # type: (str, Union[GraphQLArgument, GraphQLInputObjectField]) -> Tuple
+    return (
+        name,
+        _encode_type_ref(value.type),
+        value.default_value,
+        value.description,
+        value.out_name,
+    )
+
+
+def _decode_input_value(encoded, get_type, cls=GraphQLArgument):
+    # type: (Tuple, Callable[[Any], Any], type) -> Tuple[str, Any]
+    name, type_ref, default_value, description, out_name = encoded
+    return (
+        name,
+        cls(
+            get_type(type_ref),
+            default_value=default_value,
+            description=description,
+            out_name=out_name,
+        ),
+    )
+
+
+def _fields_thunk(decode, fields, get_type, *args):
+    # type: (Callable, Tuple, Callable[[Any], Any], *Any) -> Callable[[], OrderedDict]
+    # Fields refer to types that may not be restored yet, so they are only
+    # decoded once all of them are.
+    return lambda: OrderedDict(decode(field, get_type, *args) for field in fields)
+
+
+def _encode_directive(directive):
+    # type: (GraphQLDirective) -> Union[str, Tuple]
+    if _standard_directives.get(directive.name) is directive:
+        return directive.name
+    return (
+        directive.name,
+        directive.description,
+        tuple(
+            _encode_input_value(arg_name, arg)
+            for arg_name, arg in directive.args.items()
+        ),
+        tuple(directive.locations),
+    )
+
+
+def _decode_directive(encoded, get_type):
+    # type: (Union[str, Tuple], Callable[[Any], Any]) -> GraphQLDirective
+    if not isinstance(encoded, tuple):
+        return _standard_directives[encoded]
+    name, description, args, locations = encoded
+    return GraphQLDirective(
+        name,
+        description=description,
+        args=OrderedDict(_decode_input_value(arg, get_type) for arg in args),
+        locations=list(locations),
+    )
+
+
+def _encode_type_ref(type):
+    # type: (Any) -> Any
+    if isinstance(type, GraphQLList):
+        return (_LIST, _encode_type_ref(type.of_type))
+    if isinstance(type, GraphQLNonNull):
+        return (_NON_NULL, _encode_type_ref(type.of_type))
+    return type.name
+
+
+def _import_path(func):
+    # type: (Optional[Callable]) -> Optional[str]
+    """Returns the path `func` is imported from, as "module:qualified.name"."""
+    if func is None:
+        return None
+    path = "{}:{}".format(
+        getattr(func, "__module__", None),
+        getattr(func, "__qualname__", getattr(func, "__name__", None)),
+    )
+    try:
+        imported = _import(path)
+    except (ImportError, AttributeError, TypeError):
+        imported = None
+    if imported is not func:
+        raise ValueError(
+            (
+                "Cannot snapshot {!r}: the functions of a schema must be importable "
+                "by their module and name."
+            ).format(func)
+        )
+    return path
+
+
+def _import(path):
+    # type: (Optional[str]) -> Any
+    if path is None:
+        return None
+    module_name, name = path.split(":")
+    imported = importlib.import_module(module_name)
+    for attr in name.split("."):
+        imported = getattr(imported, attr)
+    return imported
+
+
+_type_classes = (
+    GraphQLScalarType,
+    GraphQLObjectType,
+    GraphQLInterfaceType,
+    GraphQLUnionType,
+    GraphQLEnumType,
+    GraphQLInputObjectType,
+)
@@ -1,5 +1,9 @@
 from collections import OrderedDict
 
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from typing import Dict, Iterable, List, Tuple
+
 
 def suggestion_list(inp, options):
     """
@@ -8,9 +12,10 @@ def suggestion_list(inp, options):
     """
     options_by_distance = OrderedDict()
     input_threshold = len(inp) / 2
+    masks = _character_masks(inp)
 
     for option in options:
-        distance = lexical_distance(inp, option)
+        distance = _edit_distance(masks, len(inp), option)
         threshold = max(input_threshold, len(option) / 2, 1)
         if distance <= threshold:
             options_by_distance[option] = distance
@@ -20,6 +25,46 @@ def suggestion_list(inp, options):
     )
 
 
+class SuggestionIndex(object):
+    """Answers `suggestion_list` queries against a fixed list of options.
+
+    The options are grouped by length, since two strings are at least their
+    difference in length apart, and only the groups close enough to the
+    input are compared with it. Suggestions are returned in the same order
+    as `suggestion_list` would.
+    """
+
+    __slots__ = ("_by_length",)
+
+    def __init__(self, options):
+        # type: (Iterable[str]) -> None
+        # Length -> (position, option) for every distinct option.
+        self._by_length = {}  # type: Dict[int, List[Tuple[int, str]]]
+        seen = set()
+        for position, option in enumerate(options):
+            if option not in seen:
+                seen.add(option)
+                self._by_length.setdefault(len(option), []).append((position, option))
+
+    def suggest(self, inp):
+        # type: (str) -> List[str]
+        input_length = len(inp)
+        input_threshold = input_length / 2
+        masks = _character_masks(inp)
+        suggestions = []  # type: List[Tuple[int, int, str]]
+        for length, options in self._by_length.items():
+            threshold = max(input_threshold, length / 2, 1)
+            if abs(length - input_length) > threshold:
+                continue
+            for position, option in options:
+                distance = _edit_distance(masks, input_length, option)
+                if distance <= threshold:
+                    suggestions.append((distance, position, option))
+
+        suggestions.sort()
+        return [option for _, _, option in suggestions]
+
+
 def lexical_distance(a, b):
     """
      Computes the lexical distance between strings A and B.
@@ -50,3 +95,47 @@ def lexical_distance(a, b):
                 d[i][j] = min(d[i][j], d[i - 2][j - 2] + cost)
 
     return d[len(a)][len(b)]
+
+
+def _character_masks(inp):
+    # type: (str) -> Dict[str, int]
+    """Maps each character of the input to the bit mask of its positions."""
+    masks = {}  # type: Dict[str, int]
+    for i, char in enumerate(inp):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _edit_distance(masks, length, option):
+    # type: (Dict[str, int], int, str) -> int
+    """
+     Computes the same distance as `lexical_distance` between the input whose
+     character masks are given and the option, using the bit-parallel
+     algorithm of Myers (as adapted by Hyyroe for edit distance): a column of
+     the distance matrix is held in two bit vectors of vertical +1/-1 deltas,
+     and updated for each character of the option with a few integer
+     operations instead of one per cell.
+    """
+    if not length:
+        return len(option)
+
+    all_ones = (1 << length) - 1
+    last_row = 1 << (length - 1)
+    positive = all_ones
+    negative = 0
+    distance = length
+    for char in option:
+        eq = masks.get(char, 0)
+        vertical = eq | negative
+        horizontal = (((eq & positive) + positive) ^ positive) | eq
+        positive_h = negative | ~(horizontal | positive)
+        negative_h = positive & horizontal
+        if positive_h & last_row:
+            distance += 1
+        elif negative_h & last_row:
+            distance -= 1
+        positive_h = (positive_h << 1) | 1
+        negative_h <<= 1
+        positive = (negative_h | ~(vertical | positive_h)) & all_ones
+        negative = positive_h & vertical & all_ones
+    return distance
@@ -0,0 +1,117 @@
+from pytest import raises
+
+from graphql.language import ast
+from graphql.language.parser import Loc, parse
+from graphql.language.printer import print_ast
+from graphql.language.source import Source
+from graphql.language.tests.fixtures import KITCHEN_SINK, SCHEMA_KITCHEN_SINK
+from graphql.utils.ast_binary import dump_ast, load_ast
+from graphql.utils.concat_ast import concat_ast
+
+
+def test_round_trips_kitchen_sink():
+    document = parse(KITCHEN_SINK)
+    loaded = load_ast(dump_ast(document))
+    assert loaded == document
+    assert print_ast(loaded) == print_ast(document)
+
+
+def test_round_trips_schema_kitchen_sink():
+    document = parse(SCHEMA_KITCHEN_SINK)
+    loaded = load_ast(dump_ast(document))
+    assert loaded == document
+    assert print_ast(loaded) == print_ast(document)
+
+
+def test_preserves_locations_and_shares_source():
+    source = Source('query Q { a(x: [1, -2.5, "s"]) { b ...F } } fragment F on T { c }')
+    document = parse(source)
+    loaded = load_ast(dump_ast(document, include_loc=True))
+
+    operation = loaded.definitions[0]
+    original_operation = document.definitions[0]
+    assert operation.loc == original_operation.loc
+    field = operation.selection_set.selections[0]
+    original_field = original_operation.selection_set.selections[0]
+    assert field.loc == original_field.loc
+    assert field.arguments[0].value.loc == original_field.arguments[0].value.loc
+    assert operation.loc.source is loaded.definitions[1].loc.source
+    assert operation.loc.source == source
+
+
+def test_round_trips_without_locations():
+    document = parse(KITCHEN_SINK)
+    data = dump_ast(document)
+    loaded = load_ast(data)
+    assert loaded == document
+    assert loaded.loc is None
+    assert loaded.definitions[0].selection_set.loc is None
+    assert len(data) < len(dump_ast(document, include_loc=True))
+
+
+def test_round_trips_locations_from_several_sources():
+    document = concat_ast([parse("{ a }"), parse("{ b }", no_source=True)])
+    loaded = load_ast(dump_ast(document, include_loc=True))
+    assert loaded.loc is None
+    first, second = loaded.definitions
+    assert first.loc == Loc(0, 5, Source("{ a }"))
+    assert second.loc == Loc(0, 5)
+
+
+def test_round_trips_hand_built_nodes():
+    node = ast.Field(
+        name=ast.Name(value=u"caf\xe9"),
+        arguments=[
+            ast.Argument(
+                name=ast.Name(value="flag"), value=ast.BooleanValue(value=False)
+            )
+        ],
+    )
+    loaded = load_ast(dump_ast(node))
+    assert loaded == node
+    assert loaded.name.value == u"caf\xe9"
+    assert loaded.arguments[0].value.value is False
+    assert loaded.directives is None
+
+
+def test_round_trips_many_distinct_strings():
+    body = " ".join("f{}: field{}(arg: {})".format(i, i, i) for i in range(500))
+    document = parse("{ " + body + " }")
+    loaded = load_ast(dump_ast(document, include_loc=True))
+    assert loaded == document
+    assert loaded.definitions[0].selection_set.selections[-1].loc == (
+        document.definitions[0].selection_set.selections[-1].loc
+    )
+
+
+def test_rejects_invalid_data():
+    with raises(ValueError) as excinfo:
+        load_ast(b"not an ast")
+    assert "bad magic header" in str(excinfo.value)
+
+    data = dump_ast(parse(KITCHEN_SINK), include_loc=True)
+    with raises(ValueError) as excinfo:
+        load_ast(data[: len(data) // 2])
+    assert "truncated data" in str(excinfo.value)
+
+
+def test_rejects_malformed_data():
+    with raises(ValueError) as excinfo:
+        load_ast(dump_ast(parse("{ a }")) + b"\x00")
+    assert "unexpected trailing data" in str(excinfo.value)
+
+    # The header of a dump without strings nor sources.
+    header = b"GQLB\x01\x00\x00\x00"
+    with raises(ValueError) as excinfo:
+        load_ast(header + b"\x84\x01")
+    assert "unknown node kind 127" in str(excinfo.value)
+
+    with raises(ValueError) as excinfo:
+        load_ast(header + b"\x04\x01" * 100000 + b"\x00")
+    assert "malformed data" in str(excinfo.value)
+
+
+def test_rejects_dumping_invalid_nodes():
+    with raises(TypeError) as excinfo:
+        dump_ast(ast.Document(definitions=[ast.Node()]))
+    assert str(excinfo.value).startswith("Invalid AST Node: ")
@@ -803,3 +803,45 @@ def test_fails_on_a_very_deep_non_null():
         build_client_schema(introspection.data)
 
     assert str(excinfo.value) == "Decorated type deeper than introspection query."
+
+
+def test_rebuilds_only_the_changed_types():
+    def build_server_schema(pet_description):
+        pet = GraphQLObjectType(
+            "Pet", {"name": GraphQLField(GraphQLString)}, description=pet_description
+        )
+        color = GraphQLEnumType(
+            "Color", {"RED": GraphQLEnumValue(0), "BLUE": GraphQLEnumValue(1)}
+        )
+        owner = GraphQLObjectType(
+            "Owner", lambda: {"pet": GraphQLField(pet), "color": GraphQLField(color)}
+        )
+        return GraphQLSchema(
+            query=GraphQLObjectType(
+                name="Query",
+                fields={
+                    "owner": GraphQLField(owner),
+                    "color": GraphQLField(
+                        color, args={"like": GraphQLArgument(color, default_value=1)}
+                    ),
+                },
+            )
+        )
+
+    introspection = graphql(build_server_schema("A pet."), introspection_query).data
+    schema = build_client_schema(introspection, assume_valid=True)
+    new_introspection = graphql(build_server_schema("A pet!"), introspection_query).data
+    new_schema = build_client_schema(
+        new_introspection, previous_schema=schema, previous_introspection=introspection
+    )
+
+    assert new_schema.get_type("Color") is schema.get_type("Color")
+    assert new_schema.get_type("String") is GraphQLString
+    for type_name in ("Pet", "Owner", "Query"):
+        assert new_schema.get_type(type_name) is not schema.get_type(type_name)
+    assert new_schema.get_type("Pet").description == "A pet!"
+    assert new_schema.get_type("Owner").fields["pet"].type is new_schema.get_type("Pet")
+    assert (
+        graphql(new_schema, introspection_query).data
+        == graphql(build_client_schema(new_introspection), introspection_query).data
+    )
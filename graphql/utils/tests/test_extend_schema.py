@@ -845,3 +845,42 @@ def test_does_not_allow_extending_a_scalar():
         extend_schema(test_schema, ast)
 
     assert str(exc_info.value) == 'Cannot extend non-object type "String".'
+
+
+def test_incrementally_copies_only_the_affected_types():
+    ast = parse(
+        """
+      extend type Biz {
+        buzz: String
+      }
+
+      extend type Query {
+        newField: String
+      }
+    """
+    )
+    original_print = print_schema(test_schema)
+    extended_schema = extend_schema(test_schema, ast, incremental=True)
+
+    assert print_schema(test_schema) == original_print
+    assert print_schema(extended_schema) == print_schema(
+        extend_schema(test_schema, ast)
+    )
+    for type_name in ("Foo", "Bar", "SomeInterface", "SomeEnum", "String"):
+        assert extended_schema.get_type(type_name) is test_schema.get_type(type_name)
+    for type_name in ("Biz", "SomeUnion", "Query"):
+        assert extended_schema.get_type(type_name) is not test_schema.get_type(
+            type_name
+        )
+    assert "buzz" in extended_schema.get_type("Biz").fields
+
+    class Foo(object):
+        name = "foo"
+
+    class Root(object):
+        newField = "new"
+        foo = Foo()
+
+    result = execute(extended_schema, parse("{ newField foo { name } }"), Root())
+    assert not result.errors
+    assert result.data == {"newField": "new", "foo": {"name": "foo"}}
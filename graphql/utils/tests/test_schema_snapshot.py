@@ -0,0 +1,209 @@
+from collections import OrderedDict
+
+from pytest import raises
+
+from graphql import graphql, parse
+from graphql.type import (
+    GraphQLArgument,
+    GraphQLEnumType,
+    GraphQLEnumValue,
+    GraphQLField,
+    GraphQLInt,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+from graphql.utils.build_ast_schema import build_ast_schema
+from graphql.utils.introspection_query import introspection_query
+from graphql.utils.schema_printer import print_schema
+from graphql.utils.schema_snapshot import (
+    dump_schema_snapshot,
+    load_or_build_schema,
+    load_schema_snapshot,
+    schema_fingerprint,
+)
+
+SDL = """
+schema {
+  query: Query
+}
+
+directive @cost(value: Int = 1) on FIELD_DEFINITION
+
+interface Named {
+  name: String
+}
+
+type Dog implements Named {
+  name: String
+  barks: Boolean @deprecated(reason: "Quiet")
+}
+
+union Pet = Dog
+
+enum Color {
+  RED
+  BLUE
+}
+
+input Filter {
+  color: Color = RED
+  names: [String!]
+}
+
+scalar Date
+
+type Query {
+  pets(filter: Filter, first: Int = 10): [Pet]
+  named: Named
+  today: Date
+}
+"""
+
+
+def resolve_greeting(root, info, name):
+    return "Hello {}".format(name)
+
+
+def test_restores_schemas_built_from_sdl():
+    schema = build_ast_schema(parse(SDL))
+    fingerprint = schema_fingerprint(SDL)
+    restored = load_schema_snapshot(
+        dump_schema_snapshot(schema, fingerprint), fingerprint
+    )
+
+    assert print_schema(restored) == print_schema(schema)
+    assert list(restored.get_type_map()) == list(schema.get_type_map())
+    assert restored.get_type("String") is GraphQLString
+    assert (
+        graphql(restored, introspection_query).data
+        == graphql(schema, introspection_query).data
+    )
+
+
+def test_restores_resolvers_and_values():
+    color = GraphQLEnumType(
+        "Color",
+        OrderedDict([("RED", GraphQLEnumValue(0)), ("BLUE", GraphQLEnumValue(1))]),
+    )
+    schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            OrderedDict(
+                [
+                    (
+                        "greeting",
+                        GraphQLField(
+                            GraphQLString,
+                            args={
+                                "name": GraphQLArgument(
+                                    GraphQLString, default_value="world"
+                                )
+                            },
+                            resolver=resolve_greeting,
+                        ),
+                    ),
+                    ("color", GraphQLField(color, resolver=lambda *_: 1)),
+                ]
+            ),
+        )
+    )
+
+    with raises(ValueError) as excinfo:
+        dump_schema_snapshot(schema, "fingerprint")
+    assert "must be importable" in str(excinfo.value)
+
+    del schema.get_query_type().fields["color"]
+    schema.get_query_type().fields["count"] = GraphQLField(GraphQLInt, resolver=len)
+    restored = load_schema_snapshot(
+        dump_schema_snapshot(schema, "fingerprint"), "fingerprint"
+    )
+    result = graphql(restored, '{ greeting count: greeting(name: "you") }')
+    assert not result.errors
+    assert result.data == {"greeting": "Hello world", "count": "Hello you"}
+    restored_color = load_schema_snapshot(
+        dump_schema_snapshot(
+            GraphQLSchema(GraphQLObjectType("Query", {"color": GraphQLField(color)})),
+            "fingerprint",
+        ),
+        "fingerprint",
+    ).get_type("Color")
+    assert [value.value for value in restored_color.values] == [0, 1]
+
+
+def test_rejects_types_not_of_this_library():
+    class CustomObjectType(GraphQLObjectType):
+        pass
+
+    schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "custom": GraphQLField(
+                    CustomObjectType("Custom", {"a": GraphQLField(GraphQLString)})
+                )
+            },
+        )
+    )
+    with raises(TypeError) as excinfo:
+        dump_schema_snapshot(schema, "fingerprint")
+    assert "only the types of this library are supported" in str(excinfo.value)
+
+
+def test_replaces_existing_snapshots(tmpdir):
+    path = tmpdir.join("schema.snapshot")
+    path.write_binary(b"stale")
+
+    load_or_build_schema(
+        str(path), schema_fingerprint(SDL), lambda: build_ast_schema(parse(SDL))
+    )
+    assert load_schema_snapshot(path.read_binary(), schema_fingerprint(SDL))
+    assert tmpdir.listdir() == [path]
+
+
+def test_rejects_stale_snapshots():
+    schema = build_ast_schema(parse(SDL))
+    snapshot = dump_schema_snapshot(schema, schema_fingerprint(SDL))
+
+    assert load_schema_snapshot(snapshot, schema_fingerprint(SDL + " ")) is None
+    assert load_schema_snapshot(b"garbage", schema_fingerprint(SDL)) is None
+    assert schema_fingerprint(SDL) == schema_fingerprint(SDL.encode("utf-8"))
+
+
+def test_builds_missing_or_stale_snapshots(tmpdir):
+    path = str(tmpdir.join("schema.snapshot"))
+    builds = []
+
+    def build():
+        builds.append(True)
+        return build_ast_schema(parse(SDL))
+
+    schema = load_or_build_schema(path, schema_fingerprint(SDL), build)
+    restored = load_or_build_schema(path, schema_fingerprint(SDL), build)
+    assert len(builds) == 1
+    assert print_schema(restored) == print_schema(schema)
+
+    load_or_build_schema(path, schema_fingerprint(SDL, "extension"), build)
+    assert len(builds) == 2
+    assert tmpdir.listdir() == [tmpdir.join("schema.snapshot")]
+
+
+def test_returns_built_schemas_that_cannot_be_snapshotted(tmpdir):
+    def build():
+        return GraphQLSchema(
+            GraphQLObjectType(
+                "Query", {"a": GraphQLField(GraphQLString, resolver=lambda *_: "a")}
+            )
+        )
+
+    path = str(tmpdir.join("schema.snapshot"))
+    schema = load_or_build_schema(path, "fingerprint", build)
+    assert graphql(schema, "{ a }").data == {"a": "a"}
+    assert tmpdir.listdir() == []
+
+    path = str(tmpdir.join("missing", "schema.snapshot"))
+    schema = load_or_build_schema(
+        path, schema_fingerprint(SDL), lambda: build_ast_schema(parse(SDL))
+    )
+    assert print_schema(schema) == print_schema(build_ast_schema(parse(SDL)))
+    assert tmpdir.listdir() == []
@@ -1,4 +1,10 @@
-from graphql.utils.suggestion_list import suggestion_list
+from graphql.utils.suggestion_list import (
+    SuggestionIndex,
+    _character_masks,
+    _edit_distance,
+    lexical_distance,
+    suggestion_list,
+)
 
 
 def test_returns_results_when_input_is_empty():
@@ -17,3 +23,18 @@ def test_returns_options_sorted_based_on_similarity():
         "stomer",
         "store",
     ]
+
+
+def test_edit_distance_matches_lexical_distance():
+    words = ["", "a", "ab", "ba", "abc", "acb", "aab", "customer", "csutomer", "stomer"]
+    for a in words:
+        masks = _character_masks(a)
+        for b in words:
+            assert _edit_distance(masks, len(a), b) == lexical_distance(a, b)
+
+
+def test_suggestion_index_gives_the_same_suggestions():
+    options = ["customer", "stomer", "store", "a", "ab", "abc", "ab", "Customer"]
+    index = SuggestionIndex(options)
+    for inp in ["", "a", "abc", "csutomer", "store", "CUSTOMER", "xyz"]:
+        assert index.suggest(inp) == suggestion_list(inp, options)
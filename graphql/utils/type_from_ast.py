@@ -10,13 +10,20 @@ if False:  # flake8: noqa
 
 
 def type_from_ast(schema, type_node):
+    # type: (GraphQLSchema, Union[ListType, NamedType, NonNullType]) -> Union[GraphQLList, GraphQLNonNull, GraphQLNamedType]
+    """Returns the type of the schema a type node refers to, memoized by the
+    schema."""
+    return schema.get_type_from_ast(type_node)  # type: ignore
+
+
+def build_type_from_ast(schema, type_node):
     # type: (GraphQLSchema, Union[ListType, NamedType, NonNullType]) -> Union[GraphQLList, GraphQLNonNull, GraphQLNamedType]
     if isinstance(type_node, ast.ListType):
-        inner_type = type_from_ast(schema, type_node.type)
+        inner_type = build_type_from_ast(schema, type_node.type)
         return inner_type and GraphQLList(inner_type)
 
     elif isinstance(type_node, ast.NonNullType):
-        inner_type = type_from_ast(schema, type_node.type)
+        inner_type = build_type_from_ast(schema, type_node.type)
         return inner_type and GraphQLNonNull(inner_type)  # type: ignore
 
     elif isinstance(type_node, ast.NamedType):
@@ -24,3 +31,19 @@ def type_from_ast(schema, type_node):
         return schema_type  # type: ignore
 
     raise Exception("Unexpected type kind: {type_kind}".format(type_kind=type_node))
+
+
+def get_type_ast_key(type_node):
+    # type: (Union[ListType, NamedType, NonNullType]) -> str
+    """Returns the type a type node refers to as printed, e.g. `[Int!]`,
+    which is the same for every node referring to that type."""
+    if isinstance(type_node, ast.ListType):
+        return "[{}]".format(get_type_ast_key(type_node.type))
+
+    elif isinstance(type_node, ast.NonNullType):
+        return "{}!".format(get_type_ast_key(type_node.type))
+
+    elif isinstance(type_node, ast.NamedType):
+        return type_node.name.value
+
+    raise Exception("Unexpected type kind: {type_kind}".format(type_kind=type_node))
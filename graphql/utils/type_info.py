@@ -126,7 +126,10 @@ class TypeInfo(object):
         parent_type = self.get_parent_type()
         field_def = None
         if parent_type:
-            field_def = self._get_field_def_fn(self._schema, parent_type, node)
+            if self._get_field_def_fn is get_field_def:
+                field_def = self._schema.get_field_def(parent_type, node.name.value)
+            else:
+                field_def = self._get_field_def_fn(self._schema, parent_type, node)
         self._field_def_stack.append(field_def)
         self._type_stack.append(field_def.type if field_def else None)
 
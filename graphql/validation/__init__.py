@@ -1,4 +1,5 @@
 from .validation import validate
+from .batch import validate_documents
 from .rules import specified_rules
 
-__all__ = ["validate", "specified_rules"]
+__all__ = ["validate", "validate_documents", "specified_rules"]
@@ -0,0 +1,141 @@
+import multiprocessing
+import os
+
+from ..error import GraphQLError
+from ..language.visitor import Visitor, walk
+from .rules import specified_rules
+from .validation import validate
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from ..language.ast import Document, Node
+    from ..type.schema import GraphQLSchema
+    from .rules.base import ValidationRule
+    from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+# The schema, documents and rules validated by a worker process, given to it
+# by the pool that forked it, so that none of them has to be pickled.
+_worker_batch = None  # type: Optional[Tuple[GraphQLSchema, List[Document], List[Any]]]
+
+
+def validate_documents(
+    schema,  # type: GraphQLSchema
+    documents,  # type: Iterable[Document]
+    rules=specified_rules,  # type: List[Type[ValidationRule]]
+    processes=None,  # type: Optional[int]
+    chunk_size=None,  # type: Optional[int]
+):
+    # type: (...) -> List[List]
+    """Validates many documents against the same schema, returning the list
+    of errors of each document, as `validate` would.
+
+    The documents are spread over a pool of `processes` forked workers (as
+    many as there are CPUs by default). The workers send back the messages
+    of the errors and where their nodes are in the documents, so that the
+    errors returned refer to the given documents. Where processes cannot be
+    forked, or with a single process, the documents are validated one after
+    another."""
+    documents = list(documents)
+    context = _get_fork_context()
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    if context is None or processes < 2 or len(documents) < 2:
+        return [validate(schema, document, rules) for document in documents]
+
+    pool = context.Pool(processes, _init_worker, (schema, documents, rules))
+    try:
+        results = pool.map(_validate_document, range(len(documents)), chunk_size)
+    finally:
+        pool.close()
+        pool.join()
+
+    return [
+        validate(schema, document, rules)
+        if encoded_errors is None
+        else _decode_errors(document, encoded_errors)
+        for document, encoded_errors in zip(documents, results)
+    ]
+
+
+def _init_worker(schema, documents, rules):
+    # type: (GraphQLSchema, List[Document], List[Any]) -> None
+    global _worker_batch
+    _worker_batch = (schema, documents, rules)
+
+
+def _validate_document(index):
+    # type: (int) -> Optional[List[Tuple[str, Optional[List[Tuple]]]]]
+    schema, documents, rules = _worker_batch  # type: ignore
+    document = documents[index]
+    return _encode_errors(document, validate(schema, document, rules))
+
+
+def _encode_errors(document, errors):
+    # type: (Document, List[Any]) -> Optional[List[Tuple[str, Optional[List[Tuple]]]]]
+    """Returns the message of each error with the paths of its nodes in the
+    document, or None when the errors cannot be told that way."""
+    node_ids = set(id(node) for error in errors for node in error.nodes or ())
+    paths = {}  # type: Dict[int, Tuple]
+    if node_ids:
+        walk(document, NodePathCollector(node_ids, paths))
+
+    encoded_errors = []
+    for error in errors:
+        if (
+            type(error) is not GraphQLError
+            or error.path
+            or getattr(error, "original_error", None)
+        ):
+            return None
+        node_paths = None
+        if error.nodes is not None:
+            node_paths = [paths.get(id(node)) for node in error.nodes]
+            if None in node_paths:
+                return None
+        encoded_errors.append((error.message, node_paths))
+    return encoded_errors
+
+
+def _decode_errors(document, encoded_errors):
+    # type: (Document, List[Tuple[str, Optional[List[Tuple]]]]) -> List[GraphQLError]
+    errors = []
+    for message, node_paths in encoded_errors:
+        nodes = None
+        if node_paths is not None:
+            nodes = [_get_node(document, path) for path in node_paths]
+        errors.append(GraphQLError(message, nodes))
+    return errors
+
+
+def _get_node(document, path):
+    # type: (Document, Tuple) -> Node
+    node = document  # type: Any
+    for key in path:
+        node = node[key] if isinstance(key, int) else getattr(node, key)
+    return node
+
+
+class NodePathCollector(Visitor):
+    """Records the paths of the nodes with the given ids."""
+
+    __slots__ = "node_ids", "paths"
+
+    def __init__(self, node_ids, paths):
+        # type: (Set[int], Dict[int, Tuple]) -> None
+        self.node_ids = node_ids
+        self.paths = paths
+
+    def enter(self, node, key, parent, path, ancestors):
+        if id(node) in self.node_ids:
+            self.paths.setdefault(id(node), tuple(path))
+
+
+def _get_fork_context():
+    # type: () -> Any
+    if not hasattr(os, "fork"):
+        return None
+    get_context = getattr(multiprocessing, "get_context", None)
+    if get_context is None:
+        # Python 2 always forks its workers.
+        return multiprocessing
+    return get_context("fork")
@@ -7,6 +7,8 @@ from .known_directives import KnownDirectives
 from .known_fragment_names import KnownFragmentNames
 from .known_type_names import KnownTypeNames
 from .lone_anonymous_operation import LoneAnonymousOperation
+from .max_query_depth import MaxQueryDepth
+from .max_selection_count import MaxSelectionCount
 from .no_fragment_cycles import NoFragmentCycles
 from .no_undefined_variables import NoUndefinedVariables
 from .no_unused_fragments import NoUnusedFragments
@@ -14,6 +16,7 @@ from .no_unused_variables import NoUnusedVariables
 from .overlapping_fields_can_be_merged import OverlappingFieldsCanBeMerged
 from .possible_fragment_spreads import PossibleFragmentSpreads
 from .provided_non_null_arguments import ProvidedNonNullArguments
+from .query_complexity import QueryComplexity
 from .scalar_leafs import ScalarLeafs
 from .unique_argument_names import UniqueArgumentNames
 from .unique_fragment_names import UniqueFragmentNames
@@ -66,6 +69,8 @@ __all__ = [
     "KnownFragmentNames",
     "KnownTypeNames",
     "LoneAnonymousOperation",
+    "MaxQueryDepth",
+    "MaxSelectionCount",
     "NoFragmentCycles",
     "UniqueVariableNames",
     "NoUndefinedVariables",
@@ -74,6 +79,7 @@ __all__ = [
     "OverlappingFieldsCanBeMerged",
     "PossibleFragmentSpreads",
     "ProvidedNonNullArguments",
+    "QueryComplexity",
     "ScalarLeafs",
     "UniqueArgumentNames",
     "UniqueFragmentNames",
@@ -3,6 +3,7 @@ from ...language.visitor import Visitor
 # Necessary for static type checking
 if False:  # flake8: noqa
     from ..validation import ValidationContext
+    from typing import Any, Tuple, Type
 
 
 class ValidationRule(Visitor):
@@ -11,3 +12,16 @@ class ValidationRule(Visitor):
     def __init__(self, context):
         # type: (ValidationContext) -> None
         self.context = context
+
+    # The names of the class attributes that can be set with `with_options`.
+    options = ()  # type: Tuple[str, ...]
+
+    @classmethod
+    def with_options(cls, **options):
+        # type: (**Any) -> Type[ValidationRule]
+        """Returns a subclass of the rule using the given options."""
+        for name in options:
+            if name not in cls.options:
+                raise TypeError("Unknown option {} for {}.".format(name, cls.__name__))
+        options["__slots__"] = ()
+        return type(cls.__name__, (cls,), options)
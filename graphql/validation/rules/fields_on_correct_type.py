@@ -133,8 +133,11 @@ def get_suggested_field_names(schema, graphql_type, field_name):
     that may be the result of a typo."""
 
     if isinstance(graphql_type, (GraphQLInterfaceType, GraphQLObjectType)):
-        possible_field_names = list(graphql_type.fields.keys())
+        if schema.get_type(graphql_type.name) is graphql_type:
+            index = schema.get_suggestion_index(graphql_type.name)
+            return index.suggest(field_name)
 
+        possible_field_names = list(graphql_type.fields.keys())
         return suggestion_list(field_name, possible_field_names)
 
     # Otherwise, must be a Union type, which does not define fields.
@@ -1,6 +1,5 @@
 from ...error import GraphQLError
 from ...utils.quoted_or_list import quoted_or_list
-from ...utils.suggestion_list import suggestion_list
 from .base import ValidationRule
 
 # Necessary for static type checking
@@ -40,8 +39,7 @@ class KnownTypeNames(ValidationRule):
             self.context.report_error(
                 GraphQLError(
                     _unknown_type_message(
-                        type_name,
-                        suggestion_list(type_name, list(schema.get_type_map().keys())),
+                        type_name, schema.get_suggestion_index().suggest(type_name)
                     ),
                     [node],
                 )
@@ -0,0 +1,48 @@
+from ...error import GraphQLError
+from .base import ValidationRule
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from ...language.ast import OperationDefinition
+    from typing import Any, Optional
+
+
+class MaxQueryDepth(ValidationRule):
+    """Rejects the operations nesting fields deeper than `max_depth`, once
+    the fragments they spread are inlined.
+
+    The limit is set by subclassing or with `MaxQueryDepth.with_options`.
+    """
+
+    __slots__ = ()
+
+    options = ("max_depth",)
+    max_depth = 15
+
+    def enter_OperationDefinition(self, node, key, parent, path, ancestors):
+        # type: (OperationDefinition, Any, Any, Any, Any) -> bool
+        depth, _ = self.context.get_selection_size(node)
+        if depth > self.max_depth:
+            self.context.report_error(
+                GraphQLError(
+                    self.depth_error_message(
+                        node.name and node.name.value, depth, self.max_depth
+                    ),
+                    [node],
+                )
+            )
+        return False
+
+    def enter_FragmentDefinition(self, node, key, parent, path, ancestors):
+        return False
+
+    @staticmethod
+    def depth_error_message(operation_name, depth, max_depth):
+        # type: (Optional[str], int, int) -> str
+        if operation_name:
+            return 'Operation "{}" has a depth of {}, which exceeds the maximum of {}.'.format(
+                operation_name, depth, max_depth
+            )
+        return "Operation has a depth of {}, which exceeds the maximum of {}.".format(
+            depth, max_depth
+        )
@@ -0,0 +1,48 @@
+from ...error import GraphQLError
+from .base import ValidationRule
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from ...language.ast import OperationDefinition
+    from typing import Any, Optional
+
+
+class MaxSelectionCount(ValidationRule):
+    """Rejects the operations selecting more than `max_selections` fields,
+    counting the fields of a fragment at every place it is spread.
+
+    The limit is set by subclassing or with `MaxSelectionCount.with_options`.
+    """
+
+    __slots__ = ()
+
+    options = ("max_selections",)
+    max_selections = 1000
+
+    def enter_OperationDefinition(self, node, key, parent, path, ancestors):
+        # type: (OperationDefinition, Any, Any, Any, Any) -> bool
+        _, count = self.context.get_selection_size(node)
+        if count > self.max_selections:
+            self.context.report_error(
+                GraphQLError(
+                    self.count_error_message(
+                        node.name and node.name.value, count, self.max_selections
+                    ),
+                    [node],
+                )
+            )
+        return False
+
+    def enter_FragmentDefinition(self, node, key, parent, path, ancestors):
+        return False
+
+    @staticmethod
+    def count_error_message(operation_name, count, max_selections):
+        # type: (Optional[str], int, int) -> str
+        if operation_name:
+            return 'Operation "{}" selects {} fields, which exceeds the maximum of {}.'.format(
+                operation_name, count, max_selections
+            )
+        return "Operation selects {} fields, which exceeds the maximum of {}.".format(
+            count, max_selections
+        )
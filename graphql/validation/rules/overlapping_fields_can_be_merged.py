@@ -3,7 +3,6 @@ from collections import OrderedDict
 
 from ...error import GraphQLError
 from ...language import ast
-from ...language.printer import print_ast
 from ...pyutils.pair_set import PairSet
 from ...type.definition import (
     GraphQLInterfaceType,
@@ -47,7 +46,7 @@ class OverlappingFieldsCanBeMerged(ValidationRule):
         # A cache for the "field map" and list of fragment names found in any given
         # selection set. Selection sets may be asked for this information multiple
         # times, so this improves the performance of this validator.
-        self._cached_fields_and_fragment_names = {}  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]], List[str]]]
+        self._cached_fields_and_fragment_names = {}  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]], List[str]]]
 
     def leave_SelectionSet(
         self,
@@ -165,7 +164,7 @@ class OverlappingFieldsCanBeMerged(ValidationRule):
 
 def _find_conflicts_within_selection_set(
     context,  # type: ValidationContext
-    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]], List[str]]]
+    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]], List[str]]]
     compared_fragments,  # type: PairSet
     parent_type,  # type: Union[GraphQLInterfaceType, GraphQLObjectType, None]
     selection_set,  # type: SelectionSet
@@ -224,10 +223,10 @@ def _find_conflicts_within_selection_set(
 def _collect_conflicts_between_fields_and_fragment(
     context,  # type: ValidationContext
     conflicts,  # type: List[Tuple[Tuple[str, str], List[Node], List[Node]]]
-    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]], List[str]]]
+    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]], List[str]]]
     compared_fragments,  # type: PairSet
     are_mutually_exclusive,  # type: bool
-    field_map,  # type: Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]]
+    field_map,  # type: Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]]
     fragment_name,  # type: str
 ):
 
@@ -271,23 +270,23 @@ def _collect_conflicts_between_fields_and_fragment(
 def _collect_conflicts_between_fragments(
     context,  # type: ValidationContext
     conflicts,  # type: List[Tuple[Tuple[str, str], List[Node], List[Node]]]
-    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]], List[str]]]
+    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]], List[str]]]
     compared_fragments,  # type: PairSet
     are_mutually_exclusive,  # type: bool
     fragment_name1,  # type: str
     fragment_name2,  # type: str
 ):
 
+    # No need to compare a fragment to itself.
+    if fragment_name1 == fragment_name2:
+        return None
+
     fragment1 = context.get_fragment(fragment_name1)
     fragment2 = context.get_fragment(fragment_name2)
 
     if not fragment1 or not fragment2:
         return None
 
-    # No need to compare a fragment to itself.
-    if fragment1 == fragment2:
-        return None
-
     # Memoize so two fragments are not compared for conflicts more than once.
     if compared_fragments.has(fragment_name1, fragment_name2, are_mutually_exclusive):
         return None
@@ -346,7 +345,7 @@ def _collect_conflicts_between_fragments(
 
 def _find_conflicts_between_sub_selection_sets(
     context,  # type: ValidationContext
-    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]], List[str]]]
+    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]], List[str]]]
     compared_fragments,  # type: PairSet
     are_mutually_exclusive,  # type: bool
     parent_type1,  # type: Union[GraphQLInterfaceType, GraphQLObjectType, None]
@@ -428,9 +427,9 @@ def _find_conflicts_between_sub_selection_sets(
 def _collect_conflicts_within(
     context,  # type: ValidationContext
     conflicts,  # type: List[Tuple[Tuple[str, str], List[Node], List[Node]]]
-    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]], List[str]]]
+    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]], List[str]]]
     compared_fragments,  # type: PairSet
-    field_map,  # type: Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]]
+    field_map,  # type: Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]]
 ):
     # type: (...) -> None
     """Collect all Conflicts "within" one collection of fields."""
@@ -443,8 +442,19 @@ def _collect_conflicts_within(
         # This compares every field in the list to every other field in this list
         # (except to itself). If the list only has one item, nothing needs to
         # be compared.
+        if len(fields) < 2:
+            continue
+
+        # Identical leaf fields, typically coming from the same fragment spread
+        # in several places, can never conflict.
+        leaf_key = fields[0][3]
+        if leaf_key is not None and all(field[3] == leaf_key for field in fields):
+            continue
+
         for i, field in enumerate(fields):
             for other_field in fields[i + 1 :]:
+                if field[3] is not None and field[3] == other_field[3]:
+                    continue
                 # within one collection is never mutually exclusive
                 conflict = _find_conflict(
                     context,
@@ -462,11 +472,11 @@ def _collect_conflicts_within(
 def _collect_conflicts_between(
     context,  # type: ValidationContext
     conflicts,  # type: List[Tuple[Tuple[str, str], List[Node], List[Node]]]
-    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]], List[str]]]
+    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]], List[str]]]
     compared_fragments,  # type: PairSet
     parent_fields_are_mutually_exclusive,  # type: bool
-    field_map1,  # type: Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]]
-    field_map2,  # type: Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]]
+    field_map1,  # type: Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]]
+    field_map2,  # type: Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]]
 ):
     # type: (...) -> None
     """Collect all Conflicts between two collections of fields.
@@ -486,6 +496,8 @@ def _collect_conflicts_between(
         if fields2:
             for field1 in fields1:
                 for field2 in fields2:
+                    if field1[3] is not None and field1[3] == field2[3]:
+                        continue
                     conflict = _find_conflict(
                         context,
                         cached_fields_and_fragment_names,
@@ -502,17 +514,17 @@ def _collect_conflicts_between(
 
 def _find_conflict(
     context,  # type: ValidationContext
-    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]], List[str]]]
+    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]], List[str]]]
     compared_fragments,  # type: PairSet
     parent_fields_are_mutually_exclusive,  # type: bool
     response_name,  # type: str
-    field1,  # type: Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]
-    field2,  # type: Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]
+    field1,  # type: Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]
+    field2,  # type: Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]
 ):
     # type: (...) -> Optional[Tuple[Tuple[str, str], List[Node], List[Node]]]
     """Determines if there is a conflict between two particular fields."""
-    parent_type1, ast1, def1 = field1
-    parent_type2, ast2, def2 = field2
+    parent_type1, ast1, def1, _ = field1
+    parent_type2, ast2, def2, _ = field2
 
     # If it is known that two fields could not possibly apply at the same
     # time, due to the parent types, then it is safe to permit them to diverge
@@ -584,17 +596,17 @@ def _find_conflict(
 
 def _get_fields_and_fragments_names(
     context,  # type: ValidationContext
-    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]], List[str]]]
+    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]], List[str]]]
     parent_type,  # type: Union[GraphQLInterfaceType, GraphQLObjectType, None]
     selection_set,  # type: SelectionSet
 ):
-    # type: (...) -> Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]], List[str]]
+    # type: (...) -> Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]], List[str]]
     cached = cached_fields_and_fragment_names.get(selection_set)
 
     if not cached:
         ast_and_defs = (
             OrderedDict()
-        )  # type: Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]]
+        )  # type: Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]]
         fragment_names = OrderedDict()  # type: Dict[str, bool]
         _collect_fields_and_fragment_names(
             context, parent_type, selection_set, ast_and_defs, fragment_names
@@ -607,10 +619,10 @@ def _get_fields_and_fragments_names(
 
 def _get_referenced_fields_and_fragment_names(
     context,  # ValidationContext
-    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]], List[str]]]
+    cached_fields_and_fragment_names,  # type: Dict[SelectionSet, Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]], List[str]]]
     fragment,  # type: InlineFragment
 ):
-    # type: (...) -> Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]], List[str]]
+    # type: (...) -> Tuple[Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]], List[str]]
     """Given a reference to a fragment, return the represented collection of fields as well as a list of
     nested fragment names referenced via fragment spreads."""
 
@@ -633,7 +645,7 @@ def _collect_fields_and_fragment_names(
     context,  # type: ValidationContext
     parent_type,  # type: Union[GraphQLInterfaceType, GraphQLObjectType, None]
     selection_set,  # type: SelectionSet
-    ast_and_defs,  # type: Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField]]]
+    ast_and_defs,  # type: Dict[str, List[Tuple[Union[GraphQLInterfaceType, GraphQLObjectType, None], Field, GraphQLField, Optional[Tuple]]]]
     fragment_names,  # type: Dict[str, bool]
 ):
     # type: (...) -> None
@@ -651,7 +663,20 @@ def _collect_fields_and_fragment_names(
             if not ast_and_defs.get(response_name):
                 ast_and_defs[response_name] = []  # type: ignore
 
-            ast_and_defs[response_name].append((parent_type, selection, field_def))
+            # Leaf fields get a key identifying them by name, arguments and
+            # type, as two of them sharing it can never conflict.
+            if selection.selection_set:
+                leaf_key = None
+            else:
+                arguments_key = _arguments_key(selection.arguments)
+                if arguments_key is None:
+                    leaf_key = None
+                else:
+                    leaf_key = (field_name, arguments_key, field_def and field_def.type)
+
+            ast_and_defs[response_name].append(
+                (parent_type, selection, field_def, leaf_key)
+            )
 
         elif isinstance(selection, ast.FragmentSpread):
             fragment_names[selection.name.value] = True
@@ -724,7 +749,45 @@ def _same_value(value1, value2):
         return True
     if not value1 or not value2:
         return False
-    return print_ast(value1) == print_ast(value2)
+    # AST nodes compare structurally, ignoring their location.
+    return value1 == value2
+
+
+def _value_key(value):
+    # type: (Node) -> Any
+    """Returns a hashable key for a value node, equal for equal values."""
+    if isinstance(value, ast.Variable):
+        return ast.Variable, value.name.value
+    if isinstance(value, ast.ListValue):
+        return ast.ListValue, tuple(_value_key(item) for item in value.values)
+    if isinstance(value, ast.ObjectValue):
+        return (
+            ast.ObjectValue,
+            tuple(
+                (field.name.value, _value_key(field.value)) for field in value.fields
+            ),
+        )
+    return type(value), value.value
+
+
+def _arguments_key(arguments):
+    # type: (Optional[List[Argument]]) -> Optional[Tuple]
+    """Returns a key for a list of arguments, equal for lists which are the
+    same according to _same_arguments, or None if an argument is repeated."""
+    if not arguments:
+        return ()
+    key = tuple(
+        sorted(
+            (
+                (argument.name.value, _value_key(argument.value))
+                for argument in arguments
+            ),
+            key=lambda item: item[0],
+        )
+    )
+    if len(set(name for name, _ in key)) != len(key):
+        return None
+    return key
 
 
 def _same_arguments(arguments1, arguments2):
@@ -0,0 +1,191 @@
+from ...error import GraphQLError
+from ...language.ast import IntValue
+from ...type.definition import GraphQLList, get_nullable_type
+from .base import ValidationRule
+
+# Necessary for static type checking
+if False:  # flake8: noqa
+    from ..validation import ValidationContext
+    from ...language.ast import (
+        Document,
+        Field,
+        FragmentDefinition,
+        FragmentSpread,
+        OperationDefinition,
+    )
+    from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+class QueryComplexity(ValidationRule):
+    """Rejects the operations whose static cost exceeds `max_complexity`.
+
+    Every field costs its weight, looked up by "Type.field" in
+    `field_costs` and otherwise `default_field_cost`, times the number of
+    times it is expected to be resolved. Below a list field, that number is
+    multiplied by the integer value of the first of `list_size_arguments`
+    given to it, or by `default_list_size` when there is none or it comes
+    from a variable. Spread fragments are costed once and expanded where
+    they are used.
+
+    The limits are set by subclassing or with `QueryComplexity.with_options`.
+    """
+
+    __slots__ = (
+        "operations",
+        "fragment_costs",
+        "current",
+        "multiplier",
+        "multiplier_stack",
+    )
+
+    options = (
+        "max_complexity",
+        "default_field_cost",
+        "field_costs",
+        "default_list_size",
+        "list_size_arguments",
+    )
+    max_complexity = 1000
+    default_field_cost = 1
+    field_costs = {}  # type: Dict[str, int]
+    default_list_size = 10
+    list_size_arguments = ("first", "last", "limit")
+
+    def __init__(self, context):
+        # type: (ValidationContext) -> None
+        super(QueryComplexity, self).__init__(context)
+        # Definition -> its own cost and the (multiplier, fragment name) of
+        # the fragments it spreads. Fragments are keyed by their definition,
+        # as duplicate names are reported by UniqueFragmentNames.
+        self.operations = []  # type: List[Tuple[OperationDefinition, List]]
+        self.fragment_costs = {}  # type: Dict[FragmentDefinition, List]
+        self.current = [0, []]  # type: List
+        self.multiplier = 1
+        self.multiplier_stack = []  # type: List[int]
+
+    def enter_OperationDefinition(self, node, key, parent, path, ancestors):
+        self.current = [0, []]
+        self.operations.append((node, self.current))
+        self.multiplier = 1
+
+    def enter_FragmentDefinition(self, node, key, parent, path, ancestors):
+        self.current = self.fragment_costs[node] = [0, []]
+        self.multiplier = 1
+
+    def enter_VariableDefinition(self, node, key, parent, path, ancestors):
+        return False
+
+    def enter_Field(self, node, key, parent, path, ancestors):
+        # type: (Field, Any, Any, Any, Any) -> None
+        self.multiplier_stack.append(self.multiplier)
+        field_def = self.context.get_field_def()
+        if field_def is None:
+            return
+
+        parent_type = self.context.get_parent_type()
+        cost = self.field_costs.get(
+            "{}.{}".format(parent_type, node.name.value), self.default_field_cost
+        )
+        self.current[0] += cost * self.multiplier
+        if isinstance(get_nullable_type(field_def.type), GraphQLList):
+            self.multiplier *= self.get_list_size(node)
+
+    def leave_Field(self, node, key, parent, path, ancestors):
+        self.multiplier = self.multiplier_stack.pop()
+
+    def enter_FragmentSpread(self, node, key, parent, path, ancestors):
+        # type: (FragmentSpread, Any, Any, Any, Any) -> None
+        self.current[1].append((self.multiplier, node.name.value))
+
+    def leave_Document(self, node, key, parent, path, ancestors):
+        # type: (Document, Any, Any, Any, Any) -> None
+        resolved = self.resolve_fragment_costs()
+        for operation, cost in self.operations:
+            complexity = self.resolve_cost(cost, resolved)
+            if complexity > self.max_complexity:
+                self.context.report_error(
+                    GraphQLError(
+                        self.complexity_error_message(
+                            operation.name and operation.name.value,
+                            complexity,
+                            self.max_complexity,
+                        ),
+                        [operation],
+                    )
+                )
+
+    def get_list_size(self, node):
+        # type: (Field) -> int
+        arguments = {argument.name.value: argument.value for argument in node.arguments}
+        for name in self.list_size_arguments:
+            value = arguments.get(name)
+            if value is not None:
+                if isinstance(value, IntValue):
+                    return max(int(value.value), 0)
+                break
+        return self.default_list_size
+
+    def get_cyclic_fragments(self):
+        # type: () -> Set[FragmentDefinition]
+        """Returns the fragments on a cycle, which are reported by
+        NoFragmentCycles and left out of the cost."""
+        components = self.context.get_fragment_components()
+        sizes = {}  # type: Dict[int, int]
+        for component in components.values():
+            sizes[component] = sizes.get(component, 0) + 1
+        cyclic = set(
+            fragment
+            for fragment, component in components.items()
+            if sizes[component] > 1
+        )
+        for fragment, (_, spreads) in self.fragment_costs.items():
+            if any(self.context.get_fragment(name) is fragment for _, name in spreads):
+                cyclic.add(fragment)
+        return cyclic
+
+    def resolve_fragment_costs(self):
+        # type: () -> Dict[FragmentDefinition, int]
+        """Resolves the cost of the fragments not on a cycle in topological
+        order, with an explicit stack, so that the fragments they spread are
+        always resolved first."""
+        cyclic = self.get_cyclic_fragments()
+        resolved = {}  # type: Dict[FragmentDefinition, int]
+        for root in self.fragment_costs:
+            stack = [(root, False)]
+            while stack:
+                fragment, spreads_resolved = stack.pop()
+                if fragment in resolved or fragment in cyclic:
+                    continue
+                cost = self.fragment_costs[fragment]
+                if spreads_resolved:
+                    resolved[fragment] = self.resolve_cost(cost, resolved)
+                    continue
+                stack.append((fragment, True))
+                for _, name in cost[1]:
+                    # Spreads refer to the same definition as in the other rules.
+                    spread = self.context.get_fragment(name)
+                    if spread in self.fragment_costs and spread not in resolved:
+                        stack.append((spread, False))
+        return resolved
+
+    def resolve_cost(self, cost, resolved):
+        # type: (List, Dict[FragmentDefinition, int]) -> int
+        own_cost, spreads = cost
+        total = own_cost
+        for multiplier, name in spreads:
+            fragment_cost = resolved.get(self.context.get_fragment(name))
+            # Unknown fragments and cycles are reported by other rules.
+            if fragment_cost is not None:
+                total += multiplier * fragment_cost
+        return total
+
+    @staticmethod
+    def complexity_error_message(operation_name, complexity, max_complexity):
+        # type: (Optional[str], int, int) -> str
+        if operation_name:
+            return 'Operation "{}" has a complexity of {}, which exceeds the maximum of {}.'.format(
+                operation_name, complexity, max_complexity
+            )
+        return "Operation has a complexity of {}, which exceeds the maximum of {}.".format(
+            complexity, max_complexity
+        )
@@ -0,0 +1,49 @@
+from graphql import parse, validate
+from graphql.error import format_error
+from graphql.validation import validate_documents
+from graphql.validation.batch import _decode_errors, _encode_errors
+
+from .utils import test_schema
+
+documents = [
+    parse("{ dog { name } }"),
+    parse("{ dog { unknown } }"),
+    parse("query Q($v: Int) { human { name } }"),
+    parse("{ cat { meowVolume } } fragment F on Dog { name }"),
+    parse("{ dog { name: nickname ...F } } fragment F on Dog { name }"),
+]
+
+
+def format_errors(errors):
+    return list(map(format_error, errors))
+
+
+def expect_same_errors_as_validate(results):
+    assert len(results) == len(documents)
+    for document, errors in zip(documents, results):
+        assert format_errors(errors) == format_errors(validate(test_schema, document))
+
+
+def test_validates_documents_in_worker_processes():
+    results = validate_documents(test_schema, documents, processes=2)
+    expect_same_errors_as_validate(results)
+    assert results[0] == []
+    # The errors refer to the given documents.
+    dog = documents[1].definitions[0].selection_set.selections[0]
+    assert results[1][0].nodes[0] is dog.selection_set.selections[0]
+
+
+def test_validates_documents_in_process():
+    expect_same_errors_as_validate(
+        validate_documents(test_schema, documents, processes=1)
+    )
+
+
+def test_encodes_errors_by_the_paths_of_their_nodes():
+    for document in documents:
+        errors = validate(test_schema, document)
+        decoded_errors = _decode_errors(document, _encode_errors(document, errors))
+        assert format_errors(decoded_errors) == format_errors(errors)
+        for error, decoded_error in zip(errors, decoded_errors):
+            assert decoded_error.nodes == error.nodes
+            assert all(map(lambda a, b: a is b, decoded_error.nodes, error.nodes))
@@ -0,0 +1,35 @@
+# type: ignore
+from graphql import parse, validate
+from graphql.validation import validate_documents
+
+from .utils import test_schema
+
+# Documents as a client codebase would have, checked in a batch.
+documents = [
+    parse(
+        """
+        query Q%d($atOtherHomes: Boolean) {
+          dog { ...DogFields owner: name }
+          human { name pets { name ... on Cat { furColor } } }
+        }
+        fragment DogFields on Dog {
+          name nickname barkVolume
+          isHousetrained(atOtherHomes: $atOtherHomes)
+        }
+        """
+        % index
+    )
+    for index in range(200)
+]
+
+
+def test_validate_documents_one_by_one(benchmark):
+    @benchmark
+    def b():
+        return [validate(test_schema, document) for document in documents]
+
+
+def test_validate_documents_in_parallel(benchmark):
+    @benchmark
+    def b():
+        return validate_documents(test_schema, documents, processes=4)
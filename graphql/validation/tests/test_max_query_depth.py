@@ -0,0 +1,57 @@
+from graphql.language.location import SourceLocation as L
+from graphql.validation.rules import MaxQueryDepth
+
+from .utils import expect_fails_rule, expect_passes_rule
+
+
+def depth_error(operation_name, depth, max_depth, line, column):
+    return {
+        "message": MaxQueryDepth.depth_error_message(operation_name, depth, max_depth),
+        "locations": [L(line, column)],
+    }
+
+
+def test_passes_within_the_maximum_depth():
+    expect_passes_rule(
+        MaxQueryDepth.with_options(max_depth=3),
+        """
+      { human { pets { name } } dog { name } }
+    """,
+    )
+
+
+def test_reports_operations_too_deep():
+    expect_fails_rule(
+        MaxQueryDepth.with_options(max_depth=2),
+        """
+      query Q { human { pets { name } } }
+      { dog { name } }
+    """,
+        [depth_error("Q", 3, 2, 2, 7)],
+    )
+
+
+def test_inlines_fragments_and_inline_fragments():
+    expect_fails_rule(
+        MaxQueryDepth.with_options(max_depth=2),
+        """
+      { human { ...HumanFields } }
+      fragment HumanFields on Human {
+        name
+        ... on Human { pets { ...PetName } }
+      }
+      fragment PetName on Pet { name }
+    """,
+        [depth_error(None, 3, 2, 2, 7)],
+    )
+
+
+def test_ignores_unknown_and_cyclic_fragments():
+    expect_passes_rule(
+        MaxQueryDepth.with_options(max_depth=2),
+        """
+      { dog { ...Unknown ...A } }
+      fragment A on Dog { name ...B }
+      fragment B on Dog { nickname ...A }
+    """,
+    )
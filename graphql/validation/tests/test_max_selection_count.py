@@ -0,0 +1,75 @@
+from pytest import raises
+
+from graphql.language.location import SourceLocation as L
+from graphql.validation.rules import MaxSelectionCount
+
+from .utils import expect_fails_rule, expect_passes_rule
+
+
+def count_error(operation_name, count, max_selections, line, column):
+    return {
+        "message": MaxSelectionCount.count_error_message(
+            operation_name, count, max_selections
+        ),
+        "locations": [L(line, column)],
+    }
+
+
+def test_passes_within_the_maximum_count():
+    expect_passes_rule(
+        MaxSelectionCount.with_options(max_selections=5),
+        """
+      { dog { name nickname } cat { name } }
+    """,
+    )
+
+
+def test_counts_fragment_fields_at_every_spread():
+    expect_fails_rule(
+        MaxSelectionCount.with_options(max_selections=6),
+        """
+      query Q {
+        dog { ...DogFields }
+        human { pets { ... on Dog { ...DogFields } } }
+      }
+      fragment DogFields on Dog { name nickname }
+    """,
+        [count_error("Q", 7, 6, 2, 7)],
+    )
+
+
+def test_counts_cyclic_fragments_the_same_at_every_spread():
+    # Within A and B, the spreads of each other count as empty.
+    expect_fails_rule(
+        MaxSelectionCount.with_options(max_selections=2),
+        """
+      { dog { ...A ...B } }
+      fragment A on Dog { name ...B }
+      fragment B on Dog { nickname ...A }
+    """,
+        [count_error(None, 3, 2, 2, 7)],
+    )
+
+
+def test_rejects_unknown_options():
+    with raises(TypeError) as excinfo:
+        MaxSelectionCount.with_options(max_depth=5)
+
+    assert str(excinfo.value) == "Unknown option max_depth for MaxSelectionCount."
+
+
+def test_measures_long_fragment_chains():
+    fragments = "".join(
+        "fragment F{} on Dog {{ name ...F{} }}\n".format(i, i + 1) for i in range(2000)
+    )
+    expect_fails_rule(
+        MaxSelectionCount,
+        "  { dog { ...F0 } }\n" + fragments + "fragment F2000 on Dog { name }",
+        [count_error(None, 2002, 1000, 1, 3)],
+    )
+
+    # The chain closes into a cycle, within which spreads count as empty.
+    expect_passes_rule(
+        MaxSelectionCount.with_options(max_selections=2),
+        "{ dog { ...F0 } }\n" + fragments + "fragment F2000 on Dog { ...F0 }",
+    )
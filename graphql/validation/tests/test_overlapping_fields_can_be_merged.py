@@ -218,6 +218,91 @@ def test_conflicting_args():
     )
 
 
+def test_identical_complex_args_in_any_order():
+    expect_passes_rule(
+        OverlappingFieldsCanBeMerged,
+        """
+    {
+        complicatedArgs {
+            complexArgField(complexArg: {requiredField: true, intField: 1})
+            complexArgField(complexArg: {requiredField: true, intField: 1})
+            multipleReqs(req1: 1, req2: $b)
+            multipleReqs(req2: $b, req1: 1)
+        }
+    }
+    """,
+    )
+
+
+def test_conflicting_complex_args():
+    expect_fails_rule(
+        OverlappingFieldsCanBeMerged,
+        """
+    {
+        complicatedArgs {
+            complexArgField(complexArg: {requiredField: true, intField: 1})
+            complexArgField(complexArg: {requiredField: true, intField: 2})
+            multipleReqs(req1: 1, req2: $a)
+            multipleReqs(req1: 1, req2: $b)
+            stringListArgField(stringListArg: ["a", "b"])
+            stringListArgField(stringListArg: ["b", "a"])
+        }
+    }
+    """,
+        [
+            fields_conflict(
+                "complexArgField", "they have differing arguments", L(4, 13), L(5, 13)
+            ),
+            fields_conflict(
+                "multipleReqs", "they have differing arguments", L(6, 13), L(7, 13)
+            ),
+            fields_conflict(
+                "stringListArgField",
+                "they have differing arguments",
+                L(8, 13),
+                L(9, 13),
+            ),
+        ],
+        sort_list=False,
+    )
+
+
+def test_identical_fields_spread_many_times():
+    expect_fails_rule(
+        OverlappingFieldsCanBeMerged,
+        """
+    {
+        dog { ...A ...A ...B name }
+        dog { ...B name: nickname }
+    }
+    fragment A on Dog { name barkVolume }
+    fragment B on Dog { name barkVolume }
+    """,
+        [
+            fields_conflict(
+                "name", "nickname and name are different fields", L(4, 20), L(7, 25)
+            ),
+            fields_conflict(
+                "dog",
+                [
+                    ("name", "name and nickname are different fields"),
+                    ("name", "nickname and name are different fields"),
+                    ("name", "nickname and name are different fields"),
+                ],
+                L(3, 9),
+                L(3, 30),
+                L(4, 20),
+                L(4, 20),
+                L(4, 9),
+                L(4, 20),
+                L(6, 25),
+                L(7, 25),
+            ),
+        ],
+        sort_list=False,
+    )
+
+
 def test_allows_different_args_where_no_conflict_is_possible():
     expect_passes_rule(
         OverlappingFieldsCanBeMerged,
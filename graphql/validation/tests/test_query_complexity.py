@@ -0,0 +1,188 @@
+from graphql.language.location import SourceLocation as L
+from graphql.type import (
+    GraphQLArgument,
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+from graphql.validation.rules import QueryComplexity
+
+from .utils import expect_fails_rule_with_schema, expect_passes_rule_with_schema
+
+User = GraphQLObjectType(
+    name="User",
+    fields=lambda: {
+        "name": GraphQLField(GraphQLString),
+        "avatar": GraphQLField(GraphQLString),
+        "friends": GraphQLField(
+            GraphQLNonNull(GraphQLList(User)),
+            args={"first": GraphQLArgument(GraphQLInt)},
+        ),
+    },
+)
+
+schema = GraphQLSchema(
+    query=GraphQLObjectType(
+        name="Query",
+        fields={
+            "me": GraphQLField(User),
+            "users": GraphQLField(
+                GraphQLList(User), args={"limit": GraphQLArgument(GraphQLInt)}
+            ),
+        },
+    )
+)
+
+
+def complexity_error(operation_name, complexity, max_complexity, line, column):
+    return {
+        "message": QueryComplexity.complexity_error_message(
+            operation_name, complexity, max_complexity
+        ),
+        "locations": [L(line, column)],
+    }
+
+
+def test_passes_within_the_budget():
+    expect_passes_rule_with_schema(
+        schema,
+        QueryComplexity.with_options(max_complexity=3),
+        """
+      { me { name avatar } }
+    """,
+    )
+
+
+def test_reports_operations_over_the_budget():
+    expect_fails_rule_with_schema(
+        schema,
+        QueryComplexity.with_options(max_complexity=3),
+        """
+      query Q { me { name avatar __typename } }
+    """,
+        [complexity_error("Q", 4, 3, 2, 7)],
+    )
+
+
+def test_multiplies_by_list_size_arguments():
+    # 1 + 5 * (1 + 1 + 2 * 1)
+    expect_fails_rule_with_schema(
+        schema,
+        QueryComplexity.with_options(max_complexity=20),
+        """
+      {
+        users(limit: 5) { name friends(first: 2) { name } }
+      }
+    """,
+        [complexity_error(None, 21, 20, 2, 7)],
+    )
+
+
+def test_uses_the_default_list_size_for_variables():
+    # 1 + 1 + 3 * 1
+    expect_fails_rule_with_schema(
+        schema,
+        QueryComplexity.with_options(max_complexity=4, default_list_size=3),
+        """
+      query Q($first: Int) { me { friends(first: $first) { name } } }
+    """,
+        [complexity_error("Q", 5, 4, 2, 7)],
+    )
+
+
+def test_uses_the_configured_field_costs():
+    expect_fails_rule_with_schema(
+        schema,
+        QueryComplexity.with_options(
+            max_complexity=10, field_costs={"User.avatar": 10}
+        ),
+        """
+      { me { avatar } }
+    """,
+        [complexity_error(None, 11, 10, 2, 7)],
+    )
+
+
+def test_expands_fragments_where_they_are_spread():
+    # A: 1 + 4 * Friend, where Friend is 1 + 1 + 2 * (Name + 1) and Name is 1
+    expect_fails_rule_with_schema(
+        schema,
+        QueryComplexity.with_options(max_complexity=20),
+        """
+      query A { users(limit: 4) { ...Friend } }
+      query B { me { ...Friend } }
+      fragment Friend on User { name friends(first: 2) { ...Name avatar } }
+      fragment Name on User { name }
+    """,
+        [complexity_error("A", 25, 20, 2, 7)],
+    )
+
+
+def test_ignores_fragment_cycles():
+    expect_passes_rule_with_schema(
+        schema,
+        QueryComplexity.with_options(max_complexity=3),
+        """
+      { me { ...A } }
+      fragment A on User { name ...B }
+      fragment B on User { avatar ...A }
+    """,
+    )
+
+
+def test_leaves_fragments_on_cycles_out_of_the_cost():
+    # Me and C count, A and B are on a cycle, whichever is spread first.
+    expect_fails_rule_with_schema(
+        schema,
+        QueryComplexity.with_options(max_complexity=1),
+        """
+      { me { ...B ...A ...C } }
+      fragment A on User { name ...B }
+      fragment B on User { avatar ...A }
+      fragment C on User { name ...A }
+      fragment D on User { name ...D }
+    """,
+        [complexity_error(None, 2, 1, 2, 7)],
+    )
+
+
+def test_resolves_long_fragment_chains():
+    fragments = "".join(
+        "fragment F{} on User {{ name ...F{} }}\n".format(index, index + 1)
+        for index in range(2000)
+    )
+    expect_fails_rule_with_schema(
+        schema,
+        QueryComplexity.with_options(max_complexity=1000),
+        "  { me { ...F0 } }\n" + fragments + "fragment F2000 on User { name }\n",
+        [complexity_error(None, 2002, 1000, 1, 3)],
+    )
+
+
+def test_costs_duplicate_fragments_apart():
+    # The spread refers to the last fragment named F, like in the other
+    # rules, whatever the order of the definitions.
+    expect_fails_rule_with_schema(
+        schema,
+        QueryComplexity.with_options(max_complexity=2),
+        """
+      { me { ...F } }
+      fragment F on User { name avatar }
+      fragment F on User { name }
+      fragment F on User { name avatar friends(first: 1) { name } }
+    """,
+        [complexity_error(None, 5, 2, 2, 7)],
+    )
+    expect_passes_rule_with_schema(
+        schema,
+        QueryComplexity.with_options(max_complexity=2),
+        """
+      { me { ...F } }
+      fragment F on User { name avatar friends(first: 1) { name } }
+      fragment F on User { name }
+    """,
+    )
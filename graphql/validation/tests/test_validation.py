@@ -1,7 +1,16 @@
 from graphql import parse, validate
+from graphql.error import format_error
+from graphql.language.visitor import ParallelVisitor, TypeInfoVisitor, walk
+from graphql.utils.build_ast_schema import build_ast_schema
 from graphql.utils.type_info import TypeInfo
 from graphql.validation.rules import specified_rules
-from graphql.validation.validation import visit_using_rules
+from graphql.validation.validation import (
+    CACHEABLE_RULES,
+    FragmentValidationCache,
+    UsageCollector,
+    ValidationContext,
+    visit_using_rules,
+)
 
 from .utils import test_schema
 
@@ -62,3 +71,162 @@ def test_validates_using_a_custom_type_info():
         errors[2].message
         == 'Cannot query field "isHousetrained" on type "Dog". Did you mean "isHousetrained"?'
     )
+
+
+def test_collects_variable_usages_during_validation():
+    ast = parse(
+        """
+      fragment Early on Dog { doesKnowCommand(dogCommand: $command) }
+      query Q($command: DogCommand, $atHome: Boolean) {
+        dog { ...Early ...Late }
+      }
+      fragment Late on Dog { isHousetrained(atOtherHomes: $atHome) }
+    """
+    )
+    type_info = TypeInfo(test_schema)
+    context = ValidationContext(test_schema, ast, type_info)
+    walk(ast, TypeInfoVisitor(type_info, ParallelVisitor([UsageCollector(context)])))
+
+    early, operation, _ = ast.definitions
+    fresh_context = ValidationContext(test_schema, ast, TypeInfo(test_schema))
+    for definition in ast.definitions:
+        usages = context.get_variable_usages(definition)
+        expected = fresh_context.get_variable_usages(definition)
+        assert [(u.node, u.type) for u in usages] == [
+            (u.node, u.type) for u in expected
+        ]
+
+    assert [u.node.name.value for u in context.get_variable_usages(early)] == [
+        "command"
+    ]
+    assert [
+        (u.node.name.value, str(u.type))
+        for u in context.get_recursive_variable_usages(operation)
+    ] == [("command", "DogCommand"), ("atHome", "Boolean")]
+
+
+def test_reports_variable_errors_with_fragments_before_and_after_operations():
+    errors = validate(
+        test_schema,
+        parse(
+            """
+      fragment Early on Dog { doesKnowCommand(dogCommand: $command) }
+      query Q($unused: Int) { dog { ...Early ...Late } }
+      fragment Late on Dog { isHousetrained(atOtherHomes: $atHome) }
+    """
+        ),
+    )
+
+    assert [error.message for error in errors] == [
+        'Variable "$command" is not defined by operation "Q".',
+        'Variable "$atHome" is not defined by operation "Q".',
+        'Variable "$unused" is never used in operation "Q".',
+    ]
+
+
+def test_fragment_cache_gives_the_same_errors():
+    fragments = """
+      fragment DogFields on Dog { name barkVolume ...OwnerFields }
+      fragment OwnerFields on Dog { unknownField }
+      fragment CatFields on Cat { meowVolume(loud: true) }
+    """
+    documents = [
+        "{ dog { ...DogFields } }" + fragments,
+        "query Q { dog { ...DogFields name: nickname } catOrDog { ...CatFields } }"
+        + fragments,
+        fragments + "{ dog { ...DogFields ...Unknown } }",
+    ]
+    cache = FragmentValidationCache()
+    for _ in range(2):
+        for document in documents:
+            ast = parse(document)
+            errors = validate(test_schema, ast, fragment_cache=cache)
+            assert errors
+            assert list(map(format_error, errors)) == list(
+                map(format_error, validate(test_schema, ast))
+            )
+
+    ast = parse(documents[0])
+    _, dog_fields, owner_fields, _ = ast.definitions
+    context = ValidationContext(test_schema, ast, TypeInfo(test_schema))
+    rules = [rule for rule in specified_rules if rule in CACHEABLE_RULES]
+    # Errors within spread fragments are reported on those fragments, and
+    # the fragments known to be invalid are left to the document validation.
+    assert cache.check(context, dog_fields, rules) == []
+    assert cache.check(context, owner_fields, rules) is None
+    cat_fields = parse(documents[1]).definitions[-1]
+    assert cache.check(context, cat_fields, rules) is None
+
+    # Fragments seen for the first time are validated on their own, without
+    # the errors on the definitions themselves.
+    ast = parse("fragment F on Boolean { a } fragment G on Dog { a }")
+    context = ValidationContext(test_schema, ast, TypeInfo(test_schema))
+    boolean, dog = ast.definitions
+    assert cache.check(context, boolean, rules) == []
+    [error] = cache.check(context, dog, rules)
+    assert error.message == 'Cannot query field "a" on type "Dog".'
+    assert cache.check(context, dog, rules) is None
+
+
+def test_fragment_cache_reuses_valid_fragments():
+    fragment = "fragment DogFields on Dog { name doesKnowCommand(dogCommand: $cmd) }"
+    cache = FragmentValidationCache()
+    for document in [
+        "query A($cmd: DogCommand) { dog { ...DogFields } }" + fragment,
+        "query B($cmd: Int) { dog { ...DogFields } }" + fragment,
+        "query C { dog { ...DogFields } }" + fragment,
+    ]:
+        ast = parse(document)
+        errors = validate(test_schema, ast, fragment_cache=cache)
+        assert list(map(format_error, errors)) == list(
+            map(format_error, validate(test_schema, ast))
+        )
+
+    # The fragment is remembered once, as valid.
+    assert len(cache) == 1
+    context = ValidationContext(test_schema, ast, TypeInfo(test_schema))
+    rules = [rule for rule in specified_rules if rule in CACHEABLE_RULES]
+    assert cache.check(context, ast.definitions[1], rules) == []
+    assert len(cache) == 1
+
+
+def test_fragment_cache_is_bounded_and_kept_per_schema():
+    cache = FragmentValidationCache(max_size=2)
+    for name in ["A", "B", "C"]:
+        validate(
+            test_schema,
+            parse("{ dog { ...%s } } fragment %s on Dog { name }" % (name, name)),
+            fragment_cache=cache,
+        )
+    assert len(cache) == 2
+
+    other_schema = build_ast_schema(
+        parse("schema { query: Query } type Query { dog: Dog } type Dog { a: Int }")
+    )
+    ast = parse("{ dog { ...A } } fragment A on Dog { name }")
+    [error] = validate(other_schema, ast, fragment_cache=cache)
+    assert error.message == 'Cannot query field "name" on type "Dog".'
+    assert len(cache) == 1
+
+
+def test_aborts_validation_once_the_error_limit_is_reached():
+    ast = parse(
+        """
+      { dog { a b c d e f } }
+      { cat { g } }
+    """
+    )
+    all_errors = validate(test_schema, ast)
+    assert len(all_errors) > 4
+
+    errors = validate(test_schema, ast, max_errors=3)
+    assert list(map(format_error, errors[:3])) == list(
+        map(format_error, all_errors[:3])
+    )
+    assert len(errors) == 4
+    assert errors[3].message == (
+        "Too many validation errors, error limit reached. Validation aborted."
+    )
+
+    errors = validate(test_schema, ast, max_errors=len(all_errors))
+    assert list(map(format_error, errors)) == list(map(format_error, all_errors))
@@ -1,15 +1,49 @@
-from ..language.ast import FragmentDefinition, FragmentSpread, OperationDefinition
-from ..language.visitor import ParallelVisitor, TypeInfoVisitor, Visitor, visit
+from ..language.ast import (
+    Document,
+    Field,
+    FragmentDefinition,
+    FragmentSpread,
+    OperationDefinition,
+)
+from ..language.printer import print_ast
+from ..error import GraphQLError
+from ..language.visitor import BREAK, ParallelVisitor, TypeInfoVisitor, Visitor, walk
+from ..pyutils.lru_cache import LRUCache
 from ..type import GraphQLSchema
 from ..utils.type_info import TypeInfo
-from .rules import specified_rules
+from .rules import (
+    ArgumentsOfCorrectType,
+    DefaultValuesOfCorrectType,
+    FieldsOnCorrectType,
+    FragmentsOnCompositeTypes,
+    KnownArgumentNames,
+    KnownDirectives,
+    KnownFragmentNames,
+    KnownTypeNames,
+    LoneAnonymousOperation,
+    NoFragmentCycles,
+    NoUndefinedVariables,
+    NoUnusedFragments,
+    NoUnusedVariables,
+    OverlappingFieldsCanBeMerged,
+    PossibleFragmentSpreads,
+    ProvidedNonNullArguments,
+    ScalarLeafs,
+    UniqueArgumentNames,
+    UniqueFragmentNames,
+    UniqueInputFieldNames,
+    UniqueOperationNames,
+    UniqueVariableNames,
+    VariablesAreInputTypes,
+    VariablesInAllowedPosition,
+    specified_rules,
+)
 
 # Necessary for static type checking
 if False:  # flake8: noqa
-    from typing import List, Union, Optional, Dict, Set, Any, Type
-    from ..language.ast import Document, OperationDefinition, SelectionSet, Node
+    from typing import List, Union, Optional, Dict, Set, Any, Type, Tuple
+    from ..language.ast import OperationDefinition, SelectionSet, Node, Variable
     from ..type.schema import GraphQLSchema
-    from ..error import GraphQLError
     from .rules.base import ValidationRule
     from ..type.definition import (
         GraphQLList,
@@ -24,21 +58,288 @@ if False:  # flake8: noqa
     )
 
 
-def validate(schema, ast, rules=specified_rules):
-    # type: (GraphQLSchema, Document, List[Type[ValidationRule]]) -> List
+def validate(
+    schema,  # type: GraphQLSchema
+    ast,  # type: Document
+    rules=specified_rules,  # type: List[Type[ValidationRule]]
+    fragment_cache=None,  # type: Optional[FragmentValidationCache]
+    max_errors=None,  # type: Optional[int]
+):
+    # type: (...) -> List
+    """Validates the document against the schema. A FragmentValidationCache
+    shared between calls spares re-checking the fragments seen before.
+
+    When `max_errors` is given, validation is aborted once that many errors
+    are reported, and a last error telling so is added to them."""
     assert schema, "Must provide schema"
     assert ast, "Must provide document"
     assert isinstance(schema, GraphQLSchema)
     type_info = TypeInfo(schema)
-    return visit_using_rules(schema, type_info, ast, rules)
+    return visit_using_rules(schema, type_info, ast, rules, fragment_cache, max_errors)
+
+
+def visit_using_rules(
+    schema,  # type: GraphQLSchema
+    type_info,  # type: TypeInfo
+    ast,  # type: Document
+    rules,  # type: List[Type[ValidationRule]]
+    fragment_cache=None,  # type: Optional[FragmentValidationCache]
+    max_errors=None,  # type: Optional[int]
+):
+    # type: (...) -> List
+    context = ValidationContext(schema, ast, type_info, max_errors)
+    # The collector goes first so that the variable usages of a definition
+    # are known by the time the rules leave it.
+    visitors = [UsageCollector(context)]  # type: List[Any]
+    visitors.extend(rule(context) for rule in rules)
+
+    skipper = None
+    cached_rules = [rule for rule in rules if rule in CACHEABLE_RULES]
+    if fragment_cache is not None and cached_rules:
+        # Id of checked fragment -> errors within its selections.
+        checked_fragments = {}  # type: Dict[int, List[GraphQLError]]
+        for definition in ast.definitions:
+            if isinstance(definition, FragmentDefinition):
+                errors = fragment_cache.check(context, definition, cached_rules)
+                if errors is not None:
+                    checked_fragments[id(definition)] = errors
+
+        if checked_fragments:
+            # The skipper comes last so that the rules still see the
+            # fragment definitions themselves.
+            skipped = [i for i, rule in enumerate(rules, 1) if rule in CACHEABLE_RULES]
+            skipper = CheckedFragmentSkipper(context, skipped, checked_fragments)
+            visitors.append(skipper)
+
+    parallel_visitor = ParallelVisitor(visitors)
+    if skipper is not None:
+        skipper.parallel_visitor = parallel_visitor
+    visitor = parallel_visitor  # type: Visitor
+    if max_errors is not None:
+        visitor = ErrorLimitVisitor(context, parallel_visitor)
+    walk(ast, TypeInfoVisitor(type_info, visitor))
+    return context.get_errors()
 
 
-def visit_using_rules(schema, type_info, ast, rules):
-    # type: (GraphQLSchema, TypeInfo, Document, List[Type[ValidationRule]]) -> List
-    context = ValidationContext(schema, ast, type_info)
-    visitors = [rule(context) for rule in rules]
-    visit(ast, TypeInfoVisitor(type_info, ParallelVisitor(visitors)))
-    return context.get_errors()
+# The maximum number of fragments remembered by a FragmentValidationCache.
+FRAGMENT_CACHE_SIZE = 1000
+
+# The rules whose errors within the selections of a fragment only depend on
+# the fragment, the fragments it spreads and the schema, so that they can be
+# left out of the selections of fragments checked by a FragmentValidationCache.
+CACHEABLE_RULES = frozenset(
+    [
+        # Only check operations, or fragment definitions as a whole (which
+        # the rules still see) and nothing within their selections.
+        UniqueOperationNames,
+        LoneAnonymousOperation,
+        FragmentsOnCompositeTypes,
+        VariablesAreInputTypes,
+        UniqueFragmentNames,
+        NoUnusedFragments,
+        NoFragmentCycles,
+        DefaultValuesOfCorrectType,
+        UniqueVariableNames,
+        # Check the variables used within the selections against the
+        # operations when leaving those, from the usages the cache restores.
+        NoUndefinedVariables,
+        NoUnusedVariables,
+        VariablesInAllowedPosition,
+        # Check the selections against the schema only, with the parent types
+        # given by the type conditions within the fragment.
+        KnownTypeNames,
+        ScalarLeafs,
+        FieldsOnCorrectType,
+        KnownDirectives,
+        KnownArgumentNames,
+        UniqueArgumentNames,
+        ArgumentsOfCorrectType,
+        ProvidedNonNullArguments,
+        UniqueInputFieldNames,
+        # Also depend on the fragments spread, whose text is in the key.
+        KnownFragmentNames,
+        PossibleFragmentSpreads,
+        OverlappingFieldsCanBeMerged,
+    ]
+)
+
+
+class FragmentValidationCache(object):
+    """Remembers the fragments whose selections passed validation, so that
+    documents sharing fragments with previously validated ones only get the
+    rest of the document checked.
+
+    A fragment is identified by its source text (or printed AST when it has
+    no location) and the ones of the fragments it spreads, along with the
+    rules used. Its variable usages are remembered as well. At most
+    `max_size` fragments are remembered, the least recently used ones are
+    dropped first. Results are only kept for one schema at a time, the cache
+    starts over when used with another schema."""
+
+    __slots__ = ("_results", "_schema")
+
+    def __init__(self, max_size=FRAGMENT_CACHE_SIZE):
+        # type: (int) -> None
+        # Key -> input types of the variables used by a valid fragment, in
+        # traversal order, or None for an invalid one.
+        self._results = LRUCache(max_size)
+        self._schema = None  # type: Optional[GraphQLSchema]
+
+    def __len__(self):
+        # type: () -> int
+        """Returns the number of fragments remembered, valid or not."""
+        return len(self._results)
+
+    def check(self, context, fragment, rules):
+        # type: (ValidationContext, FragmentDefinition, List[Type[ValidationRule]]) -> Optional[List[GraphQLError]]
+        """Returns the errors within the selections of the fragment, which
+        are none for fragments known to be valid, giving the variable usages
+        of the fragment to the context. Fragments seen for the first time
+        are validated on their own. Fragments known to be invalid give None,
+        their errors are to be found by validating the document, as errors
+        refer to the nodes of a document."""
+        schema = context.get_schema()
+        if schema is not self._schema:
+            self._results.clear()
+            self._schema = schema
+
+        spread_fragments = context.get_recursively_referenced_fragments(fragment)
+        key = (
+            tuple(rules),
+            _get_definition_text(fragment),
+            tuple(sorted(_get_definition_text(spread) for spread in spread_fragments)),
+        )
+        usage_types = self._results.get(key, False)
+        if usage_types is None:
+            return None
+
+        if usage_types is False:
+            errors, usages = self._validate(schema, fragment, spread_fragments, rules)
+            self._results.set(key, None if errors else [usage.type for usage in usages])
+            context._variable_usages.setdefault(fragment, usages)
+            return errors
+
+        if fragment not in context._variable_usages:
+            variables = []  # type: List[Variable]
+            if usage_types:
+                walk(fragment, VariableCollector(variables))
+            context._variable_usages[fragment] = [
+                VariableUsage(node, type) for node, type in zip(variables, usage_types)
+            ]
+        return []
+
+    @staticmethod
+    def _validate(schema, fragment, spread_fragments, rules):
+        # type: (GraphQLSchema, FragmentDefinition, List[FragmentDefinition], List[Type[ValidationRule]]) -> Tuple[List[GraphQLError], List[VariableUsage]]
+        """Returns the errors within the selections of the fragment, and its
+        variable usages."""
+        type_info = TypeInfo(schema)
+        context = ValidationContext(
+            schema, Document([fragment] + spread_fragments), type_info
+        )
+        visitors = [UsageCollector(context)]  # type: List[Any]
+        visitors.extend(rule(context) for rule in rules)
+        visitor = SelectionErrorsVisitor(context, fragment, ParallelVisitor(visitors))
+        walk(fragment, TypeInfoVisitor(type_info, visitor))
+        return context.get_errors(), context.get_variable_usages(fragment)
+
+    def clear(self):
+        # type: () -> None
+        self._results.clear()
+
+
+def _get_definition_text(definition):
+    # type: (Node) -> str
+    loc = definition.loc
+    if loc and loc.source:
+        return loc.source.body[loc.start : loc.end]
+    return print_ast(definition)
+
+
+class SelectionErrorsVisitor(Visitor):
+    """Drops the errors reported on a definition itself, keeping the ones
+    within it, as the former are found when validating the document."""
+
+    __slots__ = "context", "definition", "visitor"
+
+    def __init__(self, context, definition, visitor):
+        # type: (ValidationContext, Node, Visitor) -> None
+        self.context = context
+        self.definition = definition
+        self.visitor = visitor
+
+    def enter(self, node, key, parent, path, ancestors):
+        if node is not self.definition:
+            return self.visitor.enter(node, key, parent, path, ancestors)
+        error_count = len(self.context._errors)
+        result = self.visitor.enter(node, key, parent, path, ancestors)
+        del self.context._errors[error_count:]
+        return result
+
+    def leave(self, node, key, parent, path, ancestors):
+        if node is not self.definition:
+            return self.visitor.leave(node, key, parent, path, ancestors)
+        error_count = len(self.context._errors)
+        result = self.visitor.leave(node, key, parent, path, ancestors)
+        del self.context._errors[error_count:]
+        return result
+
+
+class CheckedFragmentSkipper(Visitor):
+    """Makes the rules at the given indices skip the selections of the
+    fragments checked by a FragmentValidationCache, reporting the errors
+    found within those instead."""
+
+    __slots__ = "context", "parallel_visitor", "indices", "fragment_errors"
+
+    def __init__(self, context, indices, fragment_errors):
+        # type: (ValidationContext, List[int], Dict[int, List[GraphQLError]]) -> None
+        self.context = context
+        self.parallel_visitor = None  # type: Optional[ParallelVisitor]
+        self.indices = indices
+        self.fragment_errors = fragment_errors
+
+    def enter_FragmentDefinition(self, node, key, parent, path, ancestors):
+        errors = self.fragment_errors.get(id(node))
+        if errors is not None:
+            for index in self.indices:
+                self.parallel_visitor.skip(index, node)  # type: ignore
+            for error in errors:
+                self.context.report_error(error)
+
+
+class ErrorLimitVisitor(Visitor):
+    """Breaks the traversal once the context has aborted validation."""
+
+    __slots__ = "context", "visitor"
+
+    def __init__(self, context, visitor):
+        # type: (ValidationContext, Visitor) -> None
+        self.context = context
+        self.visitor = visitor
+
+    def enter(self, node, key, parent, path, ancestors):
+        result = self.visitor.enter(node, key, parent, path, ancestors)
+        if self.context.is_aborted():
+            return BREAK
+        return result
+
+    def leave(self, node, key, parent, path, ancestors):
+        result = self.visitor.leave(node, key, parent, path, ancestors)
+        if self.context.is_aborted():
+            return BREAK
+        return result
+
+
+class VariableCollector(Visitor):
+    __slots__ = ("variables",)
+
+    def __init__(self, variables):
+        # type: (List[Variable]) -> None
+        self.variables = variables
+
+    def enter_Variable(self, node, key, parent, path, ancestors):
+        self.variables.append(node)
 
 
 class VariableUsage(object):
@@ -65,6 +366,46 @@ class UsageVisitor(Visitor):
         self.usages.append(usage)
 
 
+class UsageCollector(Visitor):
+    """Collects the variable usages of every operation and fragment during
+    the main validation traversal, sparing the rules asking for them a
+    traversal of their own. Fragments used before being defined are still
+    traversed on demand by the context.
+
+    Only variable usages are collected this way. The fragment spreads and
+    the field maps are needed when a definition or selection set is
+    entered, before the traversal has seen what they contain, so the
+    context and OverlappingFieldsCanBeMerged still gather and cache them."""
+
+    __slots__ = "context", "usages"
+
+    def __init__(self, context):
+        # type: (ValidationContext) -> None
+        self.context = context
+        self.usages = []  # type: List[VariableUsage]
+
+    def enter_OperationDefinition(self, node, key, parent, path, ancestors):
+        self.usages = []
+
+    def leave_OperationDefinition(self, node, key, parent, path, ancestors):
+        self.context._variable_usages.setdefault(node, self.usages)
+
+    def enter_FragmentDefinition(self, node, key, parent, path, ancestors):
+        if node in self.context._variable_usages:
+            return False
+        self.usages = []
+
+    def leave_FragmentDefinition(self, node, key, parent, path, ancestors):
+        self.context._variable_usages.setdefault(node, self.usages)
+
+    def enter_VariableDefinition(self, node, key, parent, path, ancestors):
+        return False
+
+    def enter_Variable(self, node, key, parent, path, ancestors):
+        usage = VariableUsage(node, type=self.context.get_input_type())
+        self.usages.append(usage)
+
+
 class ValidationContext(object):
     __slots__ = (
         "_schema",
@@ -76,10 +417,13 @@ class ValidationContext(object):
         "_recursively_referenced_fragments",
         "_variable_usages",
         "_recursive_variable_usages",
+        "_selection_sizes",
+        "_fragment_components",
+        "_max_errors",
     )
 
-    def __init__(self, schema, ast, type_info):
-        # type: (GraphQLSchema, Document, TypeInfo) -> None
+    def __init__(self, schema, ast, type_info, max_errors=None):
+        # type: (GraphQLSchema, Document, TypeInfo, Optional[int]) -> None
         self._schema = schema
         self._ast = ast
         self._type_info = type_info
@@ -89,10 +433,28 @@ class ValidationContext(object):
         self._recursively_referenced_fragments = {}  # type: Dict[OperationDefinition, List[FragmentSpread]]
         self._variable_usages = {}  # type: Dict[Node, List[VariableUsage]]
         self._recursive_variable_usages = {}  # type: Dict[OperationDefinition, List[VariableUsage]]
+        self._selection_sizes = {}  # type: Dict[Node, Tuple[int, int]]
+        self._fragment_components = None  # type: Optional[Dict[FragmentDefinition, int]]
+        self._max_errors = max_errors
 
     def report_error(self, error):
+        max_errors = self._max_errors
+        if max_errors is not None and len(self._errors) >= max_errors:
+            if len(self._errors) == max_errors:
+                self._errors.append(
+                    GraphQLError(
+                        "Too many validation errors, error limit reached. "
+                        "Validation aborted."
+                    )
+                )
+            return
         self._errors.append(error)
 
+    def is_aborted(self):
+        # type: () -> bool
+        """Tells whether the error limit was exceeded."""
+        return self._max_errors is not None and len(self._errors) > self._max_errors
+
     def get_errors(self):
         # type: () -> List
         return self._errors
@@ -107,7 +469,7 @@ class ValidationContext(object):
         if usages is None:
             usages = []
             sub_visitor = UsageVisitor(usages, self._type_info)
-            visit(node, TypeInfoVisitor(self._type_info, sub_visitor))
+            walk(node, TypeInfoVisitor(self._type_info, sub_visitor))
             self._variable_usages[node] = usages
 
         return usages
@@ -126,8 +488,8 @@ class ValidationContext(object):
         return usages
 
     def get_recursively_referenced_fragments(self, operation):
-        # type: (OperationDefinition) -> List
-        assert isinstance(operation, OperationDefinition)
+        # type: (Union[OperationDefinition, FragmentDefinition]) -> List
+        assert isinstance(operation, (OperationDefinition, FragmentDefinition))
         fragments = self._recursively_referenced_fragments.get(operation)
         if not fragments:
             fragments = []
@@ -147,6 +509,124 @@ class ValidationContext(object):
             self._recursively_referenced_fragments[operation] = fragments
         return fragments
 
+    def get_selection_size(self, definition):
+        # type: (Union[OperationDefinition, FragmentDefinition]) -> Tuple[int, int]
+        """Returns the depth and number of fields of the selection set of the
+        operation or fragment, with the fragments it spreads inlined. Within a
+        fragment, the spreads of the fragments on a cycle through it, which
+        NoFragmentCycles reports, count as empty so that the size of every
+        fragment is the same wherever it is spread."""
+        assert isinstance(definition, (OperationDefinition, FragmentDefinition))
+        sizes = self._selection_sizes
+        size = sizes.get(definition)
+        if size is not None:
+            return size
+
+        components = self.get_fragment_components()
+        # Fragments are measured after the fragments they spread outside of
+        # their own cycle, which are never on a cycle through them.
+        stack = [(definition, False)]
+        while stack:
+            node, spreads_measured = stack.pop()
+            if node in sizes:
+                continue
+            component = components.get(node)
+            if spreads_measured:
+                sizes[node] = self._measure_selections(
+                    node.selection_set, components, component
+                )
+                continue
+            stack.append((node, True))
+            for fragment in self._get_spread_fragments(node):
+                if fragment not in sizes and components[fragment] != component:
+                    stack.append((fragment, False))
+
+        return sizes[definition]
+
+    def _measure_selections(self, selection_set, components, component):
+        # type: (SelectionSet, Dict[FragmentDefinition, int], Optional[int]) -> Tuple[int, int]
+        depth = count = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FragmentSpread):
+                fragment = self.get_fragment(selection.name.value)
+                if not fragment or components[fragment] == component:
+                    continue
+                child_depth, child_count = self._selection_sizes[fragment]
+            elif selection.selection_set:
+                child_depth, child_count = self._measure_selections(
+                    selection.selection_set, components, component
+                )
+            else:
+                child_depth = child_count = 0
+
+            if isinstance(selection, Field):
+                child_depth += 1
+                child_count += 1
+            depth = max(depth, child_depth)
+            count += child_count
+
+        return depth, count
+
+    def get_fragment_components(self):
+        # type: () -> Dict[FragmentDefinition, int]
+        """Numbers the strongly connected components of the graph of the
+        fragments spreading each other, once per document, with an iterative
+        Tarjan's algorithm. A fragment spread within a fragment of the same
+        component is part of a cycle through both."""
+        components = self._fragment_components
+        if components is not None:
+            return components
+
+        components = self._fragment_components = {}
+        index = {}  # type: Dict[FragmentDefinition, int]
+        lowlink = {}  # type: Dict[FragmentDefinition, int]
+        on_stack = []  # type: List[FragmentDefinition]
+        for root in self._get_fragments().values():
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            on_stack.append(root)
+            path = [(root, iter(self._get_spread_fragments(root)))]
+            while path:
+                node, spreads = path[-1]
+                for fragment in spreads:
+                    if fragment not in index:
+                        index[fragment] = lowlink[fragment] = len(index)
+                        on_stack.append(fragment)
+                        path.append(
+                            (fragment, iter(self._get_spread_fragments(fragment)))
+                        )
+                        break
+                    if fragment not in components:
+                        lowlink[node] = min(lowlink[node], index[fragment])
+                else:
+                    path.pop()
+                    if path:
+                        parent = path[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        while True:
+                            fragment = on_stack.pop()
+                            components[fragment] = index[node]
+                            if fragment is node:
+                                break
+
+        return components
+
+    def _get_spread_fragments(self, definition):
+        # type: (Union[OperationDefinition, FragmentDefinition]) -> List[FragmentDefinition]
+        """Returns the known fragments spread directly by the definition."""
+        fragments = []  # type: List[FragmentDefinition]
+        names = set()  # type: Set[str]
+        for spread in self.get_fragment_spreads(definition.selection_set):
+            name = spread.name.value
+            if name not in names:
+                names.add(name)
+                fragment = self.get_fragment(name)
+                if fragment:
+                    fragments.append(fragment)
+        return fragments
+
     def get_fragment_spreads(self, node):
         # type: (SelectionSet) -> List[FragmentSpread]
         spreads = self._fragment_spreads.get(node)
@@ -168,13 +648,17 @@ class ValidationContext(object):
         return self._ast
 
     def get_fragment(self, name):
+        return self._get_fragments().get(name)
+
+    def _get_fragments(self):
+        # type: () -> Dict[str, FragmentDefinition]
         fragments = self._fragments
         if fragments is None:
             self._fragments = fragments = {}
             for statement in self.get_ast().definitions:
                 if isinstance(statement, FragmentDefinition):
                     fragments[statement.name.value] = statement
-        return fragments.get(name)
+        return fragments
 
     def get_type(self):
         # type: () -> Optional[GraphQLType]